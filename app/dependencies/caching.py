@@ -0,0 +1,54 @@
+from typing import Any
+
+from fastapi import Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+
+from app.dependencies.user import identify_user
+from app.dependencies.versions import check_user_data_version
+from app.schemas.authentication import PrincipalData
+from app.utilities.caching import ResponseCache, trend_responses
+
+
+class CachedResponse:
+    def __init__(self, response_cache: ResponseCache, user_id: int, request_key: str, response: Response) -> None:
+        self.response_cache = response_cache
+        self.user_id = user_id
+        self.request_key = request_key
+        self.response = response
+
+    async def get(self) -> Response | None:
+        content: bytes | None = await self.response_cache.get(self.user_id, self.request_key)
+
+        if content is None:
+            return None
+
+        return Response(
+            content=content,
+            media_type=ORJSONResponse.media_type,
+            headers=dict(self.response.headers),
+        )
+
+    async def set(self, content: Any) -> Response:
+        response: ORJSONResponse = ORJSONResponse(
+            content=jsonable_encoder(content),
+            headers=dict(self.response.headers),
+        )
+
+        await self.response_cache.set(self.user_id, self.request_key, response.body)
+
+        return response
+
+
+async def define_trend_cached_response(
+    request: Request,
+    response: Response,
+    current_user: PrincipalData = Depends(identify_user),
+    etag: str = Depends(check_user_data_version),
+) -> CachedResponse:
+    return CachedResponse(
+        response_cache=trend_responses,
+        user_id=current_user.id,
+        request_key='{0}?{1}#{2}'.format(request.url.path, sorted(request.query_params.multi_items()), etag),
+        response=response,
+    )
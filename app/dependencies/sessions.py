@@ -1,10 +1,60 @@
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, Coroutine
 
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.databases.sessions import PostgresSession
+from app.schemas.authentication import PrincipalData
+from core.databases.repositories import UserRepository
+from core.databases.sessions import (
+    HAS_WRITES_KEY,
+    PostgresReplicaSession,
+    PostgresSession,
+)
+from core.settings import settings
 
 
-async def define_postgres_session() -> AsyncIterator[AsyncSession]:
+READ_SAFE_METHODS: tuple[str, ...] = ('GET', 'HEAD', 'OPTIONS')
+RECENT_WRITE_COOKIE: str = 'recent-write'
+
+
+async def define_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:
     async with PostgresSession() as postgres_session:
+        request.state.postgres_session = postgres_session
+
+        yield postgres_session
+
+async def define_postgres_read_session(
+    request: Request,
+    postgres_session: AsyncSession = Depends(define_postgres_session),
+) -> AsyncIterator[AsyncSession]:
+    if PostgresReplicaSession is None or RECENT_WRITE_COOKIE in request.cookies:
         yield postgres_session
+        return
+
+    async with PostgresReplicaSession() as postgres_replica_session:
+        yield postgres_replica_session
+
+
+class UnitOfWorkRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler: Callable[[Request], Coroutine[Any, Any, Response]] = super().get_route_handler()
+
+        async def handle_unit_of_work(request: Request) -> Response:  # noqa: WPS430
+            response: Response = await route_handler(request)
+            postgres_session: AsyncSession | None = getattr(request.state, 'postgres_session', None)
+
+            if postgres_session is not None and postgres_session.in_transaction():
+                current_user: PrincipalData | None = getattr(request.state, 'current_user', None)
+
+                if current_user is not None and postgres_session.info.pop(HAS_WRITES_KEY, False):
+                    await UserRepository(session=postgres_session).bump_data_version(current_user.id)
+
+                await postgres_session.commit()
+
+            if PostgresReplicaSession is not None and request.method not in READ_SAFE_METHODS:
+                response.set_cookie(RECENT_WRITE_COOKIE, '1', max_age=settings.POSTGRES_REPLICA_STICKINESS, httponly=True)
+
+            return response
+
+        return handle_unit_of_work
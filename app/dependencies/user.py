@@ -1,27 +1,57 @@
-from fastapi import Depends
+from time import time
+from typing import Any
+
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.sessions import define_postgres_session
+from app.schemas.authentication import PrincipalData
 from app.utilities.exceptions.auth import UserUnauthorised
-from app.utilities.security.jwt import decode_access_token
-from core.databases.models import User
-from core.databases.repositories import UserRepository
+from app.utilities.security.jwt import (
+    access_token_payloads,
+    decode_access_token,
+    get_access_token_digest,
+    revoked_session_keys,
+)
+from core.databases.models import RefreshToken
+from core.databases.repositories import RefreshTokenRepository
 
 
 async def identify_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
     session: AsyncSession = Depends(define_postgres_session),
-) -> User:
-    (user_id, error_message) = decode_access_token(credentials.credentials)
+) -> PrincipalData:
+    token_digest: bytes = get_access_token_digest(credentials.credentials)
+    token_payload: dict[str, Any] | None = await access_token_payloads.get(token_digest)
+
+    if token_payload is None:
+        error_message: str | None
+        (token_payload, error_message) = decode_access_token(credentials.credentials)
+
+        if token_payload is None:
+            raise UserUnauthorised(message=error_message)
+
+        refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+        is_session_active: bool = await refresh_token_repository.exists(
+            RefreshToken.session_key == token_payload['sid'],
+            RefreshToken.user_id == int(token_payload['sub']),
+            RefreshToken.revoked_at.is_(None),
+        )
+
+        if not is_session_active:
+            raise UserUnauthorised(message='The session is revoked')
 
-    if not user_id:
-        raise UserUnauthorised(message=error_message)
+        await access_token_payloads.set(token_digest, token_payload, time_to_live=token_payload['exp'] - time())
 
-    user_repository: UserRepository = UserRepository(session=session)
-    user: User | None = await user_repository.get_by_id(user_id)
+    if await revoked_session_keys.get(token_payload['sid']) is not None:
+        raise UserUnauthorised(message='The session is revoked')
 
-    if user is None:
-        raise UserUnauthorised(message='The user does not seem to exist')
+    request.state.current_user = PrincipalData(
+        id=token_payload['sub'],
+        family_id=token_payload.get('family_id'),
+        username=token_payload['username'],
+    )
 
-    return user
+    return request.state.current_user
@@ -0,0 +1,78 @@
+from datetime import datetime
+from hashlib import blake2b
+from typing import Sequence
+
+from fastapi import Depends, Header, Response
+from sqlalchemy import Row, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.sessions import define_postgres_read_session
+from app.dependencies.user import identify_user
+from app.schemas.authentication import PrincipalData
+from app.utilities.exceptions.versions import DataNotModified
+from core.databases.models import User
+from core.databases.repositories import UserRepository
+
+
+ETAG_DIGEST_SIZE: int = 16
+# Clients may keep the payloads but have to revalidate them with `If-None-Match` before every use
+CACHE_CONTROL: str = 'private, no-cache'
+
+
+async def check_user_data_version(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> str:
+    user_repository: UserRepository = UserRepository(session=session)
+    data_versions: Sequence[Row[tuple[int, int]]] = await user_repository.get_data_versions(
+        User.id == current_user.id,
+    )
+
+    return check_data_versions(response, if_none_match, data_versions)
+
+async def check_family_data_version(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> str:
+    user_repository: UserRepository = UserRepository(session=session)
+    data_versions: Sequence[Row[tuple[int, int]]] = await user_repository.get_data_versions(
+        or_(
+            User.id == current_user.id,
+            and_(
+                User.family_id.is_not(None),
+                User.family_id == current_user.family_id,
+            ),
+        ),
+    )
+
+    return check_data_versions(response, if_none_match, data_versions)
+
+def check_data_versions(response: Response, if_none_match: str | None, data_versions: Sequence[Row[tuple[int, int]]]) -> str:
+    # The date is a part of the tag as some of the payloads are relative to the current day
+    etag_source: str = repr((
+        datetime.today().date().isoformat(),
+        [tuple(data_version) for data_version in data_versions],
+    ))
+    etag: str = 'W/"{0}"'.format(blake2b(etag_source.encode(), digest_size=ETAG_DIGEST_SIZE).hexdigest())
+
+    version_headers: dict[str, str] = {
+        'ETag': etag,
+        'Cache-Control': CACHE_CONTROL,
+    }
+
+    if if_none_match is not None and is_etag_matched(etag, if_none_match):
+        raise DataNotModified(headers=version_headers)
+
+    response.headers.update(version_headers)
+
+    return etag
+
+def is_etag_matched(etag: str, if_none_match: str) -> bool:
+    return any(
+        requested_etag.strip().removeprefix('W/') in {'*', etag.removeprefix('W/')}
+        for requested_etag in if_none_match.split(',')
+    )
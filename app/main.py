@@ -1,5 +1,9 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.routers import (
     account_router,
@@ -7,15 +11,43 @@ from app.routers import (
     budget_router,
     category_router,
     family_router,
+    sync_router,
     transaction_router,
     trend_router,
     user_router,
 )
+from app.utilities.caching import cache_invalidations
 from app.utilities.security.cors import (
     ALLOWED_HEADERS,
     ALLOWED_METHODS,
     ALLOWED_ORIGINS,
 )
+from app.utilities.security.jwt import subscribe_to_session_revocations
+from core.databases.sessions import (
+    postgres_engine,
+    postgres_replica_engine,
+    warm_up_engine,
+)
+from core.settings import settings
+
+
+@asynccontextmanager
+async def manage_lifespan(_: FastAPI) -> AsyncIterator[None]:
+    await warm_up_engine(postgres_engine, connections_number=settings.POSTGRES_POOL_SIZE)
+
+    if postgres_replica_engine is not None:
+        await warm_up_engine(postgres_replica_engine, connections_number=settings.POSTGRES_POOL_SIZE)
+
+    await subscribe_to_session_revocations()
+
+    yield
+
+    await cache_invalidations.close()
+
+    await postgres_engine.dispose()
+
+    if postgres_replica_engine is not None:
+        await postgres_replica_engine.dispose()
 
 
 backend: FastAPI = FastAPI(
@@ -29,6 +61,8 @@ backend: FastAPI = FastAPI(
     swagger_ui_parameters={
         'filter': True,
     },
+    lifespan=manage_lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 backend.add_middleware(
@@ -47,3 +81,4 @@ backend.include_router(account_router)
 backend.include_router(category_router)
 backend.include_router(transaction_router)
 backend.include_router(budget_router)
+backend.include_router(sync_router)
@@ -1,71 +1,91 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import Any, Sequence
+
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+    define_postgres_session,
+)
 from app.dependencies.user import identify_user
+from app.dependencies.versions import check_user_data_version
 from app.schemas.account import (
     AccountBalanceData,
     AccountCreationData,
     AccountOutputData,
+    AccountsBatchData,
+    AccountsBatchOutputData,
     AccountUpdateData,
 )
-from app.utilities.callables import sum_transactions_of_given_type
+from app.schemas.authentication import PrincipalData
+from app.utilities.callables import get_validated_records_by_ids
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Account, User
-from core.databases.models.utilities.types import TransactionType
+from app.utilities.responses import RowsResponse, get_output_columns
+from core.databases.models import Account
 from core.databases.repositories import AccountRepository
 
 
-account_router: APIRouter = APIRouter(prefix='/account', tags=['account'])
+ACCOUNT_COLUMNS: tuple[ColumnElement[Any], ...] = get_output_columns(Account, AccountOutputData)
+
+
+account_router: APIRouter = APIRouter(prefix='/account', tags=['account'], route_class=UnitOfWorkRoute)
 
 
 @account_router.get('/balances', response_model=list[AccountBalanceData])
 async def get_balances(
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[AccountBalanceData]:
+    account_repository: AccountRepository = AccountRepository(session=session)
+
     return [
         AccountBalanceData(
-            account=account.name,
-            balance=sum_transactions_of_given_type(
-                transactions=account.transactions,
-                transaction_type=TransactionType.INCOME,
-                initial_amount=account.opening_balance,
-            ) - sum_transactions_of_given_type(
-                transactions=account.transactions,
-                transaction_type=TransactionType.OUTCOME,
-            ),
+            account=account_name,
+            balance=balance,
         )
-        for account in current_user.accounts
+        for (_, account_name, balance) in await account_repository.get_user_balances(current_user.id)
     ]
 
-@account_router.get('/list', response_model=list[AccountOutputData])
+@account_router.get('/list', response_model=list[AccountOutputData], dependencies=[Depends(check_user_data_version)])
 async def get_accounts(
-    current_user: User = Depends(identify_user),
-) -> list[Account]:
-    return current_user.accounts
+    response: Response,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> RowsResponse:
+    account_repository: AccountRepository = AccountRepository(session=session)
+
+    accounts: Sequence[RowMapping] = await account_repository.get_projected_list(
+        Account.user_id == current_user.id,
+        columns=ACCOUNT_COLUMNS,
+    )
+
+    return RowsResponse(accounts, headers=response.headers)
 
 @account_router.post('/create', response_model=AccountOutputData, status_code=status.HTTP_201_CREATED)
 async def create_account(
     account_data: AccountCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Account:
     account_repository: AccountRepository = AccountRepository(session=session)
 
     return await account_repository.create(
         record_data=account_data.dict(),
-        user=current_user,
+        user_id=current_user.id,
     )
 
 @account_router.patch('/update', response_model=AccountOutputData)
 async def update_account(
     account_data: AccountUpdateData,
     account_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Account:
     account_repository: AccountRepository = AccountRepository(session=session)
@@ -74,7 +94,7 @@ async def update_account(
     if account is None:
         raise CouldNotFindRecord(account_id, Account)
 
-    if account.user != current_user:
+    if account.user_id != current_user.id:
         raise CouldNotAccessRecord(account_id, Account)
 
     return await account_repository.update(
@@ -85,7 +105,7 @@ async def update_account(
 @account_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_account(
     account_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     account_repository: AccountRepository = AccountRepository(session=session)
@@ -94,7 +114,44 @@ async def delete_account(
     if account is None:
         raise CouldNotFindRecord(account_id, Account)
 
-    if account.user != current_user:
+    if account.user_id != current_user.id:
         raise CouldNotAccessRecord(account_id, Account)
 
     await account_repository.delete(account)
+
+@account_router.post('/batch', response_model=AccountsBatchOutputData)
+async def batch_accounts(
+    batch_data: AccountsBatchData,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+) -> AccountsBatchOutputData:
+    account_repository: AccountRepository = AccountRepository(session=session)
+    owned_accounts: dict[int, Account] = {
+        account.id: account
+        for account in await get_validated_records_by_ids(
+            account_repository,
+            [account_data.id for account_data in batch_data.update],
+            Account.user_id == current_user.id,
+        )
+    }
+    deleted_accounts: list[Account] = await get_validated_records_by_ids(
+        account_repository,
+        batch_data.delete,
+        Account.user_id == current_user.id,
+    )
+
+    created_accounts: list[Account] = await account_repository.create_many(
+        records_data=[account_data.dict() for account_data in batch_data.create],
+        user_id=current_user.id,
+    )
+    updated_accounts: list[Account] = await account_repository.update_many(
+        records=[owned_accounts[account_data.id] for account_data in batch_data.update],
+        records_data=[account_data.dict(exclude={'id'}) for account_data in batch_data.update],
+    )
+    await account_repository.delete_many(deleted_accounts)
+
+    return AccountsBatchOutputData(
+        created=created_accounts,
+        updated=updated_accounts,
+        deleted=batch_data.delete,
+    )
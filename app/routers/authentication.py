@@ -1,23 +1,31 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies.sessions import define_postgres_session
-from app.schemas.authentication import AuthenticationData
-from app.schemas.user import UserCreationData, UserOutputData
+from app.dependencies.sessions import UnitOfWorkRoute, define_postgres_session
+from app.schemas.authentication import AuthenticationData, RefreshTokenData
+from app.schemas.user import UserCreationData
+from app.utilities.callables import create_authentication_data
 from app.utilities.exceptions.auth import (
     UsernameAlreadyExists,
+    UserUnauthorised,
     WrongPassword,
     WrongUsername,
 )
-from app.utilities.security.jwt import create_access_token
-from core.databases.models import User
-from core.databases.repositories import UserRepository
+from app.utilities.security.jwt import revoke_session_keys
+from app.utilities.security.passwords import (
+    check_password_needs_rehash,
+    hash_password,
+    verify_password,
+)
+from app.utilities.security.refresh_tokens import hash_refresh_token
+from core.databases.models import RefreshToken, User
+from core.databases.repositories import RefreshTokenRepository, UserRepository
 
 
-authentication_router: APIRouter = APIRouter(tags=['authentication'])
+authentication_router: APIRouter = APIRouter(tags=['authentication'], route_class=UnitOfWorkRoute)
 
 
 @authentication_router.post('/sign-up', response_model=AuthenticationData, status_code=status.HTTP_201_CREATED)
@@ -33,14 +41,10 @@ async def sign_up(
 
     user = await user_repository.create(
         record_data=user_data.dict(),
-        password=PasswordHasher().hash(user_data.password),
+        password=await hash_password(user_data.password),
     )
-    access_token: str = create_access_token(user_id=user.id)
 
-    return AuthenticationData(
-        access_token=access_token,
-        user=UserOutputData.from_orm(user),
-    )
+    return await create_authentication_data(user=user, session=session)
 
 @authentication_router.get('/sign-in', response_model=AuthenticationData)
 async def sign_in(
@@ -53,14 +57,66 @@ async def sign_in(
     if user is None:
         raise WrongUsername(username=credentials.username)
 
-    try:
-        PasswordHasher().verify(hash=user.password, password=credentials.password)
-    except VerifyMismatchError:
+    if not await verify_password(user.password, credentials.password):
         raise WrongPassword(username=user.username)
 
-    access_token: str = create_access_token(user_id=user.id)
+    if check_password_needs_rehash(user.password):
+        user = await user_repository.update(
+            record=user,
+            record_data={
+                'password': await hash_password(credentials.password),
+            },
+        )
 
-    return AuthenticationData(
-        access_token=access_token,
-        user=UserOutputData.from_orm(user),
+    return await create_authentication_data(user=user, session=session)
+
+@authentication_router.post('/refresh', response_model=AuthenticationData)
+async def refresh(
+    refresh_token_data: RefreshTokenData,
+    session: AsyncSession = Depends(define_postgres_session),
+) -> AuthenticationData:
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    refresh_token: RefreshToken | None = await refresh_token_repository.get_by_token_hash_for_update(
+        hash_refresh_token(refresh_token_data.refresh_token),
     )
+
+    if refresh_token is None or refresh_token.expires_at <= datetime.utcnow():
+        raise UserUnauthorised(message='Refresh token is invalid')
+
+    if refresh_token.revoked_at is not None:
+        await refresh_token_repository.revoke_session(refresh_token.session_key)
+        await revoke_session_keys(session, [refresh_token.session_key])
+        await session.commit()  # The revocation of a possibly stolen session must survive the error response
+
+        raise UserUnauthorised(message='Refresh token was already used, the session is revoked')
+
+    user_repository: UserRepository = UserRepository(session=session)
+    user: User | None = await user_repository.get_by_id(refresh_token.user_id)
+
+    if user is None:
+        raise UserUnauthorised(message='The user does not seem to exist')
+
+    await refresh_token_repository.update(
+        record=refresh_token,
+        record_data={
+            'revoked_at': datetime.utcnow(),
+        },
+    )
+
+    return await create_authentication_data(user=user, session=session, session_key=refresh_token.session_key)
+
+@authentication_router.post('/sign-out', status_code=status.HTTP_204_NO_CONTENT)
+async def sign_out(
+    refresh_token_data: RefreshTokenData,
+    session: AsyncSession = Depends(define_postgres_session),
+) -> None:
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    refresh_token: RefreshToken | None = await refresh_token_repository.get_by_token_hash_for_update(
+        hash_refresh_token(refresh_token_data.refresh_token),
+    )
+
+    if refresh_token is None:
+        raise UserUnauthorised(message='Refresh token is invalid')
+
+    await refresh_token_repository.revoke_session(refresh_token.session_key)
+    await revoke_session_keys(session, [refresh_token.session_key])
@@ -1,69 +1,94 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
 from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql import ColumnElement
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+    define_postgres_session,
+)
 from app.dependencies.user import identify_user
+from app.dependencies.versions import check_family_data_version
+from app.schemas.authentication import PrincipalData
 from app.schemas.budget import (
     BudgetCreationData,
     BudgetOutputData,
     BudgetUpdateData,
 )
+from app.schemas.category import CategoryOutputData
 from app.utilities.callables import get_validated_user_categories_by_ids
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Budget, Category, User
+from app.utilities.responses import RowsResponse, get_output_columns
+from core.databases.models import Budget, Category
 from core.databases.models.utilities.types import BudgetType
 from core.databases.repositories import BudgetRepository
+from core.databases.repositories.utilities.base import LoadingPlan
+
 
+BUDGET_COLUMNS: tuple[ColumnElement[Any], ...] = get_output_columns(Budget, BudgetOutputData, excluded_field_names={'categories'})
+CATEGORY_COLUMNS: tuple[ColumnElement[Any], ...] = get_output_columns(Category, CategoryOutputData)
 
-budget_router: APIRouter = APIRouter(prefix='/budget', tags=['budget'])
+BUDGET_LOADING_PLAN: LoadingPlan = (
+    selectinload(Budget.categories),
+)
+BUDGET_WITH_OWNER_LOADING_PLAN: LoadingPlan = (
+    *BUDGET_LOADING_PLAN,
+    joinedload(Budget.user),
+)
 
 
-@budget_router.get('/list', response_model=list[BudgetOutputData])
+budget_router: APIRouter = APIRouter(prefix='/budget', tags=['budget'], route_class=UnitOfWorkRoute)
+
+
+@budget_router.get('/list', response_model=list[BudgetOutputData], dependencies=[Depends(check_family_data_version)])
 async def get_budgets(
+    response: Response,
     budget_type: BudgetType = Query(..., alias='type'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[Budget]:
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> RowsResponse:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-
-    if budget_type is BudgetType.PERSONAL:
-        return await budget_repository.get_list(
-            Budget.type == budget_type,
-            Budget.user == current_user,
-        )
+    ownership_condition: ColumnElement[bool] = Budget.user_id == current_user.id
 
     if budget_type is BudgetType.JOINT:
-        return await budget_repository.get_list(
-            Budget.type == budget_type,
-            or_(
-                Budget.user == current_user,
-                Budget.user.has(family=current_user.family),
-            ),
+        ownership_condition = or_(
+            ownership_condition,
+            Budget.user.has(family_id=current_user.family_id),
         )
 
+    budgets: list[dict[str, Any]] = await budget_repository.get_projected_list_with_categories(
+        Budget.type == budget_type,
+        ownership_condition,
+        columns=BUDGET_COLUMNS,
+        category_columns=CATEGORY_COLUMNS,
+    )
+
+    return RowsResponse(budgets, headers=response.headers)
+
 @budget_router.get('/item', response_model=BudgetOutputData)
 async def get_budget(
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Budget:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, loading_plan=BUDGET_WITH_OWNER_LOADING_PLAN)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.type is BudgetType.PERSONAL and budget.user != current_user:
+    if budget.type is BudgetType.PERSONAL and budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
-    if budget.type is BudgetType.JOINT and (current_user.family is None or budget.user.family_id != current_user.family.id):
+    if budget.type is BudgetType.JOINT and (current_user.family_id is None or budget.user.family_id != current_user.family_id):
         raise CouldNotAccessRecord(budget_id, Budget)
 
     return budget
@@ -71,12 +96,12 @@ async def get_budget(
 @budget_router.post('/create', response_model=BudgetOutputData, status_code=status.HTTP_201_CREATED)
 async def create_budget(
     budget_data: BudgetCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Budget:
     categories: list[Category] = await get_validated_user_categories_by_ids(
         category_ids=budget_data.category_ids,
-        user=current_user,
+        user_id=current_user.id,
         session=session,
     )
 
@@ -84,7 +109,7 @@ async def create_budget(
 
     return await budget_repository.create(
         record_data=budget_data.dict(),
-        user=current_user,
+        user_id=current_user.id,
         categories=categories,
     )
 
@@ -92,16 +117,16 @@ async def create_budget(
 async def update_budget(
     budget_data: BudgetUpdateData,
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Budget:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, loading_plan=BUDGET_LOADING_PLAN)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.user != current_user:
+    if budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
     relationship_attributes: dict[str, Any] = {}
@@ -109,7 +134,7 @@ async def update_budget(
     if budget_data.category_ids is not None:
         relationship_attributes['categories'] = get_validated_user_categories_by_ids(
             category_ids=budget_data.category_ids,
-            user=current_user,
+            user_id=current_user.id,
             session=session,
         )
 
@@ -122,16 +147,16 @@ async def update_budget(
 @budget_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_budget(
     budget_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     budget_repository: BudgetRepository = BudgetRepository(session=session)
-    budget: Budget | None = await budget_repository.get_by_id(budget_id)
+    budget: Budget | None = await budget_repository.get_by_id(budget_id, loading_plan=BUDGET_LOADING_PLAN)
 
     if budget is None:
         raise CouldNotFindRecord(budget_id, Budget)
 
-    if budget.user != current_user:
+    if budget.user_id != current_user.id:
         raise CouldNotAccessRecord(budget_id, Budget)
 
     await budget_repository.delete(budget)
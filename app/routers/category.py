@@ -1,36 +1,62 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import Any, Sequence
+
+from fastapi import APIRouter, Depends, Query, Response, status
 from pydantic import PositiveInt
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+    define_postgres_session,
+)
 from app.dependencies.user import identify_user
+from app.dependencies.versions import check_user_data_version
+from app.schemas.authentication import PrincipalData
 from app.schemas.category import (
+    CategoriesBatchData,
+    CategoriesBatchOutputData,
     CategoryCreationData,
     CategoryOutputData,
     CategoryUpdateData,
 )
+from app.utilities.callables import get_validated_records_by_ids
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Category, User
+from app.utilities.responses import RowsResponse, get_output_columns
+from core.databases.models import Category
 from core.databases.repositories import CategoryRepository
 
 
-category_router: APIRouter = APIRouter(prefix='/category', tags=['category'])
+CATEGORY_COLUMNS: tuple[ColumnElement[Any], ...] = get_output_columns(Category, CategoryOutputData)
+
 
+category_router: APIRouter = APIRouter(prefix='/category', tags=['category'], route_class=UnitOfWorkRoute)
 
-@category_router.get('/list', response_model=list[CategoryOutputData])
+
+@category_router.get('/list', response_model=list[CategoryOutputData], dependencies=[Depends(check_user_data_version)])
 async def get_categories(
-    current_user: User = Depends(identify_user),
-) -> list[Category]:
-    return current_user.categories
+    response: Response,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> RowsResponse:
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+
+    categories: Sequence[RowMapping] = await category_repository.get_projected_list(
+        Category.user_id == current_user.id,
+        columns=CATEGORY_COLUMNS,
+    )
+
+    return RowsResponse(categories, headers=response.headers)
 
 @category_router.get('/item', response_model=CategoryOutputData)
 async def get_category(
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
     category: Category | None = await category_repository.get_by_id(category_id)
@@ -38,7 +64,7 @@ async def get_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     return category
@@ -46,21 +72,21 @@ async def get_category(
 @category_router.post('/create', response_model=CategoryOutputData, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category_data: CategoryCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
 
     return await category_repository.create(
         record_data=category_data.dict(),
-        user=current_user,
+        user_id=current_user.id,
     )
 
 @category_router.patch('/update', response_model=CategoryOutputData)
 async def update_category(
     category_data: CategoryUpdateData,
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Category:
     category_repository: CategoryRepository = CategoryRepository(session=session)
@@ -69,7 +95,7 @@ async def update_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     return await category_repository.update(
@@ -80,7 +106,7 @@ async def update_category(
 @category_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     category_repository: CategoryRepository = CategoryRepository(session=session)
@@ -89,7 +115,51 @@ async def delete_category(
     if category is None:
         raise CouldNotFindRecord(category_id, Category)
 
-    if category.user != current_user:
+    if category.user_id != current_user.id:
         raise CouldNotAccessRecord(category_id, Category)
 
     await category_repository.delete(category)
+
+@category_router.post('/batch', response_model=CategoriesBatchOutputData)
+async def batch_categories(
+    batch_data: CategoriesBatchData,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+) -> CategoriesBatchOutputData:
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+
+    await get_validated_records_by_ids(
+        category_repository,
+        [category_data.base_category_id for category_data in (*batch_data.create, *batch_data.update)],
+        Category.user_id == current_user.id,
+    )
+
+    owned_categories: dict[int, Category] = {
+        category.id: category
+        for category in await get_validated_records_by_ids(
+            category_repository,
+            [category_data.id for category_data in batch_data.update],
+            Category.user_id == current_user.id,
+        )
+    }
+    deleted_categories: list[Category] = await get_validated_records_by_ids(
+        category_repository,
+        batch_data.delete,
+        Category.user_id == current_user.id,
+    )
+
+    created_categories: list[Category] = await category_repository.create_many(
+        records_data=[category_data.dict() for category_data in batch_data.create],
+        user_id=current_user.id,
+    )
+    updated_categories: list[Category] = await category_repository.update_many(
+        records=[owned_categories[category_data.id] for category_data in batch_data.update],
+        records_data=[category_data.dict(exclude={'id'}) for category_data in batch_data.update],
+    )
+    await category_repository.delete_many(deleted_categories)
+
+    return CategoriesBatchOutputData(
+        created=created_categories,
+        updated=updated_categories,
+        deleted=batch_data.delete,
+    )
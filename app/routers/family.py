@@ -1,27 +1,40 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+)
 from app.dependencies.user import identify_user
+from app.schemas.authentication import PrincipalData
 from app.schemas.family import FamilyOutputData
 from app.utilities.exceptions.users import NotFamilyMember
-from core.databases.models import Family, User
+from core.databases.models import Family
+from core.databases.repositories import FamilyRepository
+from core.databases.repositories.utilities.base import LoadingPlan
 
 
-family_router: APIRouter = APIRouter(prefix='/family', tags=['family'])
+FAMILY_LOADING_PLAN: LoadingPlan = (
+    selectinload(Family.members),
+)
+
+
+family_router: APIRouter = APIRouter(prefix='/family', tags=['family'], route_class=UnitOfWorkRoute)
 
 
 @family_router.get('/current', response_model=FamilyOutputData)
 async def get_family(
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Family:
-    if current_user.family is None:
+    if current_user.family_id is None:
         raise NotFamilyMember()
 
-    await session.refresh(
-        instance=current_user.family,
-        attribute_names=['members'],
-    )
+    family_repository: FamilyRepository = FamilyRepository(session=session)
+    family: Family | None = await family_repository.get_by_id(current_user.family_id, loading_plan=FAMILY_LOADING_PLAN)
+
+    if family is None:
+        raise NotFamilyMember()
 
-    return current_user.family
+    return family
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+)
+from app.dependencies.user import identify_user
+from app.schemas.authentication import PrincipalData
+from app.schemas.sync import SyncCursorData, SyncData
+from app.utilities.pagination import decode_cursor, encode_cursor
+from core.databases.models import Budget, Tombstone
+from core.databases.repositories import (
+    AccountRepository,
+    BudgetRepository,
+    CategoryRepository,
+    TombstoneRepository,
+    TransactionRepository,
+)
+from core.databases.repositories.utilities.base import LoadingPlan
+from core.databases.repositories.utilities.syncable import get_versions_horizon
+
+
+BUDGET_LOADING_PLAN: LoadingPlan = (
+    selectinload(Budget.categories),
+)
+
+
+sync_router: APIRouter = APIRouter(prefix='/sync', tags=['sync'], route_class=UnitOfWorkRoute)
+
+
+@sync_router.get('', response_model=SyncData)
+async def sync(
+    cursor: str | None = Query(None, alias='since'),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> SyncData:
+    since: int = decode_cursor(cursor, SyncCursorData).version if cursor is not None else 0
+
+    # Taken before reading the changes, so the changes committed meanwhile are returned again next time instead of missed
+    versions_horizon: int = await get_versions_horizon(session)
+
+    account_repository: AccountRepository = AccountRepository(session=session)
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+    budget_repository: BudgetRepository = BudgetRepository(session=session)
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    tombstone_repository: TombstoneRepository = TombstoneRepository(session=session)
+
+    return SyncData(
+        accounts=await account_repository.get_changes(current_user.id, since),
+        categories=await category_repository.get_changes(current_user.id, since),
+        budgets=await budget_repository.get_changes(current_user.id, since, loading_plan=BUDGET_LOADING_PLAN),
+        transactions=await transaction_repository.get_changes(current_user.id, since),
+        tombstones=await tombstone_repository.get_list(
+            Tombstone.user_id == current_user.id,
+            Tombstone.version >= since,
+        ) if cursor is not None else [],
+        next_cursor=encode_cursor(SyncCursorData(version=versions_horizon)),
+    )
@@ -1,64 +1,176 @@
-from fastapi import APIRouter, Depends, Query, status
-from pydantic import PositiveInt
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import PositiveInt, ValidationError
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func
+from sqlalchemy.orm import joinedload
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+    define_postgres_session,
+)
 from app.dependencies.user import identify_user
+from app.dependencies.versions import check_user_data_version
+from app.schemas.authentication import PrincipalData
 from app.schemas.transaction import (
     TransactionCreationData,
+    TransactionImportErrorData,
     TransactionOutputData,
+    TransactionsBatchData,
+    TransactionsBatchOutputData,
+    TransactionsCursorData,
+    TransactionsFilterData,
+    TransactionsImportData,
+    TransactionsPageData,
     TransactionsPeriodData,
     TransactionUpdateData,
 )
+from app.schemas.utilities.types import ExportFormat
+from app.utilities.callables import get_validated_records_by_ids
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
     CouldNotFindRecord,
 )
-from core.databases.models import Account, Category, Transaction, User
-from core.databases.repositories import TransactionRepository
+from app.utilities.exports import format_csv, format_ndjson
+from app.utilities.imports import (
+    get_imported_row_error,
+    parse_imported_rows,
+    read_imported_content,
+)
+from app.utilities.pagination import decode_cursor, encode_cursor
+from app.utilities.responses import RowsResponse
+from core.databases.models import Account, Category, Transaction
+from core.databases.repositories import (
+    AccountRepository,
+    CategoryRepository,
+    TransactionRepository,
+)
+from core.databases.repositories.transaction import (
+    OUTPUT_COLUMN_NAMES,
+    is_owned_by_user,
+)
+from core.databases.repositories.utilities.base import (
+    KeysetCursor,
+    LoadingPlan,
+)
 
 
-transaction_router: APIRouter = APIRouter(prefix='/transaction', tags=['transaction'])
+TRANSACTION_WITH_ACCOUNT_LOADING_PLAN: LoadingPlan = (
+    joinedload(Transaction.account),
+)
+
+DEFAULT_PAGE_SIZE: int = 50
+MAX_PAGE_SIZE: int = 200
 
+EXPORT_PARTITION_SIZE: int = 1000
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: 'application/x-ndjson',
+    ExportFormat.CSV: 'text/csv',
+}
 
-@transaction_router.get('/periods', response_model=list[TransactionsPeriodData])
+
+transaction_router: APIRouter = APIRouter(prefix='/transaction', tags=['transaction'], route_class=UnitOfWorkRoute)
+
+
+@transaction_router.get('/periods', response_model=list[TransactionsPeriodData], dependencies=[Depends(check_user_data_version)])
 async def get_periods(
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> list[TransactionsPeriodData]:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    periods_entities: list[tuple[int, int]] = await transaction_repository.get_user_transaction_periods(current_user)
+    periods_entities: list[tuple[int, int]] = await transaction_repository.get_user_transaction_periods(current_user.id)
 
     return [TransactionsPeriodData(year=year, month=month) for (year, month) in periods_entities]
 
 @transaction_router.get('/list', response_model=list[TransactionOutputData])
 async def get_transactions(
     transactions_period: TransactionsPeriodData = Depends(),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[Transaction]:
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> RowsResponse:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
 
-    return await transaction_repository.get_list(
-        Transaction.account.has(user=current_user),
-        func.DATE_PART('YEAR', Transaction.due_date) == transactions_period.year,
-        func.DATE_PART('MONTH', Transaction.due_date) == transactions_period.month,
+    return RowsResponse(await transaction_repository.get_user_transactions_by_month(
+        user_id=current_user.id,
+        year=transactions_period.year,
+        month=transactions_period.month,
+    ))
+
+@transaction_router.get('/page', response_model=TransactionsPageData)
+async def get_transactions_page(
+    transactions_filter: TransactionsFilterData = Depends(),
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> TransactionsPageData:
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    after: KeysetCursor | None = None
+
+    if cursor is not None:
+        cursor_data: TransactionsCursorData = decode_cursor(cursor, TransactionsCursorData)
+        after = (cursor_data.due_date, cursor_data.due_time, cursor_data.id)
+
+    transactions: list[Transaction]
+    next_after: KeysetCursor | None
+    (transactions, next_after) = await transaction_repository.get_user_transactions_page(
+        user_id=current_user.id,
+        limit=limit,
+        after=after,
+        account_id=transactions_filter.account_id,
+        category_id=transactions_filter.category_id,
+        transaction_type=transactions_filter.type,
+        min_amount=transactions_filter.min_amount,
+        max_amount=transactions_filter.max_amount,
+        first_date=transactions_filter.first_date,
+        last_date=transactions_filter.last_date,
+    )
+
+    return TransactionsPageData(
+        transactions=[TransactionOutputData.from_orm(transaction) for transaction in transactions],
+        next_cursor=encode_cursor(TransactionsCursorData(
+            due_date=next_after[0],
+            due_time=next_after[1],
+            id=next_after[2],
+        )) if next_after is not None else None,
+    )
+
+@transaction_router.get('/export', response_class=StreamingResponse)
+async def export_transactions(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias='format'),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+) -> StreamingResponse:
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    partitions: AsyncIterator[Sequence[RowMapping]] = transaction_repository.stream_user_transactions(
+        user_id=current_user.id,
+        partition_size=EXPORT_PARTITION_SIZE,
+    )
+
+    return StreamingResponse(
+        content=format_csv(partitions, OUTPUT_COLUMN_NAMES) if export_format == ExportFormat.CSV else format_ndjson(partitions),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': 'attachment; filename="transactions.{0}"'.format(export_format),
+        },
     )
 
 @transaction_router.get('/item', response_model=TransactionOutputData)
 async def get_transaction(
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> Transaction:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, loading_plan=TRANSACTION_WITH_ACCOUNT_LOADING_PLAN)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     return transaction
@@ -66,13 +178,25 @@ async def get_transaction(
 @transaction_router.post('/create', response_model=TransactionOutputData, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_data: TransactionCreationData,
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Transaction:
-    if not any(transaction_data.account_id == account.id for account in current_user.accounts):
+    account_repository: AccountRepository = AccountRepository(session=session)
+    account: Account | None = await account_repository.get(
+        Account.id == transaction_data.account_id,
+        Account.user_id == current_user.id,
+    )
+
+    if account is None:
         raise CouldNotFindRecord(transaction_data.account_id, Account)
 
-    if not any(transaction_data.category_id == category.id for category in current_user.categories):
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+    category: Category | None = await category_repository.get(
+        Category.id == transaction_data.category_id,
+        Category.user_id == current_user.id,
+    )
+
+    if category is None:
         raise CouldNotFindRecord(transaction_data.category_id, Category)
 
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
@@ -81,20 +205,86 @@ async def create_transaction(
         record_data=transaction_data.dict(),
     )
 
+@transaction_router.post('/import', response_model=TransactionsImportData)
+async def import_transactions(
+    request: Request,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+) -> TransactionsImportData:
+    rows: list[Any] = parse_imported_rows(await read_imported_content(request), request.headers.get('Content-Type', ''))
+    import_errors: list[TransactionImportErrorData] = []
+    validated_rows: list[tuple[int, TransactionCreationData]] = []
+
+    for row_number, row in enumerate(rows, start=1):
+        row_error: str | None = get_imported_row_error(row)
+
+        if row_error is not None:
+            import_errors.append(TransactionImportErrorData(row=row_number, errors=[row_error]))
+
+            continue
+
+        try:
+            validated_rows.append((row_number, TransactionCreationData.parse_obj(row)))
+        except ValidationError as validation_error:
+            import_errors.append(TransactionImportErrorData(
+                row=row_number,
+                errors=[
+                    '{0}: {1}'.format('.'.join(str(location) for location in error['loc']), error['msg'])
+                    for error in validation_error.errors()
+                ],
+            ))
+
+    account_repository: AccountRepository = AccountRepository(session=session)
+    accounts: list[Account] = await account_repository.get_list(
+        Account.id.in_({transaction_data.account_id for (_, transaction_data) in validated_rows}),
+        Account.user_id == current_user.id,
+    )
+
+    category_repository: CategoryRepository = CategoryRepository(session=session)
+    categories: list[Category] = await category_repository.get_list(
+        Category.id.in_({transaction_data.category_id for (_, transaction_data) in validated_rows}),
+        Category.user_id == current_user.id,
+    )
+
+    owned_record_ids: dict[str, set[int]] = {
+        'account_id': {account.id for account in accounts},
+        'category_id': {category.id for category in categories},
+    }
+    imported_transactions_data: list[dict[str, Any]] = []
+
+    for row_number, transaction_data in validated_rows:
+        ownership_errors: list[str] = [
+            '{0}: could not access the record with given ID of {1}'.format(field_key, getattr(transaction_data, field_key))
+            for field_key, record_ids in owned_record_ids.items()
+            if getattr(transaction_data, field_key) not in record_ids
+        ]
+
+        if ownership_errors:
+            import_errors.append(TransactionImportErrorData(row=row_number, errors=ownership_errors))
+        else:
+            imported_transactions_data.append(transaction_data.dict())
+
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+
+    return TransactionsImportData(
+        imported_count=len(await transaction_repository.insert_many(imported_transactions_data)),
+        errors=sorted(import_errors, key=lambda import_error: import_error.row),
+    )
+
 @transaction_router.patch('/update', response_model=TransactionOutputData)
 async def update_transaction(
     transaction_data: TransactionUpdateData,
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> Transaction:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, loading_plan=TRANSACTION_WITH_ACCOUNT_LOADING_PLAN)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     return await transaction_repository.update(
@@ -105,16 +295,63 @@ async def update_transaction(
 @transaction_router.delete('/delete', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     transaction_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
+    current_user: PrincipalData = Depends(identify_user),
     session: AsyncSession = Depends(define_postgres_session),
 ) -> None:
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
-    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id)
+    transaction: Transaction | None = await transaction_repository.get_by_id(transaction_id, loading_plan=TRANSACTION_WITH_ACCOUNT_LOADING_PLAN)
 
     if transaction is None:
         raise CouldNotFindRecord(transaction_id, Transaction)
 
-    if transaction.account.user != current_user:
+    if transaction.account.user_id != current_user.id:
         raise CouldNotAccessRecord(transaction_id, Transaction)
 
     await transaction_repository.delete(transaction)
+
+@transaction_router.post('/batch', response_model=TransactionsBatchOutputData)
+async def batch_transactions(
+    batch_data: TransactionsBatchData,
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_session),
+) -> TransactionsBatchOutputData:
+    await get_validated_records_by_ids(
+        AccountRepository(session=session),
+        [transaction_data.account_id for transaction_data in (*batch_data.create, *batch_data.update)],
+        Account.user_id == current_user.id,
+    )
+    await get_validated_records_by_ids(
+        CategoryRepository(session=session),
+        [transaction_data.category_id for transaction_data in (*batch_data.create, *batch_data.update)],
+        Category.user_id == current_user.id,
+    )
+
+    transaction_repository: TransactionRepository = TransactionRepository(session=session)
+    owned_transactions: dict[int, Transaction] = {
+        transaction.id: transaction
+        for transaction in await get_validated_records_by_ids(
+            transaction_repository,
+            [transaction_data.id for transaction_data in batch_data.update],
+            is_owned_by_user(current_user.id),
+        )
+    }
+    deleted_transactions: list[Transaction] = await get_validated_records_by_ids(
+        transaction_repository,
+        batch_data.delete,
+        is_owned_by_user(current_user.id),
+    )
+
+    created_transactions: list[Transaction] = await transaction_repository.create_many(
+        records_data=[transaction_data.dict() for transaction_data in batch_data.create],
+    )
+    updated_transactions: list[Transaction] = await transaction_repository.update_many(
+        records=[owned_transactions[transaction_data.id] for transaction_data in batch_data.update],
+        records_data=[transaction_data.dict(exclude={'id'}) for transaction_data in batch_data.update],
+    )
+    await transaction_repository.delete_many(deleted_transactions)
+
+    return TransactionsBatchOutputData(
+        created=created_transactions,
+        updated=updated_transactions,
+        deleted=batch_data.delete,
+    )
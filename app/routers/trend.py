@@ -1,20 +1,25 @@
 from datetime import date, datetime, timedelta
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.caching import (
+    CachedResponse,
+    define_trend_cached_response,
+)
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+)
 from app.dependencies.user import identify_user
+from app.dependencies.versions import check_user_data_version
 from app.schemas.account import (
     DailyHighlightData,
     PeriodSummaryData,
     TrendPointData,
 )
-from core.databases.models import User
-from core.databases.models.utilities.types import (
-    SummaryPeriodType,
-    TransactionType,
-)
+from app.schemas.authentication import PrincipalData
+from core.databases.models.utilities.types import TransactionType
 from core.databases.repositories import TransactionRepository
 
 
@@ -22,67 +27,82 @@ MIN_HIGHLIGHT_DAYS: int = 4
 MAX_HIGHLIGHT_DAYS: int = 14
 
 
-trend_router: APIRouter = APIRouter(prefix='/trend', tags=['trend'])
+trend_router: APIRouter = APIRouter(
+    prefix='/trend',
+    tags=['trend'],
+    route_class=UnitOfWorkRoute,
+    dependencies=[Depends(check_user_data_version)],
+)
 
 
 @trend_router.get('/summary', response_model=list[PeriodSummaryData])
 async def get_summary(
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[PeriodSummaryData]:
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+    cached_response: CachedResponse = Depends(define_trend_cached_response),
+) -> Response:
+    response: Response | None = await cached_response.get()
+
+    if response is not None:
+        return response
+
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
 
-    return [
+    return await cached_response.set([
         PeriodSummaryData(
             period=summary_period_type,
-            incomes=await transaction_repository.get_user_transactions_sum_for_summary_period(
-                user=current_user,
-                transactions_type=TransactionType.INCOME,
-                summary_period_type=summary_period_type,
-            ),
-            outcomes=await transaction_repository.get_user_transactions_sum_for_summary_period(
-                user=current_user,
-                transactions_type=TransactionType.OUTCOME,
-                summary_period_type=summary_period_type,
-            ),
-        ) for summary_period_type in SummaryPeriodType
-    ]
+            incomes=incomes,
+            outcomes=outcomes,
+        ) for (summary_period_type, incomes, outcomes) in await transaction_repository.get_user_summary(current_user.id)
+    ])
 
 @trend_router.get('/last-n-days', response_model=list[DailyHighlightData])
 async def get_last_n_days_highlight(
     n_days: int = Query(7, ge=MIN_HIGHLIGHT_DAYS, le=MAX_HIGHLIGHT_DAYS),
     transaction_type: TransactionType = TransactionType.OUTCOME,
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[DailyHighlightData]:
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+    cached_response: CachedResponse = Depends(define_trend_cached_response),
+) -> Response:
+    response: Response | None = await cached_response.get()
+
+    if response is not None:
+        return response
+
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
 
     today_date: date = datetime.today().date()
     first_date: date = today_date - timedelta(days=n_days - 1)
 
-    return [
+    return await cached_response.set([
         DailyHighlightData(
             date=transaction_date,
             amount=transaction_sum,
         ) for (transaction_date, transaction_sum) in await transaction_repository.get_user_transaction_sums_by_dates(
-            user=current_user,
+            user_id=current_user.id,
             transaction_type=transaction_type,
             first_date=first_date,
             last_date=today_date,
         )
-    ]
+    ])
 
 @trend_router.get('/current-month', response_model=list[TrendPointData])
 async def get_current_month(  # noqa: WPS210
     transaction_type: TransactionType = TransactionType.OUTCOME,
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
-) -> list[TrendPointData]:
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
+    cached_response: CachedResponse = Depends(define_trend_cached_response),
+) -> Response:
+    response: Response | None = await cached_response.get()
+
+    if response is not None:
+        return response
+
     transaction_repository: TransactionRepository = TransactionRepository(session=session)
 
     trend: list[TrendPointData] = []
     statistics: list[tuple[date, float, float]] = await transaction_repository.get_current_month_user_transaction_statistics(
-        user=current_user,
+        user_id=current_user.id,
         transaction_type=transaction_type,
     )
 
@@ -106,4 +126,4 @@ async def get_current_month(  # noqa: WPS210
 
         previous_trend_point = current_trend_point
 
-    return trend
+    return await cached_response.set(trend)
@@ -2,8 +2,12 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import PositiveInt
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies.sessions import define_postgres_session
+from app.dependencies.sessions import (
+    UnitOfWorkRoute,
+    define_postgres_read_session,
+)
 from app.dependencies.user import identify_user
+from app.schemas.authentication import PrincipalData
 from app.schemas.user import UserOutputData
 from app.utilities.exceptions.records import (
     CouldNotAccessRecord,
@@ -14,20 +18,20 @@ from core.databases.models import User
 from core.databases.repositories import UserRepository
 
 
-user_router: APIRouter = APIRouter(prefix='/user', tags=['user'])
+user_router: APIRouter = APIRouter(prefix='/user', tags=['user'], route_class=UnitOfWorkRoute)
 
 
 @user_router.get('/current', response_model=UserOutputData)
 async def get_current_user(
-    current_user: User = Depends(identify_user),
-) -> User:
+    current_user: PrincipalData = Depends(identify_user),
+) -> PrincipalData:
     return current_user
 
 @user_router.get('/relative', response_model=UserOutputData)
 async def get_relative(
     relative_id: PositiveInt = Query(..., alias='id'),
-    current_user: User = Depends(identify_user),
-    session: AsyncSession = Depends(define_postgres_session),
+    current_user: PrincipalData = Depends(identify_user),
+    session: AsyncSession = Depends(define_postgres_read_session),
 ) -> User:
     if relative_id == current_user.id:
         raise SelfIsNotRelative()
@@ -38,7 +42,7 @@ async def get_relative(
     if user is None:
         raise CouldNotFindRecord(relative_id, User)
 
-    if user.family != current_user.family:
+    if user.family_id != current_user.family_id:
         raise CouldNotAccessRecord(relative_id, User)
 
     return user
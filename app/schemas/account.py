@@ -6,7 +6,12 @@ from pydantic import Field, NonNegativeFloat, PositiveInt, validator
 from core.databases.models.account import CurrencyType
 from core.databases.models.utilities.types import SummaryPeriodType
 
-from .utilities.base import BaseData, BaseUpdateData
+from .utilities.base import (
+    BaseBatchData,
+    BaseBatchOutputData,
+    BaseData,
+    BaseUpdateData,
+)
 
 
 class AccountOutputData(BaseData, orm_mode=True):
@@ -25,6 +30,17 @@ class AccountUpdateData(BaseUpdateData, anystr_strip_whitespace=True):
     currency: CurrencyType | None
     opening_balance: int | None
 
+class AccountBatchUpdateData(AccountUpdateData):
+    id: PositiveInt
+
+class AccountsBatchData(BaseBatchData):
+    create: list[AccountCreationData] = []
+    update: list[AccountBatchUpdateData] = []
+
+class AccountsBatchOutputData(BaseBatchOutputData):
+    created: list[AccountOutputData]
+    updated: list[AccountOutputData]
+
 
 class AccountBalanceData(BaseData):
     account: str
@@ -1,7 +1,18 @@
+from pydantic import PositiveInt
+
 from .user import UserOutputData
 from .utilities.base import BaseData
 
 
 class AuthenticationData(BaseData):
     access_token: str
+    refresh_token: str
     user: UserOutputData
+
+class RefreshTokenData(BaseData):
+    refresh_token: str
+
+class PrincipalData(BaseData):
+    id: PositiveInt
+    family_id: PositiveInt | None
+    username: str
@@ -2,7 +2,12 @@ from pydantic import Field, PositiveInt
 
 from core.databases.models.category import CategoryType
 
-from .utilities.base import BaseData, BaseUpdateData
+from .utilities.base import (
+    BaseBatchData,
+    BaseBatchOutputData,
+    BaseData,
+    BaseUpdateData,
+)
 
 
 class CategoryOutputData(BaseData, orm_mode=True):
@@ -20,3 +25,14 @@ class CategoryUpdateData(BaseUpdateData, anystr_strip_whitespace=True):
     base_category_id: PositiveInt | None
     name: str | None = Field(None, min_length=1)
     type: CategoryType | None
+
+class CategoryBatchUpdateData(CategoryUpdateData):
+    id: PositiveInt
+
+class CategoriesBatchData(BaseBatchData):
+    create: list[CategoryCreationData] = []
+    update: list[CategoryBatchUpdateData] = []
+
+class CategoriesBatchOutputData(BaseBatchOutputData):
+    created: list[CategoryOutputData]
+    updated: list[CategoryOutputData]
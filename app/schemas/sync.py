@@ -0,0 +1,26 @@
+from pydantic import NonNegativeInt, PositiveInt
+
+from core.databases.models.utilities.types import SyncRecordType
+
+from .account import AccountOutputData
+from .budget import BudgetOutputData
+from .category import CategoryOutputData
+from .transaction import TransactionOutputData
+from .utilities.base import BaseData
+
+
+class TombstoneOutputData(BaseData, orm_mode=True):
+    record_type: SyncRecordType
+    record_id: PositiveInt
+
+
+class SyncCursorData(BaseData):
+    version: NonNegativeInt
+
+class SyncData(BaseData):
+    accounts: list[AccountOutputData]
+    categories: list[CategoryOutputData]
+    budgets: list[BudgetOutputData]
+    transactions: list[TransactionOutputData]
+    tombstones: list[TombstoneOutputData]
+    next_cursor: str
@@ -1,17 +1,22 @@
 from datetime import date, time
 
-from pydantic import PositiveFloat, PositiveInt
+from pydantic import NonNegativeInt, PositiveFloat, PositiveInt
 
 from core.databases.models.utilities.types import TransactionType
 
-from .utilities.base import BaseData, BaseUpdateData
+from .utilities.base import (
+    BaseBatchData,
+    BaseBatchOutputData,
+    BaseData,
+    BaseUpdateData,
+)
 from .utilities.types import Month, Year
 
 
 class TransactionOutputData(BaseData, orm_mode=True):
     id: PositiveInt
     account_id: PositiveInt
-    category_id: PositiveInt
+    category_id: PositiveInt | None
     type: TransactionType
     due_date: date
     due_time: time
@@ -36,7 +41,46 @@ class TransactionUpdateData(BaseUpdateData, anystr_strip_whitespace=True):
     amount: PositiveFloat | None
     note: str | None
 
+class TransactionBatchUpdateData(TransactionUpdateData):
+    id: PositiveInt
+
+class TransactionsBatchData(BaseBatchData):
+    create: list[TransactionCreationData] = []
+    update: list[TransactionBatchUpdateData] = []
+
+class TransactionsBatchOutputData(BaseBatchOutputData):
+    created: list[TransactionOutputData]
+    updated: list[TransactionOutputData]
+
 
 class TransactionsPeriodData(BaseData):
     year: Year
     month: Month
+
+
+class TransactionsFilterData(BaseData):
+    account_id: PositiveInt | None
+    category_id: PositiveInt | None
+    type: TransactionType | None
+    min_amount: PositiveFloat | None
+    max_amount: PositiveFloat | None
+    first_date: date | None
+    last_date: date | None
+
+class TransactionsCursorData(BaseData):
+    due_date: date
+    due_time: time
+    id: PositiveInt
+
+class TransactionsPageData(BaseData):
+    transactions: list[TransactionOutputData]
+    next_cursor: str | None
+
+
+class TransactionImportErrorData(BaseData):
+    row: PositiveInt
+    errors: list[str]
+
+class TransactionsImportData(BaseData):
+    imported_count: NonNegativeInt
+    errors: list[TransactionImportErrorData]
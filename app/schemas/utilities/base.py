@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PositiveInt, root_validator
 
 
 class BaseData(BaseModel):
@@ -12,3 +12,21 @@ class BaseUpdateData(BaseData):
         keyword_arguments['exclude_unset'] = True
 
         return super().dict(**keyword_arguments)
+
+
+class BaseBatchData(BaseData):
+    """Base class for batches of operations, subclasses declare `create` & `update` lists."""
+
+    delete: list[PositiveInt] = []
+
+    @root_validator(skip_on_failure=True)
+    def check_records_are_changed_once(cls, values: dict[str, Any]) -> dict[str, Any]:
+        changed_record_ids: list[int] = [record_data.id for record_data in values['update']] + values['delete']
+
+        if len(changed_record_ids) != len(set(changed_record_ids)):
+            raise ValueError('Every record may be updated or deleted only once per batch')
+
+        return values
+
+class BaseBatchOutputData(BaseData):
+    deleted: list[PositiveInt]
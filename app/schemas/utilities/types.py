@@ -1,3 +1,4 @@
+from enum import StrEnum
 from typing import Annotated
 
 from pydantic import Field
@@ -16,3 +17,8 @@ Month = Annotated[
     int,
     Field(..., ge=MIN_TRANSACTION_MONTH, le=MAX_TRANSACTION_MONTH),
 ]
+
+
+class ExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from core.caches import (
+    BaseBroadcaster,
+    BaseCache,
+    LocalBroadcaster,
+    MemoryCache,
+    PostgresBroadcaster,
+    SQLiteCache,
+)
+from core.settings import settings
+
+
+class ResponseCache:
+    """Serialized responses of users, the request keys are to include the user data version the responses are built from."""
+
+    def __init__(self, backend: BaseCache[str, bytes]) -> None:
+        self.backend = backend
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups_number: int = self.hits + self.misses
+
+        return self.hits / lookups_number if lookups_number else 0
+
+    @property
+    def memory_size(self) -> int:
+        return self.backend.memory_size
+
+    async def get(self, user_id: int, request_key: str) -> bytes | None:
+        content: bytes | None = await self.backend.get(self._get_entry_key(user_id, request_key))
+
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return content
+
+    async def set(self, user_id: int, request_key: str, content: bytes) -> None:
+        await self.backend.set(self._get_entry_key(user_id, request_key), content)
+
+    def _get_entry_key(self, user_id: int, request_key: str) -> str:
+        return '{0}:{1}'.format(user_id, request_key)
+
+
+def create_cache_backend(path: Path | None) -> BaseCache[str, bytes]:
+    if path is not None:
+        return SQLiteCache(
+            path=path,
+            max_size=settings.TREND_CACHE_SIZE,
+            time_to_live=settings.TREND_CACHE_TTL,
+            max_memory_size=settings.TREND_CACHE_MEMORY_SIZE,
+        )
+
+    return MemoryCache(
+        max_size=settings.TREND_CACHE_SIZE,
+        time_to_live=settings.TREND_CACHE_TTL,
+        max_memory_size=settings.TREND_CACHE_MEMORY_SIZE,
+    )
+
+def create_broadcaster(channel: str | None) -> BaseBroadcaster:
+    if channel:  # Only a single worker may do without the channel, as revocations would not reach the other ones
+        return PostgresBroadcaster(url=str(settings.POSTGRES_URL), channel=channel)
+
+    return LocalBroadcaster()
+
+
+cache_invalidations: BaseBroadcaster = create_broadcaster(settings.CACHE_INVALIDATION_CHANNEL)
+
+trend_responses: ResponseCache = ResponseCache(
+    backend=create_cache_backend(settings.TREND_CACHE_PATH),
+)
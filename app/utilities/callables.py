@@ -1,32 +1,31 @@
+from datetime import datetime, timedelta
 from typing import Iterable
 
 from sqlalchemy import or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
 
+from app.schemas.authentication import AuthenticationData
+from app.schemas.user import UserOutputData
 from app.utilities.exceptions.records import CouldNotAccessRecords
-from core.databases.models import Category, Transaction, User
-from core.databases.models.utilities.types import TransactionType
-from core.databases.repositories import CategoryRepository
-
-
-def sum_transactions_of_given_type(
-    transactions: Iterable[Transaction],
-    transaction_type: TransactionType,
-    initial_amount: float = 0,
-) -> float:
-    return sum(
-        (
-            transaction.amount
-            for transaction in transactions
-            if transaction.type == transaction_type
-        ),
-        start=initial_amount,
-    )
+from app.utilities.security.jwt import create_access_token
+from app.utilities.security.refresh_tokens import (
+    generate_refresh_token,
+    generate_session_key,
+    hash_refresh_token,
+)
+from core.databases.models import Category, User
+from core.databases.repositories import (
+    CategoryRepository,
+    RefreshTokenRepository,
+)
+from core.databases.repositories.utilities.base import BaseRepository, Model
+from core.settings import settings
 
 
 async def get_validated_user_categories_by_ids(
     category_ids: list[int],
-    user: User,
+    user_id: int,
     session: AsyncSession,
 ) -> list[Category]:
     category_repository: CategoryRepository = CategoryRepository(session=session)
@@ -35,7 +34,7 @@ async def get_validated_user_categories_by_ids(
             Category.id.in_(category_ids),
             Category.base_category_id.in_(category_ids),
         ),
-        Category.user == user,
+        Category.user_id == user_id,
     )
     bad_category_ids: set[int] = set(category_ids) - {category.id for category in categories}
 
@@ -43,3 +42,48 @@ async def get_validated_user_categories_by_ids(
         raise CouldNotAccessRecords(list(bad_category_ids), Category)
 
     return categories
+
+async def get_validated_records_by_ids(
+    repository: BaseRepository[Model],
+    record_ids: Iterable[int | None],
+    *ownership_conditions: ColumnElement[bool],
+) -> list[Model]:
+    validated_record_ids: set[int] = {record_id for record_id in record_ids if record_id is not None}
+
+    if not validated_record_ids:
+        return []
+
+    records: list[Model] = await repository.get_list(
+        repository.model.id.in_(validated_record_ids),
+        *ownership_conditions,
+    )
+    bad_record_ids: set[int] = validated_record_ids - {record.id for record in records}
+
+    if bad_record_ids:
+        raise CouldNotAccessRecords(sorted(bad_record_ids), repository.model)
+
+    return records
+
+async def create_authentication_data(
+    user: User,
+    session: AsyncSession,
+    session_key: str | None = None,
+) -> AuthenticationData:
+    refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=session)
+    refresh_token: str = generate_refresh_token()
+    session_key = session_key or generate_session_key()
+
+    await refresh_token_repository.create(
+        record_data={
+            'user_id': user.id,
+            'session_key': session_key,
+            'token_hash': hash_refresh_token(refresh_token),
+            'expires_at': datetime.utcnow() + timedelta(seconds=settings.REFRESH_TOKEN_TTL),
+        },
+    )
+
+    return AuthenticationData(
+        access_token=create_access_token(user=user, session_key=session_key),
+        refresh_token=refresh_token,
+        user=UserOutputData.from_orm(user),
+    )
@@ -40,3 +40,10 @@ class WrongPassword(BaseApiException):
                 'username': username,
             },
         )
+
+class PasswordHashingOverloaded(BaseApiException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message='Too many authentication attempts are in progress, try again later',
+        )
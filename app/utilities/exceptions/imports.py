@@ -0,0 +1,35 @@
+from fastapi import status
+
+from .response import BaseApiException
+
+
+class UnsupportedImportFormat(BaseApiException):
+    def __init__(self, media_type: str):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            message='Records can not be imported from {0}'.format(media_type or 'unspecified media type'),
+            error_data={
+                'media_type': media_type,
+            },
+        )
+
+class MalformedImport(BaseApiException):
+    def __init__(self, media_type: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message='Imported records are not a valid {0} list'.format(media_type),
+            error_data={
+                'media_type': media_type,
+            },
+        )
+
+class ImportTooLarge(BaseApiException):
+    def __init__(self, limit: int, unit: str):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            message='Imported records exceed the limit of {0} {1}'.format(limit, unit),
+            error_data={
+                'limit': limit,
+                'unit': unit,
+            },
+        )
@@ -0,0 +1,9 @@
+from fastapi import HTTPException, status
+
+
+class DataNotModified(HTTPException):
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+        )
@@ -0,0 +1,33 @@
+from csv import DictWriter
+from io import StringIO
+from typing import AsyncIterator, Sequence
+
+from orjson import dumps
+from sqlalchemy import RowMapping
+
+
+async def format_ndjson(partitions: AsyncIterator[Sequence[RowMapping]]) -> AsyncIterator[bytes]:
+    async for partition in partitions:
+        yield b''.join(dumps(dict(row)) + b'\n' for row in partition)
+
+async def format_csv(partitions: AsyncIterator[Sequence[RowMapping]], column_names: Sequence[str]) -> AsyncIterator[str]:
+    csv_buffer: StringIO = StringIO()
+    csv_writer: DictWriter[str] = DictWriter(csv_buffer, fieldnames=column_names)
+
+    csv_writer.writeheader()
+
+    yield _drain_buffer(csv_buffer)
+
+    async for partition in partitions:
+        csv_writer.writerows(partition)
+
+        yield _drain_buffer(csv_buffer)
+
+
+def _drain_buffer(buffer: StringIO) -> str:
+    buffered_text: str = buffer.getvalue()
+
+    buffer.seek(0)
+    buffer.truncate()
+
+    return buffered_text
@@ -0,0 +1,76 @@
+from csv import DictReader
+from io import StringIO
+from itertools import islice
+from json import loads
+from typing import Any
+
+from fastapi import Request
+
+from app.utilities.exceptions.imports import (
+    ImportTooLarge,
+    MalformedImport,
+    UnsupportedImportFormat,
+)
+from core.settings import settings
+
+
+CSV_MEDIA_TYPE: str = 'text/csv'
+JSON_MEDIA_TYPE: str = 'application/json'
+
+
+async def read_imported_content(request: Request) -> bytes:
+    content_length: str | None = request.headers.get('Content-Length')
+
+    if content_length is not None and content_length.isdigit() and int(content_length) > settings.IMPORT_MAX_SIZE:
+        raise ImportTooLarge(limit=settings.IMPORT_MAX_SIZE, unit='bytes')
+
+    content: bytearray = bytearray()
+
+    async for chunk in request.stream():
+        content += chunk
+
+        if len(content) > settings.IMPORT_MAX_SIZE:
+            raise ImportTooLarge(limit=settings.IMPORT_MAX_SIZE, unit='bytes')
+
+    return bytes(content)
+
+def parse_imported_rows(content: bytes, content_type: str) -> list[Any]:
+    media_type: str = content_type.split(';')[0].strip().lower()
+    rows: list[Any]
+
+    try:
+        if media_type == CSV_MEDIA_TYPE:
+            rows = _parse_csv(content)
+        elif media_type == JSON_MEDIA_TYPE:
+            rows = _parse_json(content)
+        else:
+            raise UnsupportedImportFormat(media_type=media_type)
+    except ValueError:
+        raise MalformedImport(media_type=media_type)
+
+    if len(rows) > settings.IMPORT_MAX_ROWS:
+        raise ImportTooLarge(limit=settings.IMPORT_MAX_ROWS, unit='rows')
+
+    return rows
+
+def get_imported_row_error(row: Any) -> str | None:
+    if not isinstance(row, dict):
+        return 'The row is not an object'
+
+    if None in row:
+        return 'The row has more values than the header has columns'  # `DictReader` puts the extra values under `None`
+
+    return None
+
+
+def _parse_csv(content: bytes) -> list[Any]:
+    # One row over the limit is enough to reject the import, the rest is not parsed
+    return list(islice(DictReader(StringIO(content.decode('utf-8-sig'))), settings.IMPORT_MAX_ROWS + 1))
+
+def _parse_json(content: bytes) -> list[Any]:
+    rows: Any = loads(content)
+
+    if not isinstance(rows, list):
+        raise ValueError('Imported JSON is not an array')
+
+    return rows
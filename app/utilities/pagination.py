@@ -0,0 +1,18 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Type, TypeVar
+
+from app.schemas.utilities.base import BaseData
+from app.utilities.exceptions.pagination import InvalidCursor
+
+
+CursorData = TypeVar('CursorData', bound=BaseData)
+
+
+def encode_cursor(cursor_data: BaseData) -> str:
+    return urlsafe_b64encode(cursor_data.json().encode()).decode()
+
+def decode_cursor(cursor: str, cursor_data_type: Type[CursorData]) -> CursorData:
+    try:
+        return cursor_data_type.parse_raw(urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise InvalidCursor(cursor=cursor)
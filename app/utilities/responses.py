@@ -0,0 +1,41 @@
+from typing import Any, Collection, Mapping, Sequence, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic.utils import lenient_issubclass
+from sqlalchemy import BigInteger, Float, Integer, cast, func
+from sqlalchemy.sql import ColumnElement
+
+from app.schemas.utilities.base import BaseData
+from core.databases.models.utilities.base import BaseModel
+
+
+class RowsResponse(ORJSONResponse):
+    """Renders SQL result rows as JSON objects, skipping ORM instances & the validation against a response model."""
+
+    def render(self, content: Sequence[Mapping[str, Any]]) -> bytes:
+        return super().render([dict(row) for row in content])
+
+
+def get_output_columns(
+    model: Type[BaseModel],
+    output_schema: Type[BaseData],
+    excluded_field_names: Collection[str] = (),
+) -> tuple[ColumnElement[Any], ...]:
+    """Columns of the model named after the schema fields & cast to their numeric types, as the response model would."""
+
+    output_columns: list[ColumnElement[Any]] = []
+
+    for field_name, field in output_schema.__fields__.items():
+        if field_name in excluded_field_names:
+            continue
+
+        column: ColumnElement[Any] = getattr(model, field_name)
+
+        if lenient_issubclass(field.type_, int) and isinstance(column.type, Float):
+            column = cast(func.trunc(column), BigInteger)  # Validation truncates floats towards zero as well
+        elif lenient_issubclass(field.type_, float) and isinstance(column.type, Integer):
+            column = cast(column, Float)
+
+        output_columns.append(column.label(field_name))
+
+    return tuple(output_columns)
@@ -1,14 +1,39 @@
 from datetime import datetime, timedelta
+from hashlib import sha256
+from typing import Any, Collection
 
 from jwt import InvalidTokenError, decode, encode
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utilities.caching import cache_invalidations
+from core.caches import MemoryCache
+from core.databases.models import User
 from core.settings import settings
 
 
-def create_access_token(*, user_id: int) -> str:
-    payload: dict[str, int | datetime] = {
-        'sub': user_id,
-        'exp': datetime.utcnow() + timedelta(minutes=10),
+REQUIRED_ACCESS_TOKEN_CLAIMS: tuple[str, ...] = ('sub', 'sid', 'username', 'exp')
+
+REVOKED_SESSIONS_TOPIC: str = 'revoked_sessions'
+
+
+access_token_payloads: MemoryCache[bytes, dict[str, Any]] = MemoryCache(
+    max_size=settings.ACCESS_TOKEN_CACHE_SIZE,
+    time_to_live=settings.JWT_ACCESS_TOKEN_TTL,
+)
+
+revoked_session_keys: MemoryCache[str, bool] = MemoryCache(
+    max_size=settings.REVOKED_SESSIONS_CACHE_SIZE,
+    time_to_live=settings.JWT_ACCESS_TOKEN_TTL,
+)
+
+
+def create_access_token(*, user: User, session_key: str) -> str:
+    payload: dict[str, Any] = {
+        'sub': str(user.id),
+        'sid': session_key,
+        'family_id': user.family_id,
+        'username': user.username,
+        'exp': datetime.utcnow() + timedelta(seconds=settings.JWT_ACCESS_TOKEN_TTL),
     }
 
     return encode(
@@ -17,16 +42,36 @@ def create_access_token(*, user_id: int) -> str:
         algorithm=settings.JWT_ALGORITHM,
     )
 
-def decode_access_token(token: str) -> tuple[int | None, str | None]:
+def decode_access_token(token: str) -> tuple[dict[str, Any] | None, str | None]:
     try:
-        payload: dict[str, int] = decode(
+        payload: dict[str, Any] = decode(
             jwt=token,
             key=settings.JWT_ACCESS_SECRET_KEY,
             algorithms=[
                 settings.JWT_ALGORITHM,
             ],
+            options={
+                'require': list(REQUIRED_ACCESS_TOKEN_CLAIMS),
+            },
         )
     except InvalidTokenError:
         return (None, 'Token is invalid')
 
-    return (payload['sub'], None)
+    return (payload, None)
+
+def get_access_token_digest(token: str) -> bytes:
+    return sha256(token.encode()).digest()
+
+async def revoke_session_keys(session: AsyncSession, session_keys: Collection[str]) -> None:
+    """Reject the sessions' access tokens here at once & in the other workers once the database transaction commits."""
+
+    await mark_session_keys_revoked(list(session_keys))
+    await cache_invalidations.publish(session, REVOKED_SESSIONS_TOPIC, session_keys)
+
+async def mark_session_keys_revoked(session_keys: list[str]) -> None:
+    for session_key in session_keys:
+        await revoked_session_keys.set(session_key, True)
+
+async def subscribe_to_session_revocations() -> None:
+    # Revocations missed while the invalidations are not delivered are found by verifying the tokens in the database again
+    await cache_invalidations.subscribe(REVOKED_SESSIONS_TOPIC, mark_session_keys_revoked, access_token_payloads.clear)
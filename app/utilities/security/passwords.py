@@ -0,0 +1,50 @@
+from asyncio import Semaphore, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
+
+from app.utilities.exceptions.auth import PasswordHashingOverloaded
+from core.settings import settings
+
+
+Result = TypeVar('Result')
+
+
+password_hasher: PasswordHasher = PasswordHasher(
+    time_cost=settings.PASSWORD_HASHING_TIME_COST,
+    memory_cost=settings.PASSWORD_HASHING_MEMORY_COST,
+    parallelism=settings.PASSWORD_HASHING_PARALLELISM,
+)
+
+password_hashing_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    thread_name_prefix='password-hashing',
+)
+
+_password_hashing_slots: Semaphore = Semaphore(settings.PASSWORD_HASHING_WORKERS + settings.PASSWORD_HASHING_QUEUE_SIZE)
+
+
+async def hash_password(password: str) -> str:
+    return await _run_password_hashing(lambda: password_hasher.hash(password))
+
+async def verify_password(password_hash: str, password: str) -> bool:
+    def verify() -> bool:  # noqa: WPS430
+        try:
+            return password_hasher.verify(hash=password_hash, password=password)
+        except VerificationError:
+            return False
+
+    return await _run_password_hashing(verify)
+
+def check_password_needs_rehash(password_hash: str) -> bool:
+    return password_hasher.check_needs_rehash(password_hash)
+
+
+async def _run_password_hashing(hashing_call: Callable[[], Result]) -> Result:
+    if _password_hashing_slots.locked():
+        raise PasswordHashingOverloaded()
+
+    async with _password_hashing_slots:
+        return await get_running_loop().run_in_executor(password_hashing_executor, hashing_call)
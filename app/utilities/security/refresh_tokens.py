@@ -0,0 +1,16 @@
+from hashlib import sha256
+from secrets import token_hex, token_urlsafe
+
+
+REFRESH_TOKEN_BYTES: int = 32
+SESSION_KEY_BYTES: int = 16
+
+
+def generate_refresh_token() -> str:
+    return token_urlsafe(REFRESH_TOKEN_BYTES)
+
+def generate_session_key() -> str:
+    return token_hex(SESSION_KEY_BYTES)
+
+def hash_refresh_token(refresh_token: str) -> str:
+    return sha256(refresh_token.encode()).hexdigest()
@@ -0,0 +1,77 @@
+"""Peak memory of streaming a user's transaction export as the history grows.
+
+Seeds transactions for a throwaway user inside a transaction that is rolled back at the end,
+so it is safe to run against a development database: `python -m benchmarks.export_memory`.
+"""
+from asyncio import run
+from resource import RUSAGE_SELF, getrusage
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+from sqlalchemy import insert, text
+
+from app.utilities.exports import format_ndjson
+from core.databases.models import Account, User
+from core.databases.models.utilities.types import CurrencyType
+from core.databases.repositories import TransactionRepository
+from core.databases.sessions import PostgresSession
+
+
+HISTORY_SIZES: tuple[int, ...] = (10000, 100000, 1000000)
+PARTITION_SIZE: int = 1000
+BYTES_IN_MEBIBYTE: int = 1024 * 1024
+
+
+async def measure_export_memory() -> None:
+    async with PostgresSession() as session:
+        user_id: int = await session.scalar(
+            insert(User).values(username='export-benchmark', password='').returning(User.id),
+        )
+        account_id: int = await session.scalar(
+            insert(Account).values(user_id=user_id, name='Benchmark', currency=CurrencyType.RUB, opening_balance=0).returning(Account.id),
+        )
+        transaction_repository: TransactionRepository = TransactionRepository(session=session)
+        seeded_rows_number: int = 0
+
+        print('rows        seconds   traced peak, MiB   max RSS, MiB')  # noqa: WPS421
+
+        for history_size in HISTORY_SIZES:
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO transaction (account_id, type, due_date, due_time, amount, note)
+                    SELECT :account_id, 'Outcome', DATE '2000-01-01' + series.index % 9000, TIME '12:00', series.index, 'Benchmark'
+                    FROM generate_series(CAST(:first_index AS integer), CAST(:last_index AS integer)) AS series(index)
+                    """,
+                ),
+                {
+                    'account_id': account_id,
+                    'first_index': seeded_rows_number + 1,
+                    'last_index': history_size,
+                },
+            )
+            seeded_rows_number = history_size
+
+            start()
+            reset_peak()
+            started_at: float = perf_counter()
+
+            async for _ in format_ndjson(transaction_repository.stream_user_transactions(user_id, partition_size=PARTITION_SIZE)):
+                pass  # noqa: WPS420
+
+            elapsed_seconds: float = perf_counter() - started_at
+            traced_peak: int = get_traced_memory()[1]
+            stop()
+
+            print('{0:<11} {1:<9.2f} {2:<18.2f} {3:.2f}'.format(  # noqa: WPS421
+                history_size,
+                elapsed_seconds,
+                traced_peak / BYTES_IN_MEBIBYTE,
+                getrusage(RUSAGE_SELF).ru_maxrss / 1024,
+            ))
+
+        await session.rollback()
+
+
+if __name__ == '__main__':
+    run(measure_export_memory())
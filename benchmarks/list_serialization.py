@@ -0,0 +1,102 @@
+"""Per-row cost of listing a month of transactions, through ORM instances & the response model versus SQL rows.
+
+Seeds transactions for a throwaway user inside a transaction that is rolled back at the end,
+so it is safe to run against a development database: `python -m benchmarks.list_serialization`.
+"""
+from asyncio import run
+from time import perf_counter
+from typing import Any, Sequence
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import RowMapping, insert, text
+
+from app.schemas.transaction import TransactionOutputData
+from app.utilities.responses import RowsResponse
+from core.calendar import get_month_range
+from core.databases.models import Account, Transaction, User
+from core.databases.models.utilities.types import CurrencyType
+from core.databases.repositories import TransactionRepository
+from core.databases.repositories.transaction import is_owned_by_user
+from core.databases.sessions import PostgresSession
+
+
+MONTH_SIZES: tuple[int, ...] = (100, 1000, 10000)
+REPETITIONS_NUMBER: int = 5
+MICROSECONDS_IN_SECOND: int = 1000000
+YEAR: int = 2000
+MONTH: int = 1
+
+
+async def measure_list_serialization() -> None:  # noqa: WPS210
+    async with PostgresSession() as session:
+        user_id: int = await session.scalar(
+            insert(User).values(username='list-benchmark', password='').returning(User.id),
+        )
+        account_id: int = await session.scalar(
+            insert(Account).values(user_id=user_id, name='Benchmark', currency=CurrencyType.RUB, opening_balance=0).returning(Account.id),
+        )
+        transaction_repository: TransactionRepository = TransactionRepository(session=session)
+        response_field: Any = create_response_field(name='benchmark', type_=list[TransactionOutputData])
+        seeded_rows_number: int = 0
+
+        (month_first_date, next_month_first_date) = get_month_range(year=YEAR, month=MONTH)
+
+        print('rows     ORM fetch, us/row   model encoding, us/row   rows fetch, us/row   rows encoding, us/row')  # noqa: WPS421
+
+        for month_size in MONTH_SIZES:
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO transaction (account_id, type, due_date, due_time, amount, note)
+                    SELECT :account_id, 'Outcome', DATE '2000-01-01' + series.index % 28, TIME '12:00', series.index, 'Benchmark'
+                    FROM generate_series(CAST(:first_index AS integer), CAST(:last_index AS integer)) AS series(index)
+                    """,
+                ),
+                {
+                    'account_id': account_id,
+                    'first_index': seeded_rows_number + 1,
+                    'last_index': month_size,
+                },
+            )
+            seeded_rows_number = month_size
+
+            timings: list[float] = [0, 0, 0, 0]
+
+            for repetition_index in range(-1, REPETITIONS_NUMBER):
+                if repetition_index == 0:
+                    timings = [0, 0, 0, 0]  # The first repetition only warms the caches up
+
+                session.expunge_all()
+
+                started_at: float = perf_counter()
+                transactions: list[Transaction] = await transaction_repository.get_list(
+                    is_owned_by_user(user_id),
+                    Transaction.due_date >= month_first_date,
+                    Transaction.due_date < next_month_first_date,
+                )
+                timings[0] += perf_counter() - started_at
+
+                started_at = perf_counter()
+                JSONResponse(await serialize_response(field=response_field, response_content=transactions, is_coroutine=True))
+                timings[1] += perf_counter() - started_at
+
+                started_at = perf_counter()
+                rows: Sequence[RowMapping] = await transaction_repository.get_user_transactions_by_month(user_id, year=YEAR, month=MONTH)
+                timings[2] += perf_counter() - started_at
+
+                started_at = perf_counter()
+                RowsResponse(rows)
+                timings[3] += perf_counter() - started_at
+
+            print('{0:<8} {1:<19.2f} {2:<24.2f} {3:<20.2f} {4:.2f}'.format(  # noqa: WPS421
+                month_size,
+                *(timing * MICROSECONDS_IN_SECOND / REPETITIONS_NUMBER / month_size for timing in timings),
+            ))
+
+        await session.rollback()
+
+
+if __name__ == '__main__':
+    run(measure_list_serialization())
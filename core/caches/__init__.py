@@ -0,0 +1,8 @@
+from .base import BaseCache
+from .broadcasters import (
+    BaseBroadcaster,
+    LocalBroadcaster,
+    PostgresBroadcaster,
+)
+from .memory import MemoryCache
+from .sqlite import SQLiteCache
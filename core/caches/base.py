@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Hashable, TypeVar
+
+
+Key = TypeVar('Key', bound=Hashable)
+Value = TypeVar('Value')
+
+
+class BaseCache(ABC, Generic[Key, Value]):
+    """Cache backend interface, every implementation counts its own hits & misses."""
+
+    hits: int
+    misses: int
+    memory_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups_number: int = self.hits + self.misses
+
+        return self.hits / lookups_number if lookups_number else 0
+
+    @abstractmethod
+    async def get(self, key: Key) -> Value | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: Key, value: Value, time_to_live: float | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: Key) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+from asyncio import Event, Task, create_task, sleep, wait_for
+from logging import Logger, getLogger
+from typing import Awaitable, Callable, Collection, TypeAlias
+
+from asyncpg import Connection, InterfaceError, PostgresError, connect
+from sqlalchemy import func, make_url, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+InvalidationHandler: TypeAlias = Callable[[list[str]], Awaitable[None]]
+FlushHandler: TypeAlias = Callable[[], Awaitable[None]]
+
+TOPIC_SEPARATOR: str = ':'
+KEYS_SEPARATOR: str = ','
+MAX_PAYLOAD_SIZE: int = 7999  # Postgres rejects notification payloads of 8000 bytes & longer
+
+MIN_RECONNECTION_DELAY: float = 0.5
+MAX_RECONNECTION_DELAY: float = 30
+HEALTH_CHECK_INTERVAL: float = 30
+HEALTH_CHECK_TIMEOUT: float = 5
+LISTENING_ERRORS: tuple[type[Exception], ...] = (OSError, TimeoutError, InterfaceError, PostgresError)
+
+
+logger: Logger = getLogger(__name__)
+
+
+class BaseBroadcaster(ABC):
+    """Delivers invalidated cache keys of a topic to the subscribed caches of every worker."""
+
+    def __init__(self) -> None:
+        self.subscriptions: dict[str, tuple[InvalidationHandler, FlushHandler]] = {}
+
+    @abstractmethod
+    async def publish(self, session: AsyncSession, topic: str, keys: Collection[str]) -> None:
+        pass
+
+    async def subscribe(self, topic: str, handler: InvalidationHandler, flush_handler: FlushHandler) -> None:
+        self.subscriptions[topic] = (handler, flush_handler)
+
+    async def close(self) -> None:
+        self.subscriptions.clear()
+
+    async def deliver(self, topic: str, keys: list[str]) -> None:
+        subscription: tuple[InvalidationHandler, FlushHandler] | None = self.subscriptions.get(topic)
+
+        if subscription is not None:
+            await subscription[0](keys)
+
+    async def flush(self) -> None:
+        for (_, flush_handler) in self.subscriptions.values():
+            await flush_handler()
+
+
+class LocalBroadcaster(BaseBroadcaster):
+    """Delivers the keys within the process, enough for a single worker or caches sharing the storage."""
+
+    async def publish(self, session: AsyncSession, topic: str, keys: Collection[str]) -> None:
+        await self.deliver(topic, list(keys))
+
+
+class PostgresBroadcaster(BaseBroadcaster):
+    """Delivers the keys to every worker listening to the channel, once the publishing database transaction commits.
+
+    The listening connection is re-established whenever it is lost. Notifications sent in between are lost as well,
+    so the subscribed caches are flushed both once the connection is lost & once it is back.
+    """
+
+    def __init__(self, url: str, channel: str) -> None:
+        super().__init__()
+
+        self.url = make_url(url).set(drivername='postgresql').render_as_string(hide_password=False)
+        self.channel = channel
+
+        self._listening_task: Task[None] | None = None
+        self._is_listening: Event = Event()
+
+    async def publish(self, session: AsyncSession, topic: str, keys: Collection[str]) -> None:
+        payloads: list[str] = []
+        payload: str = ''
+
+        for key in keys:
+            if payload and len(payload) + len(KEYS_SEPARATOR) + len(key) > MAX_PAYLOAD_SIZE:
+                payloads.append(payload)
+                payload = ''
+
+            payload = '{0}{1}{2}'.format(payload, KEYS_SEPARATOR, key) if payload else '{0}{1}{2}'.format(topic, TOPIC_SEPARATOR, key)
+
+        if payload:
+            payloads.append(payload)
+
+        for payload in payloads:
+            await session.execute(
+                select(func.pg_notify(self.channel, payload)),
+            )
+
+    async def subscribe(self, topic: str, handler: InvalidationHandler, flush_handler: FlushHandler) -> None:
+        await super().subscribe(topic, handler, flush_handler)
+
+        if self._listening_task is None:
+            self._listening_task = create_task(self._keep_listening())
+
+        await self._is_listening.wait()
+
+    async def close(self) -> None:
+        if self._listening_task is not None:
+            self._listening_task.cancel()
+
+        self._listening_task = None
+        self._is_listening.clear()
+
+        await super().close()
+
+    async def _keep_listening(self) -> None:
+        reconnection_delay: float = MIN_RECONNECTION_DELAY
+        has_listened: bool = False
+
+        while True:  # noqa: WPS457
+            try:
+                connection: Connection = await connect(self.url, timeout=HEALTH_CHECK_TIMEOUT)
+            except LISTENING_ERRORS as error:
+                logger.warning('Could not connect to listen to %s, retrying in %s seconds: %r', self.channel, reconnection_delay, error)
+
+                await sleep(reconnection_delay)
+                reconnection_delay = min(reconnection_delay * 2, MAX_RECONNECTION_DELAY)
+
+                continue
+
+            reconnection_delay = MIN_RECONNECTION_DELAY
+
+            try:
+                await self._listen(connection, has_listened)
+            except LISTENING_ERRORS as error:
+                logger.warning('Lost the connection listening to %s: %r', self.channel, error)
+            finally:
+                connection.terminate()
+
+            has_listened = True
+
+            await self.flush()
+
+    async def _listen(self, connection: Connection, has_listened: bool) -> None:
+        is_terminated: Event = Event()
+
+        connection.add_termination_listener(lambda _connection: is_terminated.set())
+        await connection.add_listener(self.channel, self._handle_notification)
+
+        if has_listened:
+            await self.flush()
+
+        self._is_listening.set()
+
+        while not is_terminated.is_set():
+            try:
+                await wait_for(is_terminated.wait(), timeout=HEALTH_CHECK_INTERVAL)
+            except TimeoutError:
+                await connection.execute('SELECT 1', timeout=HEALTH_CHECK_TIMEOUT)
+
+        raise InterfaceError('The listening connection is closed')
+
+    async def _handle_notification(self, _connection: Connection, _pid: int, _channel: str, payload: str) -> None:
+        (topic, _, keys) = payload.partition(TOPIC_SEPARATOR)
+
+        await self.deliver(topic, keys.split(KEYS_SEPARATOR))
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from sys import getsizeof
+from time import monotonic
+
+from .base import BaseCache, Key, Value
+
+
+class MemoryCache(BaseCache[Key, Value]):
+    """Bounded in-process cache with LRU eviction & per-entry expiration."""
+
+    def __init__(self, max_size: int, time_to_live: float, max_memory_size: int | None = None) -> None:
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+        self.max_memory_size = max_memory_size
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.memory_size: int = 0  # Shallow sizes of the values, exact for `bytes` & `str` ones
+
+        self._entries: OrderedDict[Key, tuple[float, Value]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Key) -> Value | None:
+        entry: tuple[float, Value] | None = self._entries.get(key)
+
+        if entry is None or entry[0] <= monotonic():
+            self._pop(key)
+            self.misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    async def set(self, key: Key, value: Value, time_to_live: float | None = None) -> None:
+        self._pop(key)
+
+        self._entries[key] = (monotonic() + (self.time_to_live if time_to_live is None else time_to_live), value)
+        self.memory_size += getsizeof(value)
+
+        while len(self._entries) > self.max_size or self._is_memory_exceeded():
+            self._pop(next(iter(self._entries)))
+
+    async def delete(self, key: Key) -> None:
+        self._pop(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.memory_size = 0
+
+    def _pop(self, key: Key) -> None:
+        entry: tuple[float, Value] | None = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.memory_size -= getsizeof(entry[1])
+
+    def _is_memory_exceeded(self) -> bool:
+        return self.max_memory_size is not None and self.memory_size > self.max_memory_size
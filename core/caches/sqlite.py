@@ -0,0 +1,129 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from sqlite3 import Connection, connect
+from time import time
+from typing import Any, Callable, TypeVar
+
+from .base import BaseCache
+
+
+Result = TypeVar('Result')
+
+# Expired & excess entries are removed once per so many insertions, so the bounds may be exceeded in between
+EVICTION_INTERVAL: int = 100
+LOCK_TIMEOUT: float = 5
+
+
+class SQLiteCache(BaseCache[str, bytes]):
+    """Cache in a file shared by the worker processes of a host, with LRU eviction by the last access time."""
+
+    def __init__(self, path: Path, max_size: int, time_to_live: float, max_memory_size: int | None = None) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+        self.max_memory_size = max_memory_size
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.memory_size: int = 0  # As of the last eviction, the other workers change the file in between
+
+        self._insertions_number: int = 0
+        # The blocking SQLite calls are run off the event loop, one at a time as they share the connection
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-cache')
+
+        # Every statement is a transaction of its own & the entries may be lost on a crash as they are recomputable
+        self._connection: Connection = connect(path, timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = OFF')
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entry (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._connection.execute('CREATE INDEX IF NOT EXISTS ix_cache_entry_accessed_at ON cache_entry (accessed_at)')
+
+    async def count(self) -> int:
+        return await self._run(self._count)
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self._run(self._get, key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def set(self, key: str, value: bytes, time_to_live: float | None = None) -> None:
+        await self._run(self._set, key, value, self.time_to_live if time_to_live is None else time_to_live)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._connection.execute, 'DELETE FROM cache_entry WHERE key = ?', (key,))
+
+    async def clear(self) -> None:
+        await self._run(self._connection.execute, 'DELETE FROM cache_entry')
+
+    async def evict(self) -> None:
+        await self._run(self._evict)
+
+    async def close(self) -> None:
+        await self._run(self._connection.close)
+
+        self._executor.shutdown()
+
+    async def _run(self, function: Callable[..., Result], *arguments: Any) -> Result:
+        return await get_running_loop().run_in_executor(self._executor, function, *arguments)
+
+    def _count(self) -> int:
+        return self._connection.execute('SELECT count(*) FROM cache_entry').fetchone()[0]
+
+    def _get(self, key: str) -> bytes | None:
+        current_time: float = time()
+        entry: tuple[bytes] | None = self._connection.execute(
+            'UPDATE cache_entry SET accessed_at = ? WHERE key = ? AND expires_at > ? RETURNING value',
+            (current_time, key, current_time),
+        ).fetchone()
+
+        return entry[0] if entry is not None else None
+
+    def _set(self, key: str, value: bytes, time_to_live: float) -> None:
+        current_time: float = time()
+
+        self._connection.execute(
+            """
+                INSERT INTO cache_entry (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at, accessed_at = excluded.accessed_at
+            """,
+            (key, value, current_time + time_to_live, current_time),
+        )
+
+        self._insertions_number += 1
+
+        if self._insertions_number % EVICTION_INTERVAL == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        self._connection.execute('DELETE FROM cache_entry WHERE expires_at <= ?', (time(),))
+        self._connection.execute(
+            'DELETE FROM cache_entry WHERE key IN (SELECT key FROM cache_entry ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_size,),
+        )
+
+        if self.max_memory_size is not None:
+            self._connection.execute(
+                """
+                    DELETE FROM cache_entry WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, sum(length(value)) OVER (ORDER BY accessed_at DESC, key) AS memory_size FROM cache_entry
+                        ) WHERE memory_size > ?
+                    )
+                """,
+                (self.max_memory_size,),
+            )
+
+        self.memory_size = int(self._connection.execute('SELECT total(length(value)) FROM cache_entry').fetchone()[0])
@@ -12,6 +12,12 @@ def get_current_month_boundaries() -> tuple[date, date]:
 
     return (current_month_first_date, current_month_last_date)
 
+def get_month_range(year: int, month: int) -> tuple[date, date]:
+    month_first_date: date = date(year=year, month=month, day=1)
+    next_month_first_date: date = date(year=year + month // 12, month=month % 12 + 1, day=1)
+
+    return (month_first_date, next_month_first_date)
+
 def fill_missing_dates_with_default_value(
     date_related_list: list[tuple[Any, ...]],
     default_value: Any,
@@ -0,0 +1,30 @@
+from asyncio import run
+
+from core.databases.repositories import (
+    AccountRepository,
+    TransactionRepository,
+)
+from core.databases.repositories.account import AccountTotalDrift
+from core.databases.sessions import PostgresSession
+
+
+async def reconcile() -> None:
+    """Recompute denormalised account totals & monthly rollups from transactions, report the drift."""
+
+    async with PostgresSession() as session:
+        account_repository: AccountRepository = AccountRepository(session=session)
+        transaction_repository: TransactionRepository = TransactionRepository(session=session)
+        drifts: list[AccountTotalDrift] = await account_repository.reconcile_totals()
+        rollups_count: int = await transaction_repository.rebuild_monthly_rollups()
+
+        await session.commit()
+
+    for drift in drifts:
+        print('Account #{0.account_id}: {0.total_name} was {0.stored_amount}, recomputed as {0.actual_amount}'.format(drift))  # noqa: WPS421
+
+    print('Accounts with drifted totals: {0}'.format(len({drift.account_id for drift in drifts})))  # noqa: WPS421
+    print('Monthly rollups rebuilt: {0}'.format(rollups_count))  # noqa: WPS421
+
+
+if __name__ == '__main__':
+    run(reconcile())
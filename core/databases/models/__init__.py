@@ -2,5 +2,8 @@ from .account import Account
 from .budget import Budget
 from .category import Category
 from .family import Family
+from .refresh_token import RefreshToken
+from .tombstone import Tombstone
 from .transaction import Transaction
+from .transaction_monthly_rollup import TransactionMonthlyRollup
 from .user import User
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import Computed, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .utilities.base import BaseModel
+from .utilities.syncable import SyncableMixin
 from .utilities.types import CurrencyType
 
 
@@ -12,12 +13,21 @@ if TYPE_CHECKING:
     from .user import User
 
 
-class Account(BaseModel):
-    user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
+class Account(SyncableMixin, BaseModel):
+    __table_args__ = (
+        Index('ix_account_user_id_version', 'user_id', 'version'),
+    )
 
-    user: Mapped['User'] = relationship(back_populates='accounts', lazy='selectin')
-    transactions: Mapped[list['Transaction']] = relationship(back_populates='account', cascade='all, delete', lazy='selectin')
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id'), index=True)
+
+    user: Mapped['User'] = relationship(back_populates='accounts', lazy='raise')
+    transactions: Mapped[list['Transaction']] = relationship(back_populates='account', cascade='all, delete', lazy='raise')
 
     name: Mapped[str] = mapped_column(index=True)
     currency: Mapped[CurrencyType]
     opening_balance: Mapped[float] = mapped_column(default=0)
+
+    total_incomes: Mapped[float] = mapped_column(default=0, server_default='0')
+    total_outcomes: Mapped[float] = mapped_column(default=0, server_default='0')
+    total_transfers: Mapped[float] = mapped_column(default=0, server_default='0')
+    current_balance: Mapped[float] = mapped_column(Computed('opening_balance + total_incomes - total_outcomes'))
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .utilities.base import BaseModel
+from .utilities.syncable import SyncableMixin
 from .utilities.types import BudgetType
 
 
@@ -12,11 +13,15 @@ if TYPE_CHECKING:
     from .user import User
 
 
-class Budget(BaseModel):
+class Budget(SyncableMixin, BaseModel):
+    __table_args__ = (
+        Index('ix_budget_user_id_version', 'user_id', 'version'),
+    )
+
     user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
 
-    user: Mapped['User'] = relationship(back_populates='budgets', lazy='selectin')
-    categories: Mapped[list['Category']] = relationship(back_populates='budget', lazy='selectin')
+    user: Mapped['User'] = relationship(back_populates='budgets', lazy='raise')
+    categories: Mapped[list['Category']] = relationship(back_populates='budget', lazy='raise')
 
     name: Mapped[str] = mapped_column(index=True)
     type: Mapped[BudgetType]
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .utilities.base import BaseModel
+from .utilities.syncable import SyncableMixin
 from .utilities.types import CategoryType
 
 
@@ -13,16 +14,20 @@ if TYPE_CHECKING:
     from .user import User
 
 
-class Category(BaseModel):
+class Category(SyncableMixin, BaseModel):
+    __table_args__ = (
+        Index('ix_category_user_id_version', 'user_id', 'version'),
+    )
+
     user_id: Mapped[int] = mapped_column(ForeignKey('user.id'))
     base_category_id: Mapped[int | None] = mapped_column(ForeignKey('category.id'))
     budget_id: Mapped[int | None] = mapped_column(ForeignKey('budget.id'))
 
-    user: Mapped['User'] = relationship(back_populates='categories', lazy='selectin')
-    base_category: Mapped['Category | None'] = relationship(back_populates='subcategories', lazy='selectin', remote_side=lambda: Category.id)
-    subcategories: Mapped[list['Category']] = relationship(back_populates='base_category', cascade='all, delete', lazy='selectin')
-    budget: Mapped['Budget | None'] = relationship(back_populates='categories', lazy='selectin')
-    transactions: Mapped[list['Transaction']] = relationship(back_populates='category', lazy='selectin')
+    user: Mapped['User'] = relationship(back_populates='categories', lazy='raise')
+    base_category: Mapped['Category | None'] = relationship(back_populates='subcategories', lazy='raise', remote_side=lambda: Category.id)
+    subcategories: Mapped[list['Category']] = relationship(back_populates='base_category', cascade='all, delete', lazy='raise')
+    budget: Mapped['Budget | None'] = relationship(back_populates='categories', lazy='raise')
+    transactions: Mapped[list['Transaction']] = relationship(back_populates='category', lazy='raise')
 
     name: Mapped[str] = mapped_column(index=True)
     type: Mapped[CategoryType]
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .utilities.base import BaseModel
+from .utilities.constants import SESSION_KEY_LENGTH, TOKEN_HASH_LENGTH
+
+
+class RefreshToken(BaseModel):
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'), index=True)
+
+    session_key: Mapped[str] = mapped_column(String(SESSION_KEY_LENGTH), index=True)
+    token_hash: Mapped[str] = mapped_column(String(TOKEN_HASH_LENGTH), unique=True)
+    expires_at: Mapped[datetime]
+    revoked_at: Mapped[datetime | None]
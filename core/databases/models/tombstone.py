@@ -0,0 +1,17 @@
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .utilities.base import BaseModel
+from .utilities.syncable import SyncableMixin
+from .utilities.types import SyncRecordType
+
+
+class Tombstone(SyncableMixin, BaseModel):
+    __table_args__ = (
+        Index('ix_tombstone_user_id_version', 'user_id', 'version'),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+
+    record_type: Mapped[SyncRecordType]
+    record_id: Mapped[int]
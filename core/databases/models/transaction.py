@@ -1,10 +1,11 @@
 from datetime import date, time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .utilities.base import BaseModel
+from .utilities.syncable import SyncableMixin
 from .utilities.types import TransactionType
 
 
@@ -13,12 +14,18 @@ if TYPE_CHECKING:
     from .category import Category
 
 
-class Transaction(BaseModel):
+class Transaction(SyncableMixin, BaseModel):
+    __table_args__ = (
+        Index('ix_transaction_account_id_due_date', 'account_id', 'due_date'),
+        Index('ix_transaction_account_id_type_due_date', 'account_id', 'type', 'due_date'),
+        Index('ix_transaction_account_id_version', 'account_id', 'version'),
+    )
+
     account_id: Mapped[int] = mapped_column(ForeignKey('account.id'))
     category_id: Mapped[int | None] = mapped_column(ForeignKey('category.id'))
 
-    account: Mapped['Account'] = relationship(back_populates='transactions', lazy='selectin')
-    category: Mapped['Category | None'] = relationship(back_populates='transactions', lazy='selectin')
+    account: Mapped['Account'] = relationship(back_populates='transactions', lazy='raise')
+    category: Mapped['Category | None'] = relationship(back_populates='transactions', lazy='raise')
 
     type: Mapped[TransactionType]
     due_date: Mapped[date]
@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .utilities.base import BaseModel
+from .utilities.types import TransactionType
+
+
+class TransactionMonthlyRollup(BaseModel):
+    __table_args__ = (
+        UniqueConstraint(
+            'account_id', 'year', 'month', 'type', 'category_id',
+            name='uq_transaction_monthly_rollup_period',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    account_id: Mapped[int] = mapped_column(ForeignKey('account.id', ondelete='CASCADE'))
+    category_id: Mapped[int | None] = mapped_column(ForeignKey('category.id', ondelete='CASCADE'))
+
+    type: Mapped[TransactionType]
+    year: Mapped[int]
+    month: Mapped[int]
+    amount_sum: Mapped[float] = mapped_column(default=0)
+    transactions_count: Mapped[int] = mapped_column(default=0)
@@ -17,10 +17,12 @@ if TYPE_CHECKING:
 class User(BaseModel):
     family_id: Mapped[int | None] = mapped_column(ForeignKey('family.id'))
 
-    family: Mapped['Family | None'] = relationship(back_populates='members', lazy='selectin')
-    accounts: Mapped[list['Account']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
-    categories: Mapped[list['Category']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
-    budgets: Mapped[list['Budget']] = relationship(back_populates='user', cascade='all, delete', lazy='selectin')
+    family: Mapped['Family | None'] = relationship(back_populates='members', lazy='raise')
+    accounts: Mapped[list['Account']] = relationship(back_populates='user', cascade='all, delete', lazy='raise')
+    categories: Mapped[list['Category']] = relationship(back_populates='user', cascade='all, delete', lazy='raise')
+    budgets: Mapped[list['Budget']] = relationship(back_populates='user', cascade='all, delete', lazy='raise')
 
     username: Mapped[str] = mapped_column(String(MAX_USERNAME_LENGTH), unique=True, index=True)
     password: Mapped[str]
+    # Bumped by every unit of work writing the user's data, so polling clients can revalidate cheaply
+    data_version: Mapped[int] = mapped_column(server_default='0')
@@ -17,6 +17,9 @@ class BaseModel(AsyncAttrs, DeclarativeBase):
         int: BigInteger,
         StrEnum: Enum(StrEnum, values_callable=lambda enum: [enum_field.value for enum_field in enum]),
     }
+    __mapper_args__: dict[str, Any] = {
+        'eager_defaults': True,
+    }
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
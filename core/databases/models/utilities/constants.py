@@ -1 +1,3 @@
 MAX_USERNAME_LENGTH: int = 30
+SESSION_KEY_LENGTH: int = 32
+TOKEN_HASH_LENGTH: int = 64
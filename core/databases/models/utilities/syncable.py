@@ -0,0 +1,12 @@
+from sqlalchemy import TextClause, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+# ID of the writing database transaction, IDs only grow but become visible in the order of commits
+CURRENT_VERSION: TextClause = text('pg_current_xact_id()::text::bigint')
+# The lowest ID among database transactions still in progress, every lower one is already committed or aborted
+CURRENT_SNAPSHOT_XMIN: TextClause = text('pg_snapshot_xmin(pg_current_snapshot())::text::bigint')
+
+
+class SyncableMixin:
+    version: Mapped[int] = mapped_column(server_default=CURRENT_VERSION, onupdate=CURRENT_VERSION)
@@ -22,3 +22,9 @@ class CategoryType(StrEnum):
 class CurrencyType(StrEnum):
     RUB = 'RUB'
     USD = 'USD'
+
+class SyncRecordType(StrEnum):
+    TRANSACTION = 'transaction'
+    ACCOUNT = 'account'
+    CATEGORY = 'category'
+    BUDGET = 'budget'
@@ -2,5 +2,7 @@ from .account import AccountRepository
 from .budget import BudgetRepository
 from .category import CategoryRepository
 from .family import FamilyRepository
+from .refresh_token import RefreshTokenRepository
+from .tombstone import TombstoneRepository
 from .transaction import TransactionRepository
 from .user import UserRepository
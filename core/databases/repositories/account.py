@@ -1,13 +1,115 @@
+from typing import NamedTuple, Sequence
+
+from sqlalchemy import Result, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Subquery
+
+from core.databases.models import Account, Transaction
+from core.databases.models.utilities.types import SyncRecordType
+
+from .transaction import ACCOUNT_TOTALS, TransactionRepository
+from .utilities.syncable import SyncableRepository
+
+
+TOTALS_DRIFT_TOLERANCE: float = 0.005
 
-from core.databases.models import Account
 
-from .utilities.base import BaseRepository
+class AccountTotalDrift(NamedTuple):
+    account_id: int
+    total_name: str
+    stored_amount: float
+    actual_amount: float
 
 
-class AccountRepository(BaseRepository[Account]):
+class AccountRepository(SyncableRepository[Account]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(
             model=Account,
             session=session,
+            record_type=SyncRecordType.ACCOUNT,
+            owner_id=Account.user_id,
         )
+
+    async def delete_many(self, records: Sequence[Account]) -> None:
+        if not records:
+            return
+
+        transaction_repository: TransactionRepository = TransactionRepository(session=self.session)
+
+        await transaction_repository.bury(Transaction.account_id.in_([record.id for record in records]))
+
+        await super().delete_many(records)
+
+    async def get_user_balances(self, user_id: int) -> list[tuple[int, str, float]]:
+        query_result: Result[tuple[int, str, float]] = await self.session.execute(
+            select(
+                Account.id,
+                Account.name,
+                Account.current_balance,
+            ).where(
+                Account.user_id == user_id,
+            ).order_by(
+                Account.id,
+            ),
+        )
+
+        return list(query_result.tuples().all())
+
+    async def reconcile_totals(self) -> list[AccountTotalDrift]:
+        actual_totals_query: Subquery = select(
+            Account.id.label('account_id'),
+            *(
+                func.COALESCE(func.SUM(Transaction.amount).filter(Transaction.type == transaction_type), 0).label(total.key)
+                for (transaction_type, total) in ACCOUNT_TOTALS.items()
+            ),
+        ).outerjoin(
+            Transaction,
+            Transaction.account_id == Account.id,
+        ).group_by(
+            Account.id,
+        ).subquery()
+
+        query_result: Result[tuple[int, ...]] = await self.session.execute(
+            select(
+                Account.id,
+                *(
+                    total_column
+                    for total in ACCOUNT_TOTALS.values()
+                    for total_column in (total, actual_totals_query.c[total.key])
+                ),
+            ).join(
+                actual_totals_query,
+                actual_totals_query.c.account_id == Account.id,
+            ).where(
+                or_(*(
+                    func.ABS(total - actual_totals_query.c[total.key]) > TOTALS_DRIFT_TOLERANCE
+                    for total in ACCOUNT_TOTALS.values()
+                )),
+            ).with_for_update(
+                of=Account,
+            ),
+        )
+
+        drifts: list[AccountTotalDrift] = []
+
+        for (account_id, *amounts) in query_result.tuples().all():
+            for (total, stored_amount, actual_amount) in zip(ACCOUNT_TOTALS.values(), amounts[::2], amounts[1::2]):
+                if abs(stored_amount - actual_amount) > TOTALS_DRIFT_TOLERANCE:
+                    drifts.append(AccountTotalDrift(account_id, total.key, stored_amount, actual_amount))
+
+        if drifts:
+            await self.session.execute(
+                update(
+                    Account,
+                ).where(
+                    Account.id == actual_totals_query.c.account_id,
+                    Account.id.in_({drift.account_id for drift in drifts}),
+                ).values({
+                    total: actual_totals_query.c[total.key]
+                    for total in ACCOUNT_TOTALS.values()
+                }).execution_options(
+                    synchronize_session=False,
+                ),
+            )
+
+        return drifts
@@ -1,13 +1,97 @@
+from typing import Any, Awaitable, Sequence
+
+from sqlalchemy import Result, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
 
-from core.databases.models import Budget
+from core.databases.models import Budget, Category
+from core.databases.models.utilities.types import SyncRecordType
 
-from .utilities.base import BaseRepository
+from .utilities.syncable import SyncableRepository
 
 
-class BudgetRepository(BaseRepository[Budget]):
+class BudgetRepository(SyncableRepository[Budget]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(
             model=Budget,
             session=session,
+            record_type=SyncRecordType.BUDGET,
+            owner_id=Budget.user_id,
+        )
+
+    async def create(self, record_data: dict[str, Any], **additional_attributes: Any) -> Budget:
+        if 'categories' in additional_attributes:
+            await self._touch_category_budgets(additional_attributes['categories'])
+
+        return await super().create(record_data, **additional_attributes)
+
+    async def update(self, record: Budget, record_data: dict[str, Any], **additional_attributes: Any) -> Budget:
+        if 'categories' in additional_attributes:
+            categories: list[Category] = additional_attributes['categories']
+
+            if isinstance(categories, Awaitable):
+                categories = await categories
+
+            additional_attributes['categories'] = categories
+
+            await self._touch_category_budgets(categories, record.id)
+
+        return await super().update(record, record_data, **additional_attributes)
+
+    async def delete_many(self, records: Sequence[Budget]) -> None:
+        if not records:
+            return
+
+        await self.session.execute(
+            update(
+                Category,
+            ).where(
+                Category.budget_id.in_([record.id for record in records]),
+            ).values(
+                budget_id=None,
+            ).execution_options(
+                synchronize_session=False,
+            ),
         )
+
+        await super().delete_many(records)
+
+    async def get_projected_list_with_categories(
+        self,
+        *conditions: ColumnElement[bool],
+        columns: Sequence[ColumnElement[Any]],
+        category_columns: Sequence[ColumnElement[Any]],
+    ) -> list[dict[str, Any]]:
+        budgets: list[dict[str, Any]] = [
+            dict(budget_row, categories=[])
+            for budget_row in await self.get_projected_list(*conditions, columns=columns)
+        ]
+        budgets_by_ids: dict[int, dict[str, Any]] = {budget['id']: budget for budget in budgets}
+
+        if not budgets_by_ids:
+            return budgets
+
+        query_result: Result[Any] = await self.session.execute(
+            select(
+                Category.budget_id,
+                *category_columns,
+            ).where(
+                Category.budget_id.in_(budgets_by_ids),
+            ),
+        )
+
+        for category_row in query_result.mappings():
+            category: dict[str, Any] = dict(category_row)
+
+            budgets_by_ids[category.pop('budget_id')]['categories'].append(category)
+
+        return budgets
+
+    async def _touch_category_budgets(self, categories: Sequence[Category], *budget_ids: int) -> None:
+        touched_budget_ids: set[int] = {
+            *budget_ids,
+            *(category.budget_id for category in categories if category.budget_id is not None),
+        }
+
+        if touched_budget_ids:
+            await self.touch(Budget.id.in_(touched_budget_ids))
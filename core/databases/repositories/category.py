@@ -1,13 +1,40 @@
+from typing import Sequence
+
+from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.databases.models import Category
+from core.databases.models.utilities.types import SyncRecordType
 
-from .utilities.base import BaseRepository
+from .transaction import TransactionRepository
+from .utilities.syncable import SyncableRepository
 
 
-class CategoryRepository(BaseRepository[Category]):
+class CategoryRepository(SyncableRepository[Category]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(
             model=Category,
             session=session,
+            record_type=SyncRecordType.CATEGORY,
+            owner_id=Category.user_id,
         )
+
+    async def delete_many(self, records: Sequence[Category]) -> None:
+        if not records:
+            return
+
+        category_ids: set[int] = {record.id for record in records}
+        subcategory_ids: set[int] = set(category_ids)
+
+        while subcategory_ids:
+            query_result: Result[tuple[int]] = await self.session.execute(
+                select(Category.id).where(Category.base_category_id.in_(subcategory_ids)),
+            )
+            subcategory_ids = set(query_result.scalars().all()) - category_ids
+            category_ids |= subcategory_ids
+
+        transaction_repository: TransactionRepository = TransactionRepository(session=self.session)
+
+        await transaction_repository.detach_categories(category_ids)
+
+        await self.bury(Category.id.in_(category_ids))
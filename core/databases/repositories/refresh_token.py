@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import Result, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.databases.models import RefreshToken
+
+from .utilities.base import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(
+            model=RefreshToken,
+            session=session,
+        )
+
+    async def get_by_token_hash_for_update(self, token_hash: str) -> RefreshToken | None:
+        query_result: Result[tuple[RefreshToken]] = await self.session.execute(
+            select(
+                RefreshToken,
+            ).where(
+                RefreshToken.token_hash == token_hash,
+            ).with_for_update(),
+        )
+
+        return query_result.scalars().one_or_none()
+
+    async def revoke_session(self, session_key: str) -> None:
+        await self.session.execute(
+            update(
+                RefreshToken,
+            ).where(
+                RefreshToken.session_key == session_key,
+                RefreshToken.revoked_at.is_(None),
+            ).values(
+                revoked_at=datetime.utcnow(),
+            ).execution_options(
+                synchronize_session=False,
+            ),
+        )
@@ -0,0 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.databases.models import Tombstone
+
+from .utilities.base import BaseRepository
+
+
+class TombstoneRepository(BaseRepository[Tombstone]):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(
+            model=Tombstone,
+            session=session,
+        )
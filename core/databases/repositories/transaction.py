@@ -1,71 +1,327 @@
+from collections import defaultdict
 from datetime import date, datetime
+from typing import Any, AsyncIterator, Sequence
 
-from sqlalchemy import Result, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    CursorResult,
+    Integer,
+    Result,
+    RowMapping,
+    Select,
+    cast,
+    delete,
+    func,
+    null,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql import ColumnElement, Subquery
 
 from core.calendar import (
     fill_missing_dates_with_default_value,
     get_current_month_boundaries,
+    get_month_range,
+)
+from core.databases.models import (
+    Account,
+    Transaction,
+    TransactionMonthlyRollup,
 )
-from core.databases.models import Transaction, User
 from core.databases.models.utilities.types import (
     SummaryPeriodType,
+    SyncRecordType,
     TransactionType,
 )
 
-from .utilities.base import BaseRepository
+from .utilities.base import BATCH_SIZE, Keyset, KeysetCursor
+from .utilities.syncable import SyncableRepository
+
+
+ACCOUNT_TOTALS: dict[TransactionType, InstrumentedAttribute[float]] = {
+    TransactionType.INCOME: Account.total_incomes,
+    TransactionType.OUTCOME: Account.total_outcomes,
+    TransactionType.TRANSFER: Account.total_transfers,
+}
+
+AGGREGATED_FIELD_KEYS: tuple[str, ...] = ('account_id', 'category_id', 'type', 'due_date', 'amount')
+
+TRANSACTION_KEYSET: Keyset = (Transaction.due_date, Transaction.due_time, Transaction.id)
+
+OUTPUT_COLUMN_NAMES: tuple[str, ...] = ('id', 'account_id', 'category_id', 'type', 'due_date', 'due_time', 'amount', 'note')
+
+
+def select_user_account_ids(user_id: int) -> Select[tuple[int]]:
+    return select(Account.id).where(Account.user_id == user_id)
 
+def is_owned_by_user(user_id: int) -> ColumnElement[bool]:
+    return Transaction.account_id.in_(select_user_account_ids(user_id))
 
-class TransactionRepository(BaseRepository[Transaction]):
+def get_aggregated_data(transaction: Transaction) -> dict[str, Any]:
+    return {field_key: getattr(transaction, field_key) for field_key in AGGREGATED_FIELD_KEYS}
+
+
+class TransactionRepository(SyncableRepository[Transaction]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(
             model=Transaction,
             session=session,
+            record_type=SyncRecordType.TRANSACTION,
+            owner_id=select(Account.user_id).where(Account.id == Transaction.account_id).scalar_subquery(),
         )
 
-    async def get_user_transaction_periods(self, user: User) -> list[tuple[int, int]]:
-        query_result: Result[tuple[int, int]] = await self.session.execute(
+    def is_owned_by(self, user_id: int) -> ColumnElement[bool]:
+        return is_owned_by_user(user_id)
+
+    async def create(self, record_data: dict[str, Any], **additional_attributes: Any) -> Transaction:
+        record_data |= additional_attributes
+
+        await self._shift_aggregates([record_data], sign=1)
+
+        return await super().create(record_data)
+
+    async def update(self, record: Transaction, record_data: dict[str, Any], **additional_attributes: Any) -> Transaction:
+        record_data |= additional_attributes
+        previous_record_data: dict[str, Any] = get_aggregated_data(record)
+
+        await self._shift_aggregates([previous_record_data], sign=-1)
+        await self._shift_aggregates([previous_record_data | record_data], sign=1)
+
+        return await super().update(record, record_data)
+
+    async def update_many(self, records: Sequence[Transaction], records_data: Sequence[dict[str, Any]]) -> list[Transaction]:
+        previous_records_data: list[dict[str, Any]] = [get_aggregated_data(record) for record in records]
+
+        await self._shift_aggregates(previous_records_data, sign=-1)
+        await self._shift_aggregates([
+            previous_record_data | record_data
+            for (previous_record_data, record_data) in zip(previous_records_data, records_data)
+        ], sign=1)
+
+        return await super().update_many(records, records_data)
+
+    async def delete_many(self, records: Sequence[Transaction]) -> None:
+        await self._shift_aggregates([get_aggregated_data(record) for record in records], sign=-1)
+
+        await super().delete_many(records)
+
+    async def detach_categories(self, category_ids: set[int]) -> None:
+        rollup_insertion: Insert = insert(
+            TransactionMonthlyRollup,
+        ).from_select(
+            ['account_id', 'category_id', 'type', 'year', 'month', 'amount_sum', 'transactions_count'],
             select(
-                func.DATE_PART('YEAR', Transaction.due_date),
-                func.DATE_PART('MONTH', Transaction.due_date),
+                TransactionMonthlyRollup.account_id,
+                null(),
+                TransactionMonthlyRollup.type,
+                TransactionMonthlyRollup.year,
+                TransactionMonthlyRollup.month,
+                func.SUM(TransactionMonthlyRollup.amount_sum),
+                func.SUM(TransactionMonthlyRollup.transactions_count),
+            ).where(
+                TransactionMonthlyRollup.category_id.in_(category_ids),
+            ).group_by(
+                TransactionMonthlyRollup.account_id,
+                TransactionMonthlyRollup.type,
+                TransactionMonthlyRollup.year,
+                TransactionMonthlyRollup.month,
+            ),
+        )
+
+        await self.session.execute(
+            rollup_insertion.on_conflict_do_update(
+                constraint='uq_transaction_monthly_rollup_period',
+                set_={
+                    'amount_sum': TransactionMonthlyRollup.amount_sum + rollup_insertion.excluded.amount_sum,
+                    'transactions_count': TransactionMonthlyRollup.transactions_count + rollup_insertion.excluded.transactions_count,
+                },
+            ),
+        )
+        await self.session.execute(
+            delete(
+                TransactionMonthlyRollup,
             ).where(
-                Transaction.account.has(user=user),
+                TransactionMonthlyRollup.category_id.in_(category_ids),
+            ),
+        )
+        await self.session.execute(
+            update(
+                Transaction,
+            ).where(
+                Transaction.category_id.in_(category_ids),
+            ).values(
+                category_id=None,
+            ).execution_options(
+                synchronize_session=False,
+            ),
+        )
+
+    async def rebuild_monthly_rollups(self) -> int:
+        year_part: ColumnElement[int] = cast(func.DATE_PART('YEAR', Transaction.due_date), Integer)
+        month_part: ColumnElement[int] = cast(func.DATE_PART('MONTH', Transaction.due_date), Integer)
+
+        await self.session.execute(
+            delete(TransactionMonthlyRollup),
+        )
+        query_result: CursorResult[Any] = await self.session.execute(
+            insert(
+                TransactionMonthlyRollup,
+            ).from_select(
+                ['account_id', 'category_id', 'type', 'year', 'month', 'amount_sum', 'transactions_count'],
+                select(
+                    Transaction.account_id,
+                    Transaction.category_id,
+                    Transaction.type,
+                    year_part,
+                    month_part,
+                    func.SUM(Transaction.amount),
+                    func.COUNT(Transaction.id),
+                ).group_by(
+                    Transaction.account_id,
+                    Transaction.category_id,
+                    Transaction.type,
+                    year_part,
+                    month_part,
+                ),
             ),
         )
 
-        return list(query_result.unique().all())
+        return query_result.rowcount
 
-    async def get_user_transactions_sum_for_summary_period(
+    async def get_user_transactions_by_month(self, user_id: int, year: int, month: int) -> Sequence[RowMapping]:
+        (month_first_date, next_month_first_date) = get_month_range(year=year, month=month)
+
+        return await self.get_projected_list(
+            is_owned_by_user(user_id),
+            Transaction.due_date >= month_first_date,
+            Transaction.due_date < next_month_first_date,
+            columns=[getattr(Transaction, column_name) for column_name in OUTPUT_COLUMN_NAMES],
+        )
+
+    async def get_user_transactions_page(  # noqa: WPS211
         self,
-        user: User,
-        transactions_type: TransactionType,
-        summary_period_type: SummaryPeriodType,
-    ) -> float:
-        period_conditions: list[ColumnElement[bool]] = []
-        today_date: date = datetime.today().date()
+        user_id: int,
+        limit: int,
+        after: KeysetCursor | None = None,
+        account_id: int | None = None,
+        category_id: int | None = None,
+        transaction_type: TransactionType | None = None,
+        min_amount: float | None = None,
+        max_amount: float | None = None,
+        first_date: date | None = None,
+        last_date: date | None = None,
+    ) -> tuple[list[Transaction], KeysetCursor | None]:
+        equality_filters: list[tuple[InstrumentedAttribute[Any], Any]] = [
+            (Transaction.account_id, account_id),
+            (Transaction.category_id, category_id),
+            (Transaction.type, transaction_type),
+        ]
+        range_filters: list[tuple[InstrumentedAttribute[Any], Any, Any]] = [
+            (Transaction.amount, min_amount, max_amount),
+            (Transaction.due_date, first_date, last_date),
+        ]
+
+        conditions: list[ColumnElement[bool]] = [
+            column == column_value
+            for (column, column_value) in equality_filters
+            if column_value is not None
+        ]
+        conditions += [
+            column >= lower_bound
+            for (column, lower_bound, _) in range_filters
+            if lower_bound is not None
+        ]
+        conditions += [
+            column <= upper_bound
+            for (column, _, upper_bound) in range_filters
+            if upper_bound is not None
+        ]
+
+        return await self.get_page(
+            is_owned_by_user(user_id),
+            *conditions,
+            keyset=TRANSACTION_KEYSET,
+            limit=limit,
+            after=after,
+            is_descending=True,
+        )
+
+    async def stream_user_transactions(self, user_id: int, partition_size: int) -> AsyncIterator[Sequence[RowMapping]]:
+        query_result: AsyncResult[Any] = await self.session.stream(
+            select(
+                *(getattr(Transaction, column_name) for column_name in OUTPUT_COLUMN_NAMES),
+            ).where(
+                is_owned_by_user(user_id),
+            ).order_by(
+                *TRANSACTION_KEYSET,
+            ).execution_options(
+                yield_per=partition_size,
+            ),
+        )
+
+        async for partition in query_result.mappings().partitions():
+            yield partition
+
+    async def get_user_transaction_periods(self, user_id: int) -> list[tuple[int, int]]:
+        query_result: Result[tuple[int, int]] = await self.session.execute(
+            select(
+                TransactionMonthlyRollup.year,
+                TransactionMonthlyRollup.month,
+            ).where(
+                TransactionMonthlyRollup.account_id.in_(select_user_account_ids(user_id)),
+                TransactionMonthlyRollup.transactions_count > 0,
+            ).group_by(
+                TransactionMonthlyRollup.year,
+                TransactionMonthlyRollup.month,
+            ).order_by(
+                TransactionMonthlyRollup.year,
+                TransactionMonthlyRollup.month,
+            ),
+        )
 
-        if summary_period_type in {SummaryPeriodType.CURRENT_YEAR, SummaryPeriodType.CURRENT_MONTH}:
-            period_conditions.append(func.DATE_PART('YEAR', Transaction.due_date) == today_date.year)
+        return list(query_result.tuples().all())
 
-        if summary_period_type is SummaryPeriodType.CURRENT_MONTH:
-            period_conditions.append(func.DATE_PART('MONTH', Transaction.due_date) == today_date.month)
+    async def get_user_summary(self, user_id: int) -> list[tuple[SummaryPeriodType, float, float]]:
+        today_date: date = datetime.today().date()
+        period_conditions: dict[SummaryPeriodType, list[ColumnElement[bool]]] = {
+            SummaryPeriodType.CURRENT_MONTH: [
+                TransactionMonthlyRollup.year == today_date.year,
+                TransactionMonthlyRollup.month == today_date.month,
+            ],
+            SummaryPeriodType.CURRENT_YEAR: [
+                TransactionMonthlyRollup.year == today_date.year,
+            ],
+            SummaryPeriodType.ALL_TIME: [],
+        }
+        summed_transaction_types: tuple[TransactionType, ...] = (TransactionType.INCOME, TransactionType.OUTCOME)
 
-        query_result: Result[tuple[float]] = await self.session.execute(
+        query_result: Result[tuple[float, ...]] = await self.session.execute(
             select(
-                func.SUM(Transaction.amount),
+                *(
+                    func.COALESCE(
+                        func.SUM(TransactionMonthlyRollup.amount_sum).filter(
+                            TransactionMonthlyRollup.type == transaction_type,
+                            *period_conditions[summary_period_type],
+                        ),
+                        0,
+                    )
+                    for summary_period_type in SummaryPeriodType
+                    for transaction_type in summed_transaction_types
+                ),
             ).where(
-                Transaction.account.has(user=user),
-                Transaction.type == transactions_type,
-                *period_conditions,
+                TransactionMonthlyRollup.account_id.in_(select_user_account_ids(user_id)),
+                TransactionMonthlyRollup.type.in_(summed_transaction_types),
             ),
         )
+        sums: tuple[float, ...] = tuple(query_result.one())
 
-        return query_result.scalars().one_or_none() or 0
+        return list(zip(SummaryPeriodType, sums[::2], sums[1::2]))
 
     async def get_user_transaction_sums_by_dates(
         self,
-        user: User,
+        user_id: int,
         transaction_type: TransactionType,
         first_date: date,
         last_date: date,
@@ -75,7 +331,7 @@ class TransactionRepository(BaseRepository[Transaction]):
                 Transaction.due_date.label('date'),
                 func.SUM(Transaction.amount).label('sum'),
             ).where(
-                Transaction.account.has(user=user),
+                is_owned_by_user(user_id),
                 Transaction.type == transaction_type,
                 Transaction.due_date.between(first_date, last_date),
             ).group_by(
@@ -94,7 +350,7 @@ class TransactionRepository(BaseRepository[Transaction]):
 
     async def get_current_month_user_transaction_statistics(
         self,
-        user: User,
+        user_id: int,
         transaction_type: TransactionType,
     ) -> list[tuple[date, float, float]]:
         current_month_query: Subquery = select(
@@ -102,7 +358,7 @@ class TransactionRepository(BaseRepository[Transaction]):
             Transaction.due_date.label('date'),
             func.SUM(Transaction.amount).label('amount'),
         ).where(
-            Transaction.account.has(user=user),
+            is_owned_by_user(user_id),
             Transaction.type == transaction_type,
         ).group_by(
             Transaction.due_date,
@@ -138,3 +394,69 @@ class TransactionRepository(BaseRepository[Transaction]):
             first_date=first_date,
             last_date=last_date,
         )
+
+    async def _insert_many(self, records_data: Sequence[dict[str, Any]], returned_entity: Any) -> list[Any]:
+        await self._shift_aggregates(records_data, sign=1)
+
+        return await super()._insert_many(records_data, returned_entity)
+
+    async def _shift_aggregates(self, transactions_data: Sequence[dict[str, Any]], sign: int) -> None:
+        account_amounts: defaultdict[tuple[int, TransactionType], float] = defaultdict(float)
+        rollup_shifts: defaultdict[tuple[int, int | None, TransactionType, int, int], list[float]] = defaultdict(lambda: [0, 0])
+
+        for transaction_data in transactions_data:
+            amount: float = sign * transaction_data['amount']
+            due_date: date = transaction_data['due_date']
+            rollup_shift: list[float] = rollup_shifts[(
+                transaction_data['account_id'],
+                transaction_data['category_id'],
+                transaction_data['type'],
+                due_date.year,
+                due_date.month,
+            )]
+
+            account_amounts[(transaction_data['account_id'], transaction_data['type'])] += amount
+            rollup_shift[0] += amount
+            rollup_shift[1] += sign
+
+        for (account_id, transaction_type), account_amount in account_amounts.items():
+            account_total: InstrumentedAttribute[float] = ACCOUNT_TOTALS[transaction_type]
+
+            await self.session.execute(
+                update(
+                    Account,
+                ).where(
+                    Account.id == account_id,
+                ).values({
+                    account_total: account_total + account_amount,
+                    Account.version: Account.version,  # Totals are not synced, so the account stays unchanged for clients
+                }).execution_options(
+                    synchronize_session=False,
+                ),
+            )
+
+        rollups_data: list[dict[str, Any]] = [
+            {
+                'account_id': account_id,
+                'category_id': category_id,
+                'type': transaction_type,
+                'year': year,
+                'month': month,
+                'amount_sum': amount_sum,
+                'transactions_count': transactions_count,
+            }
+            for ((account_id, category_id, transaction_type, year, month), (amount_sum, transactions_count)) in rollup_shifts.items()
+        ]
+
+        for batch_start in range(0, len(rollups_data), BATCH_SIZE):
+            rollup_insertion: Insert = insert(TransactionMonthlyRollup).values(rollups_data[batch_start:batch_start + BATCH_SIZE])
+
+            await self.session.execute(
+                rollup_insertion.on_conflict_do_update(
+                    constraint='uq_transaction_monthly_rollup_period',
+                    set_={
+                        'amount_sum': TransactionMonthlyRollup.amount_sum + rollup_insertion.excluded.amount_sum,
+                        'transactions_count': TransactionMonthlyRollup.transactions_count + rollup_insertion.excluded.transactions_count,
+                    },
+                ),
+            )
@@ -1,4 +1,8 @@
+from typing import Sequence
+
+from sqlalchemy import Result, Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
 
 from core.databases.models import User
 
@@ -16,3 +20,28 @@ class UserRepository(BaseRepository[User]):
         return await self.get(
             User.username == username,
         )
+
+    async def get_data_versions(self, *conditions: ColumnElement[bool]) -> Sequence[Row[tuple[int, int]]]:
+        query_result: Result[tuple[int, int]] = await self.session.execute(
+            select(
+                User.id,
+                User.data_version,
+            ).where(
+                *conditions,
+            ).order_by(
+                User.id,
+            ),
+        )
+
+        return query_result.all()
+
+    async def bump_data_version(self, user_id: int) -> None:
+        await self.session.execute(
+            update(
+                User,
+            ).where(
+                User.id == user_id,
+            ).values(
+                data_version=User.data_version + 1,
+            ),
+        )
@@ -1,46 +1,109 @@
-from typing import Any, Awaitable, Generic, Type, TypeVar
+from typing import Any, Awaitable, Generic, Sequence, Type, TypeAlias, TypeVar
 
-from sqlalchemy.engine import Result
+from sqlalchemy.engine import Result, RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import ColumnElement, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql import (
+    ColumnElement,
+    delete,
+    exists,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.sql.elements import Tuple
 
 from core.databases.models.utilities.base import BaseModel
 
 
 Model = TypeVar('Model', bound=BaseModel)
 
+LoadingPlan: TypeAlias = tuple[ORMOption, ...]
+Keyset: TypeAlias = tuple[InstrumentedAttribute[Any], ...]
+KeysetCursor: TypeAlias = tuple[Any, ...]
 
-class SingletonRepositoryMeta(type):
-    _instances: dict['SingletonRepositoryMeta', type] = {}
+BATCH_SIZE: int = 1000
 
-    def __call__(cls, *args: Any, **kwargs: Any) -> type:
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
 
-        return cls._instances[cls]
-
-
-class BaseRepository(Generic[Model], metaclass=SingletonRepositoryMeta):
+class BaseRepository(Generic[Model]):
     def __init__(self, model: Type[Model], session: AsyncSession) -> None:
         self.model = model
         self.session = session
 
-    async def get_list(self, *conditions: ColumnElement[bool]) -> list[Model]:
+    async def get_list(self, *conditions: ColumnElement[bool], loading_plan: LoadingPlan = ()) -> list[Model]:
         query_result: Result[tuple[Model]] = await self.session.execute(
-            select(self.model).where(*conditions),
+            select(self.model).where(*conditions).options(*loading_plan),
         )
 
         return list(query_result.unique().scalars().all())
 
-    async def get(self, *conditions: ColumnElement[bool]) -> Model | None:
+    async def get_projected_list(self, *conditions: ColumnElement[bool], columns: Sequence[ColumnElement[Any]]) -> Sequence[RowMapping]:
+        query_result: Result[Any] = await self.session.execute(
+            select(
+                *columns,
+            ).where(
+                *conditions,
+            ),
+        )
+
+        return query_result.mappings().all()
+
+    async def get(self, *conditions: ColumnElement[bool], loading_plan: LoadingPlan = ()) -> Model | None:
         query_result: Result[tuple[Model]] = await self.session.execute(
-            select(self.model).where(*conditions),
+            select(self.model).where(*conditions).options(*loading_plan),
         )
 
         return query_result.unique().scalars().one_or_none()
 
-    async def get_by_id(self, record_id: int) -> Model | None:
-        return await self.session.get(self.model, record_id)
+    async def get_by_id(self, record_id: int, loading_plan: LoadingPlan = ()) -> Model | None:
+        return await self.session.get(self.model, record_id, options=loading_plan)
+
+    async def get_page(
+        self,
+        *conditions: ColumnElement[bool],
+        keyset: Keyset,
+        limit: int,
+        after: KeysetCursor | None = None,
+        is_descending: bool = False,
+        loading_plan: LoadingPlan = (),
+    ) -> tuple[list[Model], KeysetCursor | None]:
+        if after is not None:
+            keyset_values: Tuple = tuple_(*keyset)
+            cursor_values: Tuple = tuple_(*after, types=[keyset_column.type for keyset_column in keyset])
+
+            conditions += (keyset_values < cursor_values if is_descending else keyset_values > cursor_values,)
+
+        query_result: Result[tuple[Model]] = await self.session.execute(
+            select(
+                self.model,
+            ).where(
+                *conditions,
+            ).order_by(
+                *(keyset_column.desc() if is_descending else keyset_column.asc() for keyset_column in keyset),
+            ).limit(
+                limit + 1,
+            ).options(
+                *loading_plan,
+            ),
+        )
+        records: list[Model] = list(query_result.unique().scalars().all())
+
+        if len(records) <= limit:
+            return (records, None)
+
+        records = records[:limit]
+
+        return (records, tuple(getattr(records[-1], keyset_column.key) for keyset_column in keyset))
+
+    async def exists(self, *conditions: ColumnElement[bool]) -> bool:
+        query_result: Result[tuple[bool]] = await self.session.execute(
+            select(exists().where(*conditions)),
+        )
+
+        return query_result.scalar_one()
 
     async def create(self, record_data: dict[str, Any], **additional_attributes: Any) -> Model:
         record_data |= additional_attributes
@@ -48,11 +111,22 @@ class BaseRepository(Generic[Model], metaclass=SingletonRepositoryMeta):
         record: Model = self.model(**record_data)
 
         self.session.add(record)
-        await self.session.commit()
-        await self.session.refresh(record)
+        await self.session.flush()
 
         return record
 
+    async def create_many(self, records_data: Sequence[dict[str, Any]], **additional_attributes: Any) -> list[Model]:
+        return await self._insert_many(
+            [record_data | additional_attributes for record_data in records_data],
+            returned_entity=self.model,
+        )
+
+    async def insert_many(self, records_data: Sequence[dict[str, Any]], **additional_attributes: Any) -> list[int]:
+        return await self._insert_many(
+            [record_data | additional_attributes for record_data in records_data],
+            returned_entity=self.model.id,
+        )
+
     async def update(self, record: Model, record_data: dict[str, Any], **additional_attributes: Any) -> Model:
         record_data |= additional_attributes
 
@@ -60,11 +134,49 @@ class BaseRepository(Generic[Model], metaclass=SingletonRepositoryMeta):
             setattr(record, field_key, await field_value if isinstance(field_value, Awaitable) else field_value)
 
         self.session.add(record)
-        await self.session.commit()
-        await self.session.refresh(record)
+        await self.session.flush()
 
         return record
 
+    async def update_many(self, records: Sequence[Model], records_data: Sequence[dict[str, Any]]) -> list[Model]:
+        updated_records_data: list[dict[str, Any]] = [
+            {'id': record.id} | record_data
+            for (record, record_data) in zip(records, records_data)
+            if record_data
+        ]
+
+        for batch_start in range(0, len(updated_records_data), BATCH_SIZE):
+            await self.session.execute(
+                update(self.model),
+                updated_records_data[batch_start:batch_start + BATCH_SIZE],
+            )
+
+        for (record, record_data) in zip(records, records_data):
+            for field_key, field_value in record_data.items():
+                set_committed_value(record, field_key, field_value)
+
+        return list(records)
+
     async def delete(self, record: Model) -> None:
         await self.session.delete(record)
-        await self.session.commit()
+        await self.session.flush()
+
+    async def delete_many(self, records: Sequence[Model]) -> None:
+        if not records:
+            return
+
+        await self.session.execute(
+            delete(self.model).where(self.model.id.in_([record.id for record in records])),
+        )
+
+    async def _insert_many(self, records_data: Sequence[dict[str, Any]], returned_entity: Any) -> list[Any]:
+        returned_values: list[Any] = []
+
+        for batch_start in range(0, len(records_data), BATCH_SIZE):
+            query_result: Result[tuple[Any]] = await self.session.execute(
+                insert(self.model).returning(returned_entity),
+                records_data[batch_start:batch_start + BATCH_SIZE],
+            )
+            returned_values += query_result.scalars().all()
+
+        return returned_values
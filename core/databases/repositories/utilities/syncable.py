@@ -0,0 +1,96 @@
+from typing import Any, Sequence, Type
+
+from sqlalchemy import Result, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+from core.databases.models import Tombstone
+from core.databases.models.utilities.syncable import (
+    CURRENT_SNAPSHOT_XMIN,
+    CURRENT_VERSION,
+)
+from core.databases.models.utilities.types import SyncRecordType
+
+from .base import BaseRepository, LoadingPlan, Model
+
+
+async def get_versions_horizon(session: AsyncSession) -> int:
+    """Return the version below which every database transaction is finished & visible to the later queries."""
+
+    query_result: Result[tuple[int]] = await session.execute(
+        select(CURRENT_SNAPSHOT_XMIN),
+    )
+
+    return query_result.scalar_one()
+
+
+class SyncableRepository(BaseRepository[Model]):
+    def __init__(
+        self,
+        model: Type[Model],
+        session: AsyncSession,
+        record_type: SyncRecordType,
+        owner_id: ColumnElement[int],
+    ) -> None:
+        super().__init__(
+            model=model,
+            session=session,
+        )
+
+        self.record_type = record_type
+        self.owner_id = owner_id
+
+    def is_owned_by(self, user_id: int) -> ColumnElement[bool]:
+        return self.owner_id == user_id
+
+    async def get_changes(self, user_id: int, since: int, loading_plan: LoadingPlan = ()) -> list[Model]:
+        return await self.get_list(
+            self.is_owned_by(user_id),
+            self.model.version >= since,
+            loading_plan=loading_plan,
+        )
+
+    async def touch(self, *conditions: ColumnElement[bool]) -> None:
+        await self.session.execute(
+            update(
+                self.model,
+            ).where(
+                *conditions,
+            ).values(
+                version=CURRENT_VERSION,
+            ).execution_options(
+                synchronize_session=False,
+            ),
+        )
+
+    async def delete(self, record: Model) -> None:
+        await self.delete_many([record])
+
+    async def delete_many(self, records: Sequence[Model]) -> None:
+        if not records:
+            return
+
+        await self.bury(self.model.id.in_([record.id for record in records]))
+
+    async def bury(self, *conditions: ColumnElement[bool]) -> None:
+        query_result: Result[tuple[int, int]] = await self.session.execute(
+            delete(
+                self.model,
+            ).where(
+                *conditions,
+            ).returning(
+                self.model.id,
+                self.owner_id,
+            ),
+        )
+        tombstones_data: list[dict[str, Any]] = [
+            {
+                'user_id': user_id,
+                'record_type': self.record_type,
+                'record_id': record_id,
+            }
+            for (record_id, user_id) in query_result.tuples().all()
+        ]
+
+        if tombstones_data:
+            await self.session.execute(insert(Tombstone), tombstones_data)
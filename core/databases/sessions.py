@@ -1,18 +1,73 @@
+from asyncio import gather
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
 
-from core.settings import settings
+from core.settings import Settings, settings
 
 
-postgres_engine: AsyncEngine = create_async_engine(
-    url=settings.POSTGRES_URL,
-)
+HAS_WRITES_KEY: str = 'has_writes'
+
+
+def create_postgres_engine(url: str, engine_settings: Settings) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        pool_size=engine_settings.POSTGRES_POOL_SIZE,
+        max_overflow=engine_settings.POSTGRES_POOL_MAX_OVERFLOW,
+        pool_timeout=engine_settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=engine_settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=engine_settings.POSTGRES_POOL_PRE_PING,
+        connect_args={
+            'prepared_statement_cache_size': engine_settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            'statement_cache_size': engine_settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            'server_settings': {
+                'statement_timeout': str(engine_settings.POSTGRES_STATEMENT_TIMEOUT),
+            },
+        },
+    )
+
+async def warm_up_engine(engine: AsyncEngine, connections_number: int) -> None:
+    connections: list[AsyncConnection] = await gather(*(
+        engine.connect().start()
+        for _ in range(connections_number)
+    ))
+
+    await gather(*(connection.close() for connection in connections))
+
+
+@event.listens_for(Session, 'after_flush')
+def mark_flushed_writes(session: Session, *_: Any) -> None:
+    session.info[HAS_WRITES_KEY] = True
+
+@event.listens_for(Session, 'do_orm_execute')
+def mark_executed_writes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[HAS_WRITES_KEY] = True
+
+
+postgres_engine: AsyncEngine = create_postgres_engine(settings.POSTGRES_URL, settings)
 
 PostgresSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=postgres_engine,
     expire_on_commit=False,
 )
+
+
+postgres_replica_engine: AsyncEngine | None = None
+PostgresReplicaSession: async_sessionmaker[AsyncSession] | None = None
+
+if settings.POSTGRES_REPLICA_URL is not None:
+    postgres_replica_engine = create_postgres_engine(settings.POSTGRES_REPLICA_URL, settings)
+    PostgresReplicaSession = async_sessionmaker(
+        bind=postgres_replica_engine,
+        expire_on_commit=False,
+    )
+
@@ -8,6 +8,25 @@ from pydantic import BaseSettings, PostgresDsn, validator
 class Settings(BaseSettings):
     JWT_ALGORITHM: str
     JWT_ACCESS_SECRET_KEY: str
+    JWT_ACCESS_TOKEN_TTL: int = 900
+    REFRESH_TOKEN_TTL: int = 2592000
+
+    ACCESS_TOKEN_CACHE_SIZE: int = 10000
+    REVOKED_SESSIONS_CACHE_SIZE: int = 100000
+    TREND_CACHE_SIZE: int = 10000
+    TREND_CACHE_MEMORY_SIZE: int = 67108864
+    TREND_CACHE_TTL: int = 300
+    TREND_CACHE_PATH: Path | None = None
+    CACHE_INVALIDATION_CHANNEL: str | None = 'cache_invalidation'
+
+    IMPORT_MAX_SIZE: int = 10485760
+    IMPORT_MAX_ROWS: int = 100000
+
+    PASSWORD_HASHING_TIME_COST: int = 3
+    PASSWORD_HASHING_MEMORY_COST: int = 65536
+    PASSWORD_HASHING_PARALLELISM: int = 4
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_QUEUE_SIZE: int = 32
 
     POSTGRES_DRIVER: str
     POSTGRES_HOST: str
@@ -18,6 +37,17 @@ class Settings(BaseSettings):
 
     POSTGRES_URL: PostgresDsn | None
 
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_POOL_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: int = 30
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_STATEMENT_TIMEOUT: int = 30000
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+
+    POSTGRES_REPLICA_URL: PostgresDsn | None = None
+    POSTGRES_REPLICA_STICKINESS: int = 5
+
     @validator('POSTGRES_URL', pre=True)
     def assemble_postgres_dsn(cls, value: Any, values: dict[str, Any]) -> str:
         if isinstance(value, str):
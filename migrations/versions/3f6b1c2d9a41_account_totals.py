@@ -0,0 +1,50 @@
+"""account totals
+
+Revision ID: 3f6b1c2d9a41
+Revises:
+Create Date: 2026-10-18 19:05:12.481503
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '3f6b1c2d9a41'
+down_revision: str | tuple[str, ...] | None = None
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('account', sa.Column('total_incomes', sa.Float(), server_default='0', nullable=False))
+    op.add_column('account', sa.Column('total_outcomes', sa.Float(), server_default='0', nullable=False))
+    op.add_column('account', sa.Column('total_transfers', sa.Float(), server_default='0', nullable=False))
+    op.add_column('account', sa.Column('current_balance', sa.Float(), sa.Computed('opening_balance + total_incomes - total_outcomes'), nullable=False))
+
+    op.execute(
+        """
+        UPDATE account
+        SET
+            total_incomes = totals.incomes,
+            total_outcomes = totals.outcomes,
+            total_transfers = totals.transfers
+        FROM (
+            SELECT
+                account_id,
+                COALESCE(SUM(amount) FILTER (WHERE type = 'Income'), 0) AS incomes,
+                COALESCE(SUM(amount) FILTER (WHERE type = 'Outcome'), 0) AS outcomes,
+                COALESCE(SUM(amount) FILTER (WHERE type = 'Transfer'), 0) AS transfers
+            FROM transaction
+            GROUP BY account_id
+        ) AS totals
+        WHERE account.id = totals.account_id
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('account', 'current_balance')
+    op.drop_column('account', 'total_transfers')
+    op.drop_column('account', 'total_outcomes')
+    op.drop_column('account', 'total_incomes')
@@ -0,0 +1,59 @@
+"""transaction monthly rollup
+
+Revision ID: 5b7e2f9c3d18
+Revises: c41a9e0f6d27
+Create Date: 2026-10-18 20:12:47.306125
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '5b7e2f9c3d18'
+down_revision: str | tuple[str, ...] | None = 'c41a9e0f6d27'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transaction_monthly_rollup',
+        sa.Column('account_id', sa.BigInteger(), nullable=False),
+        sa.Column('category_id', sa.BigInteger(), nullable=True),
+        sa.Column('type', postgresql.ENUM(name='transactiontype', create_type=False), nullable=False),
+        sa.Column('year', sa.BigInteger(), nullable=False),
+        sa.Column('month', sa.BigInteger(), nullable=False),
+        sa.Column('amount_sum', sa.Float(), nullable=False),
+        sa.Column('transactions_count', sa.BigInteger(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['account.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['category_id'], ['category.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'account_id', 'year', 'month', 'type', 'category_id',
+            name='uq_transaction_monthly_rollup_period',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO transaction_monthly_rollup (account_id, category_id, type, year, month, amount_sum, transactions_count)
+        SELECT
+            account_id,
+            category_id,
+            type,
+            CAST(DATE_PART('YEAR', due_date) AS BIGINT),
+            CAST(DATE_PART('MONTH', due_date) AS BIGINT),
+            SUM(amount),
+            COUNT(id)
+        FROM transaction
+        GROUP BY 1, 2, 3, 4, 5
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('transaction_monthly_rollup')
@@ -0,0 +1,28 @@
+"""transaction date indexes
+
+Revision ID: 8d2e4a7c1b90
+Revises: 3f6b1c2d9a41
+Create Date: 2026-10-18 19:21:40.117290
+
+"""
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = '8d2e4a7c1b90'
+down_revision: str | tuple[str, ...] | None = '3f6b1c2d9a41'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    # Building the indexes concurrently keeps the table writable, which requires running outside of a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_transaction_account_id_due_date', 'transaction', ['account_id', 'due_date'], postgresql_concurrently=True)
+        op.create_index('ix_transaction_account_id_type_due_date', 'transaction', ['account_id', 'type', 'due_date'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transaction_account_id_type_due_date', table_name='transaction', postgresql_concurrently=True)
+        op.drop_index('ix_transaction_account_id_due_date', table_name='transaction', postgresql_concurrently=True)
@@ -0,0 +1,101 @@
+"""sync versions
+
+Revision ID: a4c8e1f2b7d3
+Revises: e93f0d4a2b75
+Create Date: 2026-10-18 22:41:05.518230
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'a4c8e1f2b7d3'
+down_revision: str | tuple[str, ...] | None = 'e93f0d4a2b75'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+SYNCABLE_TABLE_OWNERS: dict[str, str] = {
+    'account': 'user_id',
+    'budget': 'user_id',
+    'category': 'user_id',
+    'transaction': 'account_id',
+}
+CURRENT_VERSION: str = 'pg_current_xact_id()::text::bigint'
+BACKFILL_BATCH_SIZE: int = 10000
+
+
+def upgrade() -> None:
+    # Adding the column without a default & setting the default afterwards only changes the catalog,
+    # while a volatile default would rewrite the tables under an exclusive lock.
+    for table_name in SYNCABLE_TABLE_OWNERS:
+        op.add_column(table_name, sa.Column('version', sa.BigInteger(), nullable=True))
+        op.alter_column(table_name, 'version', server_default=sa.text(CURRENT_VERSION))
+
+    op.create_table(
+        'tombstone',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('record_type', postgresql.ENUM('transaction', 'account', 'category', 'budget', name='syncrecordtype'), nullable=False),
+        sa.Column('record_id', sa.BigInteger(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default=sa.text(CURRENT_VERSION), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    # Every batch commits on its own, so the existing rows are only locked for the time of their batch.
+    with op.get_context().autocommit_block():
+        for table_name, owner_column_name in SYNCABLE_TABLE_OWNERS.items():
+            _backfill_versions(table_name)
+            _set_not_null(table_name, 'version')
+
+            op.create_index(
+                'ix_{0}_{1}_version'.format(table_name, owner_column_name),
+                table_name,
+                [owner_column_name, 'version'],
+                postgresql_concurrently=True,
+            )
+
+        op.create_index('ix_tombstone_user_id_version', 'tombstone', ['user_id', 'version'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tombstone_user_id_version', table_name='tombstone', postgresql_concurrently=True)
+
+        for table_name, owner_column_name in SYNCABLE_TABLE_OWNERS.items():
+            op.drop_index('ix_{0}_{1}_version'.format(table_name, owner_column_name), table_name=table_name, postgresql_concurrently=True)
+
+    op.drop_table('tombstone')
+    op.execute('DROP TYPE syncrecordtype')
+
+    for table_name in SYNCABLE_TABLE_OWNERS:
+        op.drop_column(table_name, 'version')
+
+
+def _backfill_versions(table_name: str) -> None:
+    max_id: int | None = op.get_bind().execute(
+        sa.text('SELECT max(id) FROM "{0}"'.format(table_name)),
+    ).scalar()
+
+    for batch_start in range(0, (max_id or 0) + 1, BACKFILL_BATCH_SIZE):
+        op.execute(
+            sa.text(
+                'UPDATE "{0}" SET version = {1} WHERE id >= :batch_start AND id < :batch_end AND version IS NULL'.format(
+                    table_name,
+                    CURRENT_VERSION,
+                ),
+            ).bindparams(batch_start=batch_start, batch_end=batch_start + BACKFILL_BATCH_SIZE),
+        )
+
+
+def _set_not_null(table_name: str, column_name: str) -> None:
+    # A validated check constraint lets `SET NOT NULL` skip the scan, & validating it does not block the writes
+    constraint_name: str = 'ck_{0}_{1}_not_null'.format(table_name, column_name)
+
+    op.execute('ALTER TABLE "{0}" ADD CONSTRAINT {1} CHECK ({2} IS NOT NULL) NOT VALID'.format(table_name, constraint_name, column_name))
+    op.execute('ALTER TABLE "{0}" VALIDATE CONSTRAINT {1}'.format(table_name, constraint_name))
+    op.alter_column(table_name, column_name, nullable=False)
+    op.drop_constraint(constraint_name, table_name)
@@ -0,0 +1,24 @@
+"""user data versions
+
+Revision ID: b7d2f4a9c6e1
+Revises: a4c8e1f2b7d3
+Create Date: 2026-10-18 23:37:12.804416
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'b7d2f4a9c6e1'
+down_revision: str | tuple[str, ...] | None = 'a4c8e1f2b7d3'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'data_version')
@@ -0,0 +1,25 @@
+"""account user index
+
+Revision ID: c41a9e0f6d27
+Revises: 8d2e4a7c1b90
+Create Date: 2026-10-18 19:34:02.559814
+
+"""
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'c41a9e0f6d27'
+down_revision: str | tuple[str, ...] | None = '8d2e4a7c1b90'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_account_user_id', 'account', ['user_id'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_account_user_id', table_name='account', postgresql_concurrently=True)
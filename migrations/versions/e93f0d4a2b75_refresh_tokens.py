@@ -0,0 +1,39 @@
+"""refresh tokens
+
+Revision ID: e93f0d4a2b75
+Revises: 5b7e2f9c3d18
+Create Date: 2026-10-18 21:03:18.220417
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# Revision identifiers, used by Alembic
+revision: str | tuple[str, ...] | None = 'e93f0d4a2b75'
+down_revision: str | tuple[str, ...] | None = '5b7e2f9c3d18'
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'refresh_token',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('session_key', sa.String(length=32), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('token_hash'),
+    )
+    op.create_index(op.f('ix_refresh_token_session_key'), 'refresh_token', ['session_key'], unique=False)
+    op.create_index(op.f('ix_refresh_token_user_id'), 'refresh_token', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_refresh_token_user_id'), table_name='refresh_token')
+    op.drop_index(op.f('ix_refresh_token_session_key'), table_name='refresh_token')
+    op.drop_table('refresh_token')
@@ -4,12 +4,15 @@ from typing import AsyncIterator
 
 from httpx import AsyncClient
 from pytest import fixture
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import backend
 from app.dependencies.sessions import define_postgres_session
 from app.dependencies.user import identify_user
+from app.utilities.caching import trend_responses
 
 from .mock.databases import (
+    TestPostgresSession,
     create_database,
     create_database_tables,
     drop_database,
@@ -17,12 +20,14 @@ from .mock.databases import (
 from .mock.dependencies import define_test_postgres_session, identify_test_user
 
 
-@fixture(scope='session', autouse=True)
+@fixture(scope='module', autouse=True)
 async def manage_database() -> AsyncIterator[None]:
     await drop_database()
     await create_database()
     await create_database_tables()
 
+    await trend_responses.backend.clear()  # User data versions restart together with the database
+
     yield
 
     await drop_database()
@@ -42,6 +47,12 @@ async def test_client() -> AsyncIterator[AsyncClient]:
         yield api_test_client
 
 
+@fixture
+async def test_session() -> AsyncIterator[AsyncSession]:
+    async with TestPostgresSession() as test_postgres_session:
+        yield test_postgres_session
+
+
 @fixture(scope='session')
 def current_month_days_number() -> int:
     today_date: date = datetime.today().date()
@@ -11,6 +11,10 @@ from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import insert, text
 
 from core.databases.models.utilities.base import BaseModel
+from core.databases.repositories import (
+    AccountRepository,
+    TransactionRepository,
+)
 
 from .settings import test_settings
 from .utilities.callables import get_records_data_from_json
@@ -39,7 +43,7 @@ TestPostgresSession: async_sessionmaker[AsyncSession] = async_sessionmaker(
 )
 
 
-async def create_database() -> None:
+async def create_database(database_name: str = test_settings.POSTGRES_DATABASE) -> None:
     engine: AsyncEngine = create_async_engine(
         url=_POSTGRES_DEFAULT_DATABASE_URL,
         isolation_level='AUTOCOMMIT',
@@ -48,14 +52,14 @@ async def create_database() -> None:
     async with engine.connect() as database_connection:
         await database_connection.execute(
             text('CREATE DATABASE "{database_name}"'.format(
-                database_name=test_settings.POSTGRES_DATABASE,
+                database_name=database_name,
             )),
         )
 
     await engine.dispose()
 
 
-async def drop_database() -> None:
+async def drop_database(database_name: str = test_settings.POSTGRES_DATABASE) -> None:
     engine: AsyncEngine = create_async_engine(
         url=_POSTGRES_DEFAULT_DATABASE_URL,
         isolation_level='AUTOCOMMIT',
@@ -64,7 +68,7 @@ async def drop_database() -> None:
     async with engine.connect() as database_connection:
         await database_connection.execute(
             text('DROP DATABASE IF EXISTS "{database_name}" WITH (FORCE)'.format(
-                database_name=test_settings.POSTGRES_DATABASE,
+                database_name=database_name,
             )),
         )
 
@@ -94,4 +98,12 @@ async def create_database_tables() -> None:
                 )),
             )
 
+    async with TestPostgresSession() as session:
+        account_repository: AccountRepository = AccountRepository(session=session)
+        transaction_repository: TransactionRepository = TransactionRepository(session=session)
+
+        await account_repository.reconcile_totals()
+        await transaction_repository.rebuild_monthly_rollups()
+        await session.commit()
+
     await engine.dispose()
@@ -1,26 +1,37 @@
 from typing import AsyncIterator
 
-from fastapi import Depends, Header
+from fastapi import Depends, Header, Request
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.sessions import define_postgres_session
+from app.schemas.authentication import PrincipalData
 from core.databases.models import User
 
 from .databases import TestPostgresSession
 
 
-async def define_test_postgres_session() -> AsyncIterator[AsyncSession]:
+async def define_test_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:
     async with TestPostgresSession() as test_postgres_session:
+        request.state.postgres_session = test_postgres_session
+
         yield test_postgres_session
 
 
 async def identify_test_user(
+    request: Request,
     session: AsyncSession = Depends(define_postgres_session),
     test_username: str = Header(default='test-user'),
-) -> User:
+) -> PrincipalData:
     query_result: Result[tuple[User]] = await session.execute(
         select(User).where(User.username == test_username),
     )
+    user: User = query_result.unique().scalars().one()
+
+    request.state.current_user = PrincipalData(
+        id=user.id,
+        family_id=user.family_id,
+        username=user.username,
+    )
 
-    return query_result.unique().scalars().one()
+    return request.state.current_user
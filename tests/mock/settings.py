@@ -2,3 +2,4 @@ from core.settings import Settings
 
 
 test_settings: Settings = Settings(_env_file='configurations/.test.env')
+test_replica_settings: Settings = Settings(_env_file='configurations/.test.env', POSTGRES_DATABASE='test_budget_replica')
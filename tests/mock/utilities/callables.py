@@ -1,6 +1,10 @@
 from datetime import datetime
 from json import load as load_from_json
-from typing import Any
+from typing import Any, Awaitable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from .constants import GENERIC_JSON_FILE_PATH
 
@@ -24,3 +28,27 @@ def get_records_data_from_json(file_name: str) -> list[dict[str, Any]]:
             record_data_list.append(record_data)
 
     return record_data_list
+
+
+async def get_query_plan(session: AsyncSession, query_awaitable: Awaitable[Any]) -> str:
+    """Run the awaitable & return the plan of the last SQL statement it emitted, with sequential scans disabled."""
+
+    recorded_statements: list[tuple[str, Any]] = []
+
+    def record_statement(connection: Connection, cursor: Any, statement: str, parameters: Any, *_: Any) -> None:
+        recorded_statements.append((statement, parameters))
+
+    event.listen(session.get_bind(), 'before_cursor_execute', record_statement)
+
+    try:
+        await query_awaitable
+    finally:
+        event.remove(session.get_bind(), 'before_cursor_execute', record_statement)
+
+    (statement, parameters) = recorded_statements[-1]
+    connection: AsyncConnection = await session.connection()
+
+    await connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+    query_plan_rows: Any = await connection.exec_driver_sql('EXPLAIN {0}'.format(statement), parameters)
+
+    return '\n'.join(query_plan_row[0] for query_plan_row in query_plan_rows)
@@ -0,0 +1,105 @@
+from datetime import date
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from pytest import MonkeyPatch, mark
+from sqlalchemy import event
+
+from app.utilities.caching import ResponseCache, trend_responses
+from core.caches import MemoryCache
+from core.databases.models.utilities.types import TransactionType
+from tests.mock.databases import test_postgres_engine
+
+
+def get_summary_incomes(response: Response) -> float:
+    return sum(period_summary['incomes'] for period_summary in response.json())
+
+
+@mark.anyio
+async def test_trends_are_computed_once_per_data_version(test_client: AsyncClient) -> None:
+    executed_statements: list[str] = []
+
+    def record_statement(*arguments: Any) -> None:  # noqa: WPS430
+        executed_statements.append(arguments[2])
+
+    response: Response = await test_client.get('/trend/summary')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    summary: list[dict[str, Any]] = response.json()
+    initial_hits: int = trend_responses.hits
+
+    event.listen(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    try:
+        response = await test_client.get('/trend/summary')
+    finally:
+        event.remove(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == summary
+    assert response.headers['ETag']
+    assert trend_responses.hits == initial_hits + 1
+    assert trend_responses.memory_size > 0
+    assert not any('FROM transaction' in statement for statement in executed_statements)
+
+    response = await test_client.post('/transaction/create', json={
+        'account_id': 1,
+        'category_id': 1,
+        'type': TransactionType.INCOME.value,
+        'due_date': date.today().isoformat(),
+        'due_time': '10:40:00',
+        'amount': 100,
+    })
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+    response = await test_client.get('/trend/summary')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert get_summary_incomes(response) == sum(period_summary['incomes'] for period_summary in summary) + 300
+    assert trend_responses.hits == initial_hits + 1
+
+
+@mark.anyio
+async def test_shared_backend_serves_current_data_versions(test_client: AsyncClient, monkeypatch: MonkeyPatch) -> None:
+    shared_backend: MemoryCache[str, bytes] = MemoryCache(max_size=100, time_to_live=60)
+    other_worker_responses: ResponseCache = ResponseCache(backend=shared_backend)
+
+    monkeypatch.setattr(trend_responses, 'backend', shared_backend)
+
+    response: Response = await test_client.get('/trend/current-month')
+    request_key: str = '/trend/current-month?[]#{0}'.format(response.headers['ETag'])
+
+    assert await other_worker_responses.get(1, request_key) == response.content
+
+    response = await test_client.get('/transaction/list', params={'year': date.today().year, 'month': date.today().month})
+    transaction: dict[str, Any] = response.json()[0]
+
+    response = await test_client.delete('/transaction/delete', params={'id': transaction['id']})
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    response = await test_client.get('/trend/current-month')
+    next_request_key: str = '/trend/current-month?[]#{0}'.format(response.headers['ETag'])
+
+    assert next_request_key != request_key
+    assert await other_worker_responses.get(1, next_request_key) == response.content
+
+
+@mark.anyio
+async def test_memory_cache_is_bounded_by_memory_size() -> None:
+    memory_cache: MemoryCache[str, bytes] = MemoryCache(max_size=100, time_to_live=60, max_memory_size=1000)
+
+    await memory_cache.set('first', bytes(400))
+    await memory_cache.set('second', bytes(400))
+
+    assert await memory_cache.get('first') is not None
+
+    await memory_cache.set('third', bytes(400))
+
+    assert await memory_cache.get('second') is None
+    assert await memory_cache.get('first') is not None
+    assert memory_cache.memory_size <= 1000
+    assert memory_cache.hit_rate == 2 / 3
@@ -0,0 +1,193 @@
+from asyncio import gather
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import Request, status
+from httpx import AsyncClient, Response
+from pytest import MonkeyPatch, fixture, mark
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import NullPool
+
+from app import backend
+from app.dependencies.sessions import (
+    RECENT_WRITE_COOKIE,
+    define_postgres_session,
+)
+from core.databases.models.utilities.base import BaseModel
+from core.databases.models.utilities.types import CurrencyType, TransactionType
+from tests.mock.databases import (
+    create_database,
+    drop_database,
+    test_postgres_engine,
+)
+from tests.mock.settings import test_replica_settings, test_settings
+
+
+PARALLEL_REQUESTS_NUMBER: int = 200
+
+
+class RecordedSession(Session):
+    pass
+
+
+@fixture
+async def empty_replica(monkeypatch: MonkeyPatch) -> AsyncIterator[None]:
+    await drop_database(test_replica_settings.POSTGRES_DATABASE)
+    await create_database(test_replica_settings.POSTGRES_DATABASE)
+
+    engine: AsyncEngine = create_async_engine(
+        url=test_replica_settings.POSTGRES_URL,
+        poolclass=NullPool,
+    )
+
+    async with engine.begin() as database_connection:
+        await database_connection.run_sync(BaseModel.metadata.create_all)
+
+    monkeypatch.setattr('app.dependencies.sessions.PostgresReplicaSession', async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+    ))
+
+    yield
+
+    await engine.dispose()
+    await drop_database(test_replica_settings.POSTGRES_DATABASE)
+
+
+@mark.anyio
+async def test_parallel_requests_use_own_sessions(test_client: AsyncClient) -> None:
+    engine: AsyncEngine = create_async_engine(
+        url=test_settings.POSTGRES_URL,
+        pool_size=10,
+        max_overflow=0,
+    )
+    recorded_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        sync_session_class=RecordedSession,
+    )
+
+    provided_sessions: list[Session] = []
+    queried_table_names: defaultdict[Session, set[str]] = defaultdict(set)
+
+    async def define_recorded_postgres_session(request: Request) -> AsyncIterator[AsyncSession]:  # noqa: WPS430
+        async with recorded_session_maker() as recorded_session:
+            request.state.postgres_session = recorded_session
+            provided_sessions.append(recorded_session.sync_session)
+
+            yield recorded_session
+
+    @event.listens_for(RecordedSession, 'do_orm_execute')
+    def record_queried_tables(orm_execute_state: ORMExecuteState) -> None:  # noqa: WPS430
+        queried_table_names[orm_execute_state.session] |= {
+            mapper.local_table.name
+            for mapper in orm_execute_state.all_mappers
+        }
+
+    overridden_session_dependency: Callable[[], AsyncIterator[AsyncSession]] = backend.dependency_overrides[define_postgres_session]
+    backend.dependency_overrides[define_postgres_session] = define_recorded_postgres_session
+
+    try:
+        responses: list[Response] = await gather(*(
+            test_client.get('/account/list')
+            for _ in range(PARALLEL_REQUESTS_NUMBER)
+        ))
+    finally:
+        backend.dependency_overrides[define_postgres_session] = overridden_session_dependency
+        event.remove(RecordedSession, 'do_orm_execute', record_queried_tables)
+
+        await engine.dispose()
+
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+    assert len(set(provided_sessions)) == PARALLEL_REQUESTS_NUMBER
+    assert all('account' in queried_table_names[provided_session] for provided_session in provided_sessions)
+
+
+@mark.anyio
+async def test_write_request_uses_one_connection_and_one_commit(test_client: AsyncClient) -> None:
+    checkouts_number: int = 0
+    commits_number: int = 0
+    executed_statements: list[str] = []
+
+    def record_checkout(*_: Any) -> None:  # noqa: WPS430
+        nonlocal checkouts_number
+        checkouts_number += 1
+
+    def record_commit(*_: Any) -> None:  # noqa: WPS430
+        nonlocal commits_number
+        commits_number += 1
+
+    def record_statement(*arguments: Any) -> None:  # noqa: WPS430
+        executed_statements.append(arguments[2])
+
+    event.listen(test_postgres_engine.sync_engine, 'checkout', record_checkout)
+    event.listen(test_postgres_engine.sync_engine, 'commit', record_commit)
+    event.listen(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    try:
+        response: Response = await test_client.post('/transaction/create', json={
+            'account_id': 1,
+            'category_id': 1,
+            'type': TransactionType.INCOME.value,
+            'due_date': '2022-12-12',
+            'due_time': '10:40:00',
+            'amount': 100,
+        })
+    finally:
+        event.remove(test_postgres_engine.sync_engine, 'checkout', record_checkout)
+        event.remove(test_postgres_engine.sync_engine, 'commit', record_commit)
+        event.remove(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    insertion_index: int = next(
+        statement_index
+        for statement_index, statement in enumerate(executed_statements)
+        if statement.startswith('INSERT INTO transaction ')
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert checkouts_number == 1
+    assert commits_number == 1
+    assert not any(statement.startswith('SELECT') for statement in executed_statements[insertion_index:])
+
+    response = await test_client.get('/transaction/item', params={'id': response.json()['id']})
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+
+@mark.anyio
+@mark.usefixtures('empty_replica')
+async def test_reads_are_routed_to_replica_until_write(test_client: AsyncClient) -> None:
+    test_client.cookies.clear()
+
+    response: Response = await test_client.get('/account/list')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert not response.json()
+
+    response = await test_client.post('/account/create', json={
+        'name': 'Test Account Name',
+        'currency': CurrencyType.RUB.value,
+        'opening_balance': 0,
+    })
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    assert RECENT_WRITE_COOKIE in test_client.cookies
+
+    response = await test_client.get('/account/list')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()
+
+    test_client.cookies.clear()
+
+    response = await test_client.get('/account/list')
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert not response.json()
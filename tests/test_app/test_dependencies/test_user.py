@@ -0,0 +1,120 @@
+from asyncio import sleep
+from typing import AsyncIterator
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from pytest import MonkeyPatch, fixture, mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import backend
+from app.dependencies.user import identify_user
+from app.utilities.security.jwt import (
+    REVOKED_SESSIONS_TOPIC,
+    access_token_payloads,
+    revoked_session_keys,
+    subscribe_to_session_revocations,
+)
+from app.utilities.security.refresh_tokens import hash_refresh_token
+from core.caches import PostgresBroadcaster
+from core.databases.models import RefreshToken
+from core.databases.repositories import RefreshTokenRepository
+from tests.mock.settings import test_settings
+
+
+NOTIFICATION_DELAY: float = 0.1
+
+
+@fixture
+async def unmocked_identification() -> AsyncIterator[None]:
+    overridden_identification: object = backend.dependency_overrides.pop(identify_user)
+
+    yield
+
+    backend.dependency_overrides[identify_user] = overridden_identification
+
+
+@mark.anyio
+@mark.usefixtures('unmocked_identification')
+async def test_access_token_verification_is_cached_until_revocation(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+    access_token: str = response.json()['access_token']
+    refresh_token: str = response.json()['refresh_token']
+
+    authorization_headers: dict[str, str] = {
+        'Authorization': 'Bearer {0}'.format(access_token),
+    }
+    initial_hits: int = access_token_payloads.hits
+
+    response = await test_client.get('/user/current', headers=authorization_headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert access_token_payloads.hits == initial_hits
+
+    response = await test_client.get('/user/current', headers=authorization_headers)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json().get('username') == 'test-user'
+    assert access_token_payloads.hits == initial_hits + 1
+
+    response = await test_client.post('/sign-out', json={
+        'refresh_token': refresh_token,
+    })
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    response = await test_client.get('/user/current', headers=authorization_headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+    await access_token_payloads.clear()
+    await revoked_session_keys.clear()
+
+    response = await test_client.get('/user/current', headers=authorization_headers)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+
+@mark.anyio
+@mark.usefixtures('unmocked_identification')
+async def test_access_tokens_of_sessions_revoked_by_other_workers_are_rejected(
+    test_client: AsyncClient,
+    test_session: AsyncSession,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    this_worker_invalidations: PostgresBroadcaster = PostgresBroadcaster(url=str(test_settings.POSTGRES_URL), channel='test_revocation')
+    other_worker_invalidations: PostgresBroadcaster = PostgresBroadcaster(url=str(test_settings.POSTGRES_URL), channel='test_revocation')
+
+    monkeypatch.setattr('app.utilities.security.jwt.cache_invalidations', this_worker_invalidations)
+
+    await subscribe_to_session_revocations()
+
+    try:
+        response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+        authorization_headers: dict[str, str] = {
+            'Authorization': 'Bearer {0}'.format(response.json()['access_token']),
+        }
+        refresh_token_repository: RefreshTokenRepository = RefreshTokenRepository(session=test_session)
+        refresh_token: RefreshToken | None = await refresh_token_repository.get_by_token_hash_for_update(
+            hash_refresh_token(response.json()['refresh_token']),
+        )
+
+        assert refresh_token is not None
+
+        response = await test_client.get('/user/current', headers=authorization_headers)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+        await refresh_token_repository.revoke_session(refresh_token.session_key)
+        await other_worker_invalidations.publish(test_session, REVOKED_SESSIONS_TOPIC, [refresh_token.session_key])
+        await test_session.commit()
+        await sleep(NOTIFICATION_DELAY)
+
+        initial_hits: int = access_token_payloads.hits
+
+        response = await test_client.get('/user/current', headers=authorization_headers)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+        assert access_token_payloads.hits == initial_hits + 1
+    finally:
+        await this_worker_invalidations.close()
+        await other_worker_invalidations.close()
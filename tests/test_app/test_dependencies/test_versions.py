@@ -0,0 +1,115 @@
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from pytest import mark, param
+from sqlalchemy import event
+
+from core.databases.models.utilities.types import BudgetType, CurrencyType
+from tests.mock.databases import test_postgres_engine
+
+
+async def create_account(test_client: AsyncClient, test_username: str) -> None:
+    response: Response = await test_client.post(
+        url='/account/create',
+        headers={
+            'test-username': test_username,
+        },
+        json={
+            'name': 'Test Account Name',
+            'currency': CurrencyType.RUB.value,
+            'opening_balance': 0,
+        },
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+
+
+@mark.parametrize('endpoint, params', (
+    param('/account/list', {}, id='accounts'),
+    param('/category/list', {}, id='categories'),
+    param('/budget/list', {'type': BudgetType.JOINT.value}, id='joint_budgets'),
+    param('/transaction/periods', {}, id='periods'),
+    param('/trend/summary', {}, id='trend_summary'),
+))
+@mark.anyio
+async def test_unchanged_data_is_not_queried_again(
+    test_client: AsyncClient,
+    endpoint: str,
+    params: dict[str, str],
+) -> None:
+    executed_statements: list[str] = []
+
+    def record_statement(*arguments: Any) -> None:  # noqa: WPS430
+        executed_statements.append(arguments[2])
+
+    response: Response = await test_client.get(endpoint, params=params)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+
+    etag: str = response.headers['ETag']
+
+    event.listen(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    try:
+        response = await test_client.get(endpoint, params=params, headers={
+            'If-None-Match': etag,
+        })
+    finally:
+        event.remove(test_postgres_engine.sync_engine, 'before_cursor_execute', record_statement)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response.text
+    assert response.headers['ETag'] == etag
+    assert not response.content
+    assert all('FROM "user" \n' in statement for statement in executed_statements)
+
+
+@mark.anyio
+async def test_writes_change_user_data_version(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/account/list')
+    etag: str = response.headers['ETag']
+
+    response = await test_client.get('/account/list')
+
+    assert response.headers['ETag'] == etag
+
+    await create_account(test_client, 'test-user')
+
+    response = await test_client.get('/account/list', headers={
+        'If-None-Match': '"unknown", {0}'.format(etag),
+    })
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers['ETag'] != etag
+
+    response = await test_client.get('/account/list', headers={
+        'If-None-Match': response.headers['ETag'],
+    })
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response.text
+
+
+@mark.anyio
+async def test_family_writes_change_joint_budgets_version(test_client: AsyncClient) -> None:
+    response: Response = await test_client.get('/account/list')
+    accounts_etag: str = response.headers['ETag']
+
+    response = await test_client.get('/budget/list', params={'type': BudgetType.JOINT.value})
+    budgets_etag: str = response.headers['ETag']
+
+    await create_account(test_client, 'not-family-member')
+
+    response = await test_client.get('/budget/list', params={'type': BudgetType.JOINT.value})
+
+    assert response.headers['ETag'] == budgets_etag
+
+    await create_account(test_client, 'family-member')
+
+    response = await test_client.get('/account/list')
+
+    assert response.headers['ETag'] == accounts_etag
+
+    response = await test_client.get('/budget/list', params={'type': BudgetType.JOINT.value})
+
+    assert response.headers['ETag'] != budgets_etag
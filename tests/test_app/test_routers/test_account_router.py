@@ -1,9 +1,12 @@
+from json import dumps
 from typing import Any
 
 from fastapi import status
+from fastapi.encoders import jsonable_encoder
 from httpx import AsyncClient, Response
 from pytest import mark, param
 
+from app.schemas.account import AccountOutputData
 from core.databases.models.utilities.types import CurrencyType
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
@@ -15,8 +18,20 @@ async def test_get_balances(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/account/balances')
 
     assert response.status_code == status.HTTP_200_OK, response.text
-    assert isinstance(response.json(), list)
-    assert response.json()
+    assert response.json() == [
+        {
+            'account': 'Account 1',
+            'balance': 100,
+        },
+        {
+            'account': 'Account 2',
+            'balance': 0,
+        },
+        {
+            'account': 'Account 3',
+            'balance': 0,
+        },
+    ]
 
 @mark.anyio
 async def test_get_accounts(test_client: AsyncClient) -> None:
@@ -26,6 +41,12 @@ async def test_get_accounts(test_client: AsyncClient) -> None:
     assert isinstance(response.json(), list)
     assert response.json()
 
+    # Serialized again, as `0 == 0.0` would hide a listed value of another JSON type than the response model gives
+    assert all(
+        dumps(account, sort_keys=True) == dumps(jsonable_encoder(AccountOutputData.parse_obj(account)), sort_keys=True)
+        for account in response.json()
+    )
+
 
 class TestCreateAccount(RouterEndpointBaseTestClass, http_method='POST', endpoint='/account/create'):
     @mark.parametrize('test_data, expected_data', (
@@ -258,3 +279,93 @@ class TestDeleteAccount(RouterEndpointBaseTestClass, http_method='DELETE', endpo
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+class TestBatchAccounts(RouterEndpointBaseTestClass, http_method='POST', endpoint='/account/batch'):
+    @mark.anyio
+    async def test_with_correct_data(self, test_client: AsyncClient) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data={
+                'create': [
+                    {
+                        'name': 'Batch Account',
+                        'currency': CurrencyType.USD.value,
+                    },
+                ],
+                'update': [
+                    {
+                        'id': 2,
+                        'name': 'Renamed Account',
+                    },
+                ],
+                'delete': [3],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [account['name'] for account in response.json()['created']] == ['Batch Account']
+        assert response.json()['updated'] == [
+            {
+                'id': 2,
+                'name': 'Renamed Account',
+                'currency': CurrencyType.RUB.value,
+                'opening_balance': 0,
+            },
+        ]
+        assert response.json()['deleted'] == [3]
+
+        response = await test_client.get('/account/list')
+        account_names: dict[int, str] = {account['id']: account['name'] for account in response.json()}
+
+        assert account_names[2] == 'Renamed Account'
+        assert 'Batch Account' in account_names.values()
+        assert 3 not in account_names
+
+    @mark.parametrize('test_data, expected_status_code', (
+        param(
+            {
+                'update': [
+                    {
+                        'id': 4,
+                        'name': 'Foreign Account',
+                    },
+                ],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='foreign_id',
+        ),
+        param(
+            {
+                'delete': [999999],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='non_existing_id',
+        ),
+        param(
+            {
+                'update': [
+                    {
+                        'id': 2,
+                        'name': 'Renamed Account',
+                    },
+                ],
+                'delete': [2],
+            },
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            id='repeated_id',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_data: dict[str, Any],
+        expected_status_code: int,
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data=test_data,
+        )
+
+        assert response.status_code == expected_status_code, response.text
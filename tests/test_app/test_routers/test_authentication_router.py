@@ -1,9 +1,15 @@
+from asyncio import Semaphore
 from typing import Any
 
+from argon2 import PasswordHasher
 from fastapi import status
 from httpx import AsyncClient, Response
-from pytest import mark, param
+from pytest import MonkeyPatch, mark, param
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.databases.models import User
+from core.settings import settings
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
@@ -143,3 +149,122 @@ class TestSignIn(RouterEndpointBaseTestClass, http_method='GET', endpoint='/sign
         )
 
         assert response.status_code == expected_status_code, response.text
+
+    @mark.anyio
+    async def test_with_outdated_password_hash(
+        self,
+        test_client: AsyncClient,
+        test_session: AsyncSession,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr('app.utilities.security.passwords.password_hasher', PasswordHasher(
+            time_cost=settings.PASSWORD_HASHING_TIME_COST + 1,
+            memory_cost=settings.PASSWORD_HASHING_MEMORY_COST,
+            parallelism=settings.PASSWORD_HASHING_PARALLELISM,
+        ))
+
+        response: Response = await self.request(
+            test_client=test_client,
+            test_credentials=('family-member', 'test-password'),
+        )
+        password_hash: str = await test_session.scalar(
+            select(User.password).where(User.username == 'family-member'),
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert 't={0},'.format(settings.PASSWORD_HASHING_TIME_COST + 1) in password_hash
+
+    @mark.anyio
+    async def test_with_overloaded_password_hashing(
+        self,
+        test_client: AsyncClient,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr('app.utilities.security.passwords._password_hashing_slots', Semaphore(0))
+
+        response: Response = await self.request(
+            test_client=test_client,
+            test_credentials=('test-user', 'test-password'),
+        )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE, response.text
+
+
+class TestRefresh(RouterEndpointBaseTestClass, http_method='POST', endpoint='/refresh'):
+    @mark.anyio
+    async def test_with_rotated_token(self, test_client: AsyncClient) -> None:
+        response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+        refresh_token: str = response.json()['refresh_token']
+
+        response = await self.request(
+            test_client=test_client,
+            test_data={
+                'refresh_token': refresh_token,
+            },
+        )
+        rotated_refresh_token: str = response.json()['refresh_token']
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json().get('user').get('username') == 'test-user'
+        assert rotated_refresh_token != refresh_token
+
+        response = await self.request(
+            test_client=test_client,
+            test_data={
+                'refresh_token': refresh_token,
+            },
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+        response = await self.request(
+            test_client=test_client,
+            test_data={
+                'refresh_token': rotated_refresh_token,
+            },
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+    @mark.parametrize('test_refresh_token', (
+        param(
+            'non-existing-token',
+            id='non_existing_token',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_refresh_token: str,
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data={
+                'refresh_token': test_refresh_token,
+            },
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+
+class TestSignOut(RouterEndpointBaseTestClass, http_method='POST', endpoint='/sign-out'):
+    @mark.anyio
+    async def test_with_correct_data(self, test_client: AsyncClient) -> None:
+        response: Response = await test_client.get('/sign-in', auth=('test-user', 'test-password'))
+        refresh_token: str = response.json()['refresh_token']
+
+        response = await self.request(
+            test_client=test_client,
+            test_data={
+                'refresh_token': refresh_token,
+            },
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+        response = await test_client.post('/refresh', json={
+            'refresh_token': refresh_token,
+        })
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
@@ -320,3 +320,87 @@ class TestDeleteCategory(RouterEndpointBaseTestClass, http_method='DELETE', endp
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+class TestBatchCategories(RouterEndpointBaseTestClass, http_method='POST', endpoint='/category/batch'):
+    @mark.anyio
+    async def test_with_correct_data(self, test_client: AsyncClient) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data={
+                'create': [
+                    {
+                        'base_category_id': 3,
+                        'name': 'Batch Subcategory',
+                        'type': CategoryType.OUTCOME.value,
+                    },
+                ],
+                'update': [
+                    {
+                        'id': 4,
+                        'name': 'Renamed Category',
+                    },
+                ],
+                'delete': [2],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [category['base_category_id'] for category in response.json()['created']] == [3]
+        assert [category['name'] for category in response.json()['updated']] == ['Renamed Category']
+        assert response.json()['deleted'] == [2]
+
+        response = await test_client.get('/category/list')
+        category_names: dict[int, str] = {category['id']: category['name'] for category in response.json()}
+
+        assert category_names[4] == 'Renamed Category'
+        assert 'Batch Subcategory' in category_names.values()
+        assert 2 not in category_names
+
+    @mark.parametrize('test_data, expected_status_code', (
+        param(
+            {
+                'create': [
+                    {
+                        'base_category_id': 5,
+                        'name': 'Foreign Subcategory',
+                        'type': CategoryType.INCOME.value,
+                    },
+                ],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='foreign_base_category_id',
+        ),
+        param(
+            {
+                'update': [
+                    {
+                        'id': 6,
+                        'name': 'Foreign Category',
+                    },
+                ],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='foreign_id',
+        ),
+        param(
+            {
+                'delete': [4, 4],
+            },
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            id='repeated_id',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_data: dict[str, Any],
+        expected_status_code: int,
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data=test_data,
+        )
+
+        assert response.status_code == expected_status_code, response.text
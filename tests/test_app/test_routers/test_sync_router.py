@@ -0,0 +1,112 @@
+from datetime import date, time
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from pytest import mark
+
+from core.databases.models import Transaction
+from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import TransactionRepository
+from tests.mock.databases import TestPostgresSession
+
+
+async def get_changes(test_client: AsyncClient, cursor: str | None = None) -> dict[str, Any]:
+    response: Response = await test_client.get('/sync', params={'since': cursor} if cursor is not None else None)
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    return response.json()
+
+def get_record_ids(changes: dict[str, Any], records_key: str) -> set[int]:
+    return {record['id'] for record in changes[records_key]}
+
+
+@mark.anyio
+async def test_sync_returns_changes_since_cursor(test_client: AsyncClient) -> None:
+    changes: dict[str, Any] = await get_changes(test_client)
+
+    assert get_record_ids(changes, 'accounts') == {1, 2, 3}
+    assert get_record_ids(changes, 'categories') == {1, 2, 3, 4}
+    assert get_record_ids(changes, 'budgets') == {1}
+    assert changes['transactions']
+    assert not changes['tombstones']
+
+    changes = await get_changes(test_client, changes['next_cursor'])
+
+    assert not any(changes[records_key] for records_key in ('accounts', 'categories', 'budgets', 'transactions', 'tombstones'))
+
+    response: Response = await test_client.post('/transaction/create', json={
+        'account_id': 1,
+        'category_id': 1,
+        'type': TransactionType.INCOME.value,
+        'due_date': '2022-12-12',
+        'due_time': '10:40:00',
+        'amount': 100,
+    })
+    created_transaction_id: int = response.json()['id']
+
+    response = await test_client.delete('/category/delete', params={'id': 4})
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response.text
+
+    response = await test_client.patch('/budget/update', params={'id': 1}, json={
+        'category_ids': [1],
+    })
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    cursor: str = changes['next_cursor']
+    changes = await get_changes(test_client, cursor)
+
+    assert get_record_ids(changes, 'transactions') == {created_transaction_id}
+    assert not changes['accounts']
+    assert get_record_ids(changes, 'categories') == {2, 3}
+    assert get_record_ids(changes, 'budgets') == {1}
+    assert changes['tombstones'] == [
+        {
+            'record_type': 'category',
+            'record_id': 4,
+        },
+    ]
+
+    response = await test_client.post('/account/batch', json={
+        'delete': [1],
+    })
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    changes = await get_changes(test_client, changes['next_cursor'])
+
+    assert not changes['transactions']
+    assert {
+        (tombstone['record_type'], tombstone['record_id'])
+        for tombstone in changes['tombstones']
+    } >= {('account', 1), ('transaction', created_transaction_id)}
+
+
+@mark.anyio
+async def test_sync_returns_changes_committed_after_cursor_again(test_client: AsyncClient) -> None:
+    changes: dict[str, Any] = await get_changes(test_client)
+
+    async with TestPostgresSession() as concurrent_session:
+        transaction_repository: TransactionRepository = TransactionRepository(session=concurrent_session)
+        transaction: Transaction = await transaction_repository.create({
+            'account_id': 2,
+            'category_id': 2,
+            'type': TransactionType.INCOME,
+            'due_date': date(2022, 12, 12),
+            'due_time': time(10, 40),
+            'amount': 100,
+            'note': '',
+        })
+
+        changes = await get_changes(test_client, changes['next_cursor'])
+
+        assert transaction.id not in get_record_ids(changes, 'transactions')
+
+        await concurrent_session.commit()
+
+    changes = await get_changes(test_client, changes['next_cursor'])
+
+    assert transaction.id in get_record_ids(changes, 'transactions')
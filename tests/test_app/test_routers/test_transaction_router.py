@@ -1,15 +1,26 @@
-from typing import Any
+from csv import DictReader
+from io import StringIO
+from json import dumps, loads
+from typing import Any, Callable
 
 from fastapi import status
 from httpx import AsyncClient, Response
-from pytest import mark, param
+from pytest import MonkeyPatch, mark, param
 
+from app.schemas.transaction import TransactionOutputData
 from core.databases.models.utilities.types import TransactionType
+from core.settings import settings
 from tests.base.router_endpoint_base_test_class import (
     RouterEndpointBaseTestClass,
 )
 
 
+async def get_balances(test_client: AsyncClient) -> dict[str, float]:
+    response: Response = await test_client.get('/account/balances')
+
+    return {account_balance['account']: account_balance['balance'] for account_balance in response.json()}
+
+
 @mark.anyio
 async def test_get_periods(test_client: AsyncClient) -> None:
     response: Response = await test_client.get('/transaction/periods')
@@ -42,6 +53,10 @@ class TestGetTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoi
         assert response.status_code == status.HTTP_200_OK, response.text
         assert isinstance(response.json(), list)
         assert response.json()
+        assert all(
+            TransactionOutputData.parse_obj(transaction).dict().keys() == transaction.keys()
+            for transaction in response.json()
+        )
 
     @mark.parametrize('test_year', (
         param(1999, id='lower'),
@@ -70,6 +85,144 @@ class TestGetTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoi
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
 
 
+class TestGetTransactionsPage(RouterEndpointBaseTestClass, http_method='GET', endpoint='/transaction/page'):
+    @mark.parametrize('test_filters', (
+        param(
+            {},
+            id='unfiltered',
+        ),
+        param(
+            {
+                'type': TransactionType.OUTCOME.value,
+            },
+            id='by_type',
+        ),
+        param(
+            {
+                'account_id': 1,
+                'min_amount': 250,
+                'first_date': '2022-12-01',
+                'last_date': '2022-12-31',
+            },
+            id='by_account_amount_and_dates',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_correct_data(
+        self,
+        test_client: AsyncClient,
+        test_filters: dict[str, Any],
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            **test_filters,
+        )
+        all_transactions: list[dict[str, Any]] = response.json()['transactions']
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()['next_cursor'] is None
+        assert all_transactions
+        assert all(
+            (transaction['due_date'], transaction['due_time'], transaction['id']) > (next_transaction['due_date'], next_transaction['due_time'], next_transaction['id'])
+            for (transaction, next_transaction) in zip(all_transactions, all_transactions[1:])
+        )
+
+        paginated_transactions: list[dict[str, Any]] = []
+        cursor: str | None = None
+
+        for _ in all_transactions:
+            response = await self.request(
+                test_client=test_client,
+                cursor=cursor,
+                limit=1,
+                **test_filters,
+            )
+            paginated_transactions.extend(response.json()['transactions'])
+            cursor = response.json()['next_cursor']
+
+        assert paginated_transactions == all_transactions
+        assert cursor is None
+
+    @mark.parametrize('test_parameters, expected_status_code', (
+        param(
+            {
+                'cursor': 'not-a-cursor',
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='wrong_cursor',
+        ),
+        param(
+            {
+                'limit': 0,
+            },
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            id='wrong_limit',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_parameters: dict[str, Any],
+        expected_status_code: int,
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            **test_parameters,
+        )
+
+        assert response.status_code == expected_status_code, response.text
+
+
+class TestExportTransactions(RouterEndpointBaseTestClass, http_method='GET', endpoint='/transaction/export'):
+    @mark.parametrize('test_format, expected_media_type, parse_export', (
+        param(
+            'ndjson',
+            'application/x-ndjson',
+            lambda export_text: [loads(line) for line in export_text.splitlines()],
+            id='ndjson',
+        ),
+        param(
+            'csv',
+            'text/csv',
+            lambda export_text: list(DictReader(StringIO(export_text))),
+            id='csv',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_correct_data(
+        self,
+        test_client: AsyncClient,
+        test_format: str,
+        expected_media_type: str,
+        parse_export: Callable[[str], list[dict[str, Any]]],
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            format=test_format,
+        )
+        exported_transactions: list[dict[str, Any]] = parse_export(response.text)
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers['content-type'].startswith(expected_media_type)
+        assert exported_transactions
+
+        response = await test_client.get('/transaction/page', params={'limit': 200})
+
+        assert [int(transaction['id']) for transaction in exported_transactions] == [
+            transaction['id'] for transaction in reversed(response.json()['transactions'])
+        ]
+
+    @mark.anyio
+    async def test_with_wrong_data(self, test_client: AsyncClient) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            format='xml',
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+
 class TestGetTransaction(RouterEndpointBaseTestClass, http_method='GET', endpoint='/transaction/item'):
     @mark.parametrize('test_id, expected_data', (
         param(
@@ -514,3 +667,257 @@ class TestDeleteTransaction(RouterEndpointBaseTestClass, http_method='DELETE', e
         )
 
         assert response.status_code == expected_status_code, response.text
+
+
+class TestImportTransactions(RouterEndpointBaseTestClass, http_method='POST', endpoint='/transaction/import'):
+    @mark.parametrize('test_content, test_content_type, expected_errors, expected_period', (
+        param(
+            '\n'.join((
+                'account_id,category_id,type,due_date,due_time,amount,note',
+                '3,1,Income,2021-03-01,09:00:00,10,Imported',
+                '3,1,Income,2021-03-02,09:00:00,-10,Imported',
+                '4,1,Income,2021-03-03,09:00:00,10,Imported',
+                '3,5,Income,2021-03-04,09:00:00,10,Imported',
+                '3,1,Income,2021-03-05,09:00:00,10,',
+                '3,1,Income,2021-03-06,09:00:00,10,Imported,',
+                '3,1,Income,2021-03-07,09:00:00,10,Imported,Extra',
+            )),
+            'text/csv; charset=utf-8',
+            [2, 3, 4, 6, 7],
+            {'year': 2021, 'month': 3},
+            id='csv',
+        ),
+        param(
+            dumps([
+                {
+                    'account_id': 3,
+                    'category_id': 1,
+                    'type': TransactionType.INCOME.value,
+                    'due_date': '2021-04-01',
+                    'due_time': '09:00:00',
+                    'amount': 10,
+                },
+                {
+                    'account_id': 3,
+                    'category_id': 1,
+                    'type': 'Gift',
+                    'due_date': '2021-04-02',
+                    'due_time': '09:00:00',
+                    'amount': 10,
+                },
+                'not-an-object',
+                [[1, 2]],
+                {
+                    'account_id': 3,
+                    'category_id': 1,
+                    'type': TransactionType.INCOME.value,
+                    'due_date': '2021-04-04',
+                    'due_time': '09:00:00',
+                    'amount': 10,
+                },
+            ]),
+            'application/json',
+            [2, 3, 4],
+            {'year': 2021, 'month': 4},
+            id='json',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_correct_data(
+        self,
+        test_client: AsyncClient,
+        test_content: str,
+        test_content_type: str,
+        expected_errors: list[int],
+        expected_period: dict[str, int],
+    ) -> None:
+        initial_balances: dict[str, float] = await get_balances(test_client)
+
+        response: Response = await test_client.post(self.endpoint, content=test_content, headers={
+            'Content-Type': test_content_type,
+        })
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.json()['imported_count'] == 2
+        assert [import_error['row'] for import_error in response.json()['errors']] == expected_errors
+        assert all(import_error['errors'] for import_error in response.json()['errors'])
+
+        balances: dict[str, float] = await get_balances(test_client)
+
+        assert balances['Account 3'] == initial_balances['Account 3'] + 20
+
+        response = await test_client.get('/transaction/periods')
+
+        assert expected_period in response.json()
+
+    @mark.parametrize('test_content, test_content_type, expected_status_code', (
+        param(
+            '{"account_id": 3}',
+            'application/json',
+            status.HTTP_400_BAD_REQUEST,
+            id='not_array',
+        ),
+        param(
+            '[{"account_id": 3',
+            'application/json',
+            status.HTTP_400_BAD_REQUEST,
+            id='broken_json',
+        ),
+        param(
+            '<transactions/>',
+            'application/xml',
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            id='unsupported_format',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_content: str,
+        test_content_type: str,
+        expected_status_code: int,
+    ) -> None:
+        response: Response = await test_client.post(self.endpoint, content=test_content, headers={
+            'Content-Type': test_content_type,
+        })
+
+        assert response.status_code == expected_status_code, response.text
+
+    @mark.parametrize('limit_key, limit', (
+        param('IMPORT_MAX_SIZE', 100, id='size'),
+        param('IMPORT_MAX_ROWS', 1, id='rows'),
+    ))
+    @mark.anyio
+    async def test_with_too_large_data(
+        self,
+        test_client: AsyncClient,
+        monkeypatch: MonkeyPatch,
+        limit_key: str,
+        limit: int,
+    ) -> None:
+        monkeypatch.setattr(settings, limit_key, limit)
+
+        response: Response = await test_client.post(self.endpoint, content='\n'.join((
+            'account_id,category_id,type,due_date,due_time,amount,note',
+            '3,1,Income,2021-03-01,09:00:00,10,Imported',
+            '3,1,Income,2021-03-02,09:00:00,10,Imported',
+        )), headers={
+            'Content-Type': 'text/csv',
+        })
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, response.text
+        assert response.json()['detail']['error_data']['limit'] == limit
+
+
+class TestBatchTransactions(RouterEndpointBaseTestClass, http_method='POST', endpoint='/transaction/batch'):
+    @mark.anyio
+    async def test_with_correct_data(self, test_client: AsyncClient) -> None:
+        initial_balances: dict[str, float] = await get_balances(test_client)
+
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data={
+                'create': [
+                    {
+                        'account_id': 2,
+                        'category_id': 2,
+                        'type': TransactionType.INCOME.value,
+                        'due_date': '2022-11-01',
+                        'due_time': '09:00:00',
+                        'amount': 100,
+                    },
+                    {
+                        'account_id': 2,
+                        'category_id': 3,
+                        'type': TransactionType.OUTCOME.value,
+                        'due_date': '2022-11-02',
+                        'due_time': '09:00:00',
+                        'amount': 30,
+                    },
+                ],
+            },
+        )
+        created_ids: list[int] = [transaction['id'] for transaction in response.json()['created']]
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert len(created_ids) == 2
+        assert all(created_ids)
+
+        response = await self.request(
+            test_client=test_client,
+            test_data={
+                'update': [
+                    {
+                        'id': created_ids[0],
+                        'amount': 50,
+                    },
+                ],
+                'delete': [created_ids[1]],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert [transaction['amount'] for transaction in response.json()['updated']] == [50]
+        assert response.json()['deleted'] == [created_ids[1]]
+
+        balances: dict[str, float] = await get_balances(test_client)
+
+        assert balances['Account 2'] == initial_balances['Account 2'] + 50
+
+    @mark.parametrize('test_data, expected_status_code', (
+        param(
+            {
+                'create': [
+                    {
+                        'account_id': 4,
+                        'category_id': 1,
+                        'type': TransactionType.INCOME.value,
+                        'due_date': '2022-11-01',
+                        'due_time': '09:00:00',
+                        'amount': 100,
+                    },
+                ],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='foreign_account_id',
+        ),
+        param(
+            {
+                'update': [
+                    {
+                        'id': 4,
+                        'amount': 100,
+                    },
+                ],
+            },
+            status.HTTP_400_BAD_REQUEST,
+            id='foreign_id',
+        ),
+        param(
+            {
+                'update': [
+                    {
+                        'id': 2,
+                        'amount': 100,
+                    },
+                ],
+                'delete': [2],
+            },
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            id='repeated_id',
+        ),
+    ))
+    @mark.anyio
+    async def test_with_wrong_data(
+        self,
+        test_client: AsyncClient,
+        test_data: dict[str, Any],
+        expected_status_code: int,
+    ) -> None:
+        response: Response = await self.request(
+            test_client=test_client,
+            test_data=test_data,
+        )
+
+        assert response.status_code == expected_status_code, response.text
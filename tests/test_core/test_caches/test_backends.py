@@ -0,0 +1,144 @@
+from asyncio import sleep
+from pathlib import Path
+
+from pytest import MonkeyPatch, mark
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.caches import PostgresBroadcaster, SQLiteCache
+from tests.mock.settings import test_settings
+
+
+NOTIFICATION_DELAY: float = 0.1
+RECONNECTION_CHECKS_NUMBER: int = 50
+
+
+async def flush_nothing() -> None:
+    pass
+
+
+@mark.anyio
+async def test_sqlite_cache_is_shared_between_workers(tmp_path: Path) -> None:
+    cache_path: Path = tmp_path / 'cache.sqlite3'
+    first_worker_cache: SQLiteCache = SQLiteCache(path=cache_path, max_size=2, time_to_live=60)
+    second_worker_cache: SQLiteCache = SQLiteCache(path=cache_path, max_size=2, time_to_live=60)
+
+    await first_worker_cache.set('first', b'first value')
+    await first_worker_cache.set('expired', b'expired value', time_to_live=0)
+
+    assert await second_worker_cache.get('first') == b'first value'
+    assert await second_worker_cache.get('expired') is None
+
+    await second_worker_cache.delete('first')
+
+    assert await first_worker_cache.get('first') is None
+    assert first_worker_cache.hit_rate == 0
+    assert second_worker_cache.hit_rate == 1 / 2
+
+    await first_worker_cache.close()
+    await second_worker_cache.close()
+
+
+@mark.anyio
+async def test_sqlite_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    sqlite_cache: SQLiteCache = SQLiteCache(path=tmp_path / 'cache.sqlite3', max_size=2, time_to_live=60, max_memory_size=250)
+
+    for key in ('first', 'second', 'third'):
+        await sqlite_cache.set(key, bytes(100))
+
+    await sqlite_cache.get('first')
+    await sqlite_cache.evict()
+
+    assert await sqlite_cache.count() == 2
+    assert await sqlite_cache.get('second') is None
+
+    await sqlite_cache.get('first')
+    await sqlite_cache.set('third', bytes(200))
+    await sqlite_cache.evict()
+
+    assert await sqlite_cache.count() == 1
+    assert await sqlite_cache.get('third') is not None
+    assert sqlite_cache.memory_size == 200
+
+    await sqlite_cache.close()
+
+
+@mark.anyio
+async def test_postgres_broadcaster_delivers_committed_keys(test_session: AsyncSession) -> None:
+    delivered_keys: list[list[str]] = []
+    first_worker_broadcaster: PostgresBroadcaster = PostgresBroadcaster(url=str(test_settings.POSTGRES_URL), channel='test_invalidation')
+    second_worker_broadcaster: PostgresBroadcaster = PostgresBroadcaster(url=str(test_settings.POSTGRES_URL), channel='test_invalidation')
+
+    async def handle_invalidation(keys: list[str]) -> None:  # noqa: WPS430
+        delivered_keys.append(keys)
+
+    await first_worker_broadcaster.subscribe('first', handle_invalidation, flush_nothing)
+    await second_worker_broadcaster.subscribe('first', handle_invalidation, flush_nothing)
+    await second_worker_broadcaster.subscribe('second', handle_invalidation, flush_nothing)
+
+    try:
+        await first_worker_broadcaster.publish(test_session, 'first', ['1', '2'])
+        await sleep(NOTIFICATION_DELAY)
+
+        assert not delivered_keys
+
+        await test_session.rollback()
+        await first_worker_broadcaster.publish(test_session, 'first', ['3'])
+        await first_worker_broadcaster.publish(test_session, 'second', ['4:5'])
+        await test_session.commit()
+        await sleep(NOTIFICATION_DELAY)
+
+        assert sorted(delivered_keys) == [['3'], ['3'], ['4:5']]
+
+        delivered_keys.clear()
+
+        await first_worker_broadcaster.publish(test_session, 'first', [str(key) for key in range(2000)])
+        await test_session.commit()
+        await sleep(NOTIFICATION_DELAY)
+
+        assert len(delivered_keys) > 2  # The keys do not fit into a single notification
+        assert sorted(key for keys in delivered_keys for key in keys) == sorted(2 * [str(key) for key in range(2000)])
+    finally:
+        await first_worker_broadcaster.close()
+        await second_worker_broadcaster.close()
+
+
+@mark.anyio
+async def test_postgres_broadcaster_reconnects_and_flushes(test_session: AsyncSession, monkeypatch: MonkeyPatch) -> None:
+    delivered_keys: list[list[str]] = []
+    flushes_number: int = 0
+    broadcaster: PostgresBroadcaster = PostgresBroadcaster(url=str(test_settings.POSTGRES_URL), channel='test_reconnection')
+
+    async def handle_invalidation(keys: list[str]) -> None:  # noqa: WPS430
+        delivered_keys.append(keys)
+
+    async def count_flush() -> None:  # noqa: WPS430
+        nonlocal flushes_number
+
+        flushes_number += 1
+
+    monkeypatch.setattr('core.caches.broadcasters.MIN_RECONNECTION_DELAY', NOTIFICATION_DELAY)
+
+    await broadcaster.subscribe('test', handle_invalidation, count_flush)
+
+    try:
+        await test_session.execute(text(
+            """SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE query = 'LISTEN "test_reconnection"'""",
+        ))
+        await test_session.commit()
+
+        for _ in range(RECONNECTION_CHECKS_NUMBER):
+            if flushes_number == 2:
+                break
+
+            await sleep(NOTIFICATION_DELAY)
+
+        assert flushes_number == 2  # Once the connection is lost & once it is back
+
+        await broadcaster.publish(test_session, 'test', ['1'])
+        await test_session.commit()
+        await sleep(NOTIFICATION_DELAY)
+
+        assert delivered_keys == [['1']]
+    finally:
+        await broadcaster.close()
@@ -0,0 +1,25 @@
+from pytest import mark
+from sqlalchemy import Result, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.databases.sessions import create_postgres_engine, warm_up_engine
+from tests.mock.settings import test_settings
+
+
+@mark.anyio
+async def test_engine_warm_up() -> None:
+    engine: AsyncEngine = create_postgres_engine(test_settings.POSTGRES_URL, test_settings)
+
+    try:
+        await warm_up_engine(engine, connections_number=test_settings.POSTGRES_POOL_SIZE)
+
+        assert engine.pool.checkedin() == test_settings.POSTGRES_POOL_SIZE  # type: ignore[attr-defined]
+
+        async with engine.connect() as connection:
+            query_result: Result[tuple[str]] = await connection.execute(text("SELECT setting FROM pg_settings WHERE name = 'statement_timeout'"))
+
+            assert query_result.scalar_one() == str(test_settings.POSTGRES_STATEMENT_TIMEOUT)
+
+        assert engine.pool.checkedin() == test_settings.POSTGRES_POOL_SIZE  # type: ignore[attr-defined]
+    finally:
+        await engine.dispose()
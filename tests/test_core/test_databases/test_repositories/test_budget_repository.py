@@ -0,0 +1,44 @@
+from typing import Any
+
+from pytest import mark
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from core.databases.models import Budget, Category
+from core.databases.repositories import BudgetRepository
+
+
+def sort_by_ids(records_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(records_data, key=lambda record_data: record_data['id'])
+
+
+@mark.anyio
+async def test_projected_budgets_match_loaded_entities(test_session: AsyncSession) -> None:
+    budget_repository: BudgetRepository = BudgetRepository(session=test_session)
+    projected_budgets: list[dict[str, Any]] = await budget_repository.get_projected_list_with_categories(
+        columns=(Budget.id, Budget.name, Budget.type),
+        category_columns=(Category.id, Category.name),
+    )
+    budgets: list[Budget] = await budget_repository.get_list(
+        loading_plan=(selectinload(Budget.categories),),
+    )
+
+    assert any(projected_budget['categories'] for projected_budget in projected_budgets)
+    assert sort_by_ids([
+        projected_budget | {'categories': sort_by_ids(projected_budget['categories'])}
+        for projected_budget in projected_budgets
+    ]) == sort_by_ids([
+        {
+            'id': budget.id,
+            'name': budget.name,
+            'type': budget.type,
+            'categories': sort_by_ids([
+                {
+                    'id': category.id,
+                    'name': category.name,
+                }
+                for category in budget.categories
+            ]),
+        }
+        for budget in budgets
+    ])
@@ -0,0 +1,135 @@
+from datetime import date, time
+from re import Match, escape, search
+from typing import Any, Awaitable, Callable
+
+from pytest import mark, param
+from sqlalchemy import Result, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.databases.models import (
+    Category,
+    Transaction,
+    TransactionMonthlyRollup,
+)
+from core.databases.models.utilities.types import TransactionType
+from core.databases.repositories import (
+    CategoryRepository,
+    TransactionRepository,
+)
+from tests.mock.utilities.callables import get_query_plan
+
+
+async def get_monthly_rollups(session: AsyncSession) -> list[tuple[Any, ...]]:
+    query_result: Result[tuple[Any, ...]] = await session.execute(
+        select(
+            TransactionMonthlyRollup.account_id,
+            TransactionMonthlyRollup.category_id,
+            TransactionMonthlyRollup.type,
+            TransactionMonthlyRollup.year,
+            TransactionMonthlyRollup.month,
+            TransactionMonthlyRollup.amount_sum,
+            TransactionMonthlyRollup.transactions_count,
+        ).where(
+            TransactionMonthlyRollup.transactions_count != 0,
+        ).order_by(
+            TransactionMonthlyRollup.account_id,
+            TransactionMonthlyRollup.category_id,
+            TransactionMonthlyRollup.type,
+            TransactionMonthlyRollup.year,
+            TransactionMonthlyRollup.month,
+        ),
+    )
+
+    return list(query_result.tuples().all())
+
+
+@mark.parametrize('repository_call, expected_index_name, expected_index_condition', (
+    param(
+        lambda transaction_repository: transaction_repository.get_user_transactions_by_month(
+            user_id=1,
+            year=2022,
+            month=12,
+        ),
+        'ix_transaction_account_id_due_date',
+        "due_date >= '2022-12-01'::date",
+        id='month_listing',
+    ),
+    param(
+        lambda transaction_repository: transaction_repository.get_user_summary(user_id=1),
+        'uq_transaction_monthly_rollup_period',
+        'account_id = account.id',
+        id='summary',
+    ),
+    param(
+        lambda transaction_repository: transaction_repository.get_user_transaction_periods(user_id=1),
+        'uq_transaction_monthly_rollup_period',
+        'account_id = account.id',
+        id='periods',
+    ),
+))
+@mark.anyio
+async def test_date_filtering_uses_index(
+    test_session: AsyncSession,
+    repository_call: Callable[[TransactionRepository], Awaitable[Any]],
+    expected_index_name: str,
+    expected_index_condition: str,
+) -> None:
+    transaction_repository: TransactionRepository = TransactionRepository(session=test_session)
+    query_plan: str = await get_query_plan(test_session, repository_call(transaction_repository))
+
+    # The index name has to be followed by a space, as it may be a prefix of the other index names
+    index_scan_match: Match[str] | None = search(
+        r'Index Scan (?:using|on) {0} .*\n\s*Index Cond: (.*)'.format(escape(expected_index_name)),
+        query_plan,
+    )
+
+    assert index_scan_match is not None, query_plan
+    assert expected_index_condition in index_scan_match.group(1), query_plan
+    assert 'date_part' not in query_plan, query_plan
+
+
+@mark.anyio
+async def test_bulk_changes_keep_monthly_rollups(test_session: AsyncSession) -> None:
+    transaction_repository: TransactionRepository = TransactionRepository(session=test_session)
+    category_repository: CategoryRepository = CategoryRepository(session=test_session)
+
+    transactions: list[Transaction] = await transaction_repository.create_many([
+        {
+            'account_id': 1 + transaction_index % 2,
+            'category_id': 1 + transaction_index % 3,
+            'type': TransactionType.OUTCOME if transaction_index % 2 else TransactionType.INCOME,
+            'due_date': date(2021, 1 + transaction_index % 12, 1),
+            'due_time': time(12),
+            'amount': 10 + transaction_index,
+            'note': '',
+        }
+        for transaction_index in range(30)
+    ])
+
+    assert all(transaction.id for transaction in transactions)
+
+    await transaction_repository.update_many(
+        records=transactions[:10],
+        records_data=[
+            {
+                'account_id': 3,
+                'amount': 1000,
+                'due_date': date(2020, 6, 1),
+            },
+        ] * 10,
+    )
+    await transaction_repository.delete_many(transactions[10:20])
+
+    category: Category | None = await category_repository.get_by_id(2)
+
+    assert category is not None
+
+    await category_repository.delete_many([category])
+
+    incremental_rollups: list[tuple[Any, ...]] = await get_monthly_rollups(test_session)
+
+    await transaction_repository.rebuild_monthly_rollups()
+
+    assert incremental_rollups == await get_monthly_rollups(test_session)
+
+    await test_session.rollback()